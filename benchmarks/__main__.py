@@ -0,0 +1,9 @@
+"""
+run the benchmark suite, see python -m benchmarks --help
+"""
+import sys
+
+from benchmarks.suite import main
+
+if __name__ == '__main__':
+    sys.exit(main())
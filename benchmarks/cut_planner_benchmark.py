@@ -0,0 +1,67 @@
+"""
+a benchmark of the molding cut planner on large order batches
+"""
+import argparse
+import random
+
+from painting.cut_planner import CutPlanner
+from painting.dataclasses.frame_size import FrameSize
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.frame_builder import FrameBuilder
+
+
+def synthetic_pieces(planner: CutPlanner, frame_count: int, seed: int = 0):
+    """ build the cut pieces for a batch of random paintings
+    :param planner: the planner to build the pieces with
+    :param frame_count: the number of frames in the batch
+    :param seed: the random seed
+    :return: a list of pieces, four per frame
+    """
+    rng = random.Random(seed)
+    pieces = []
+    for index in range(frame_count):
+        width = rng.uniform(10, 80)
+        height = rng.uniform(10, 80)
+        painting = PaintingInformation(
+            name=f"painting {index}",
+            width_min_cm=width - rng.uniform(0, 0.6),
+            width_max_cm=width,
+            height_min_cm=height - rng.uniform(0, 0.6),
+            height_max_cm=height,
+            left_offset_cm=0.5,
+            top_offset_cm=0.5,
+            right_offset_cm=0.5,
+            bottom_offset_cm=0.5
+        )
+        frame = FrameSize(width_in=rng.choice([1, 1.5, 2]), height_in=1)
+        parts = FrameBuilder(painting=painting, frame=frame).calculate_build_dimensions()
+        pieces += planner.pieces_from_parts(painting.name, parts)
+    return pieces
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark the molding cut planner")
+    parser.add_argument("--parts", type=int, default=10_000, help="the number of parts in the batch")
+    parser.add_argument("--stock-cm", type=float, default=243.84, help="the stock molding length in cm")
+    parser.add_argument("--kerf-cm", type=float, default=0.3, help="the saw kerf in cm")
+    parser.add_argument("--miter-allowance-cm", type=float, default=0.5, help="the miter allowance per part in cm")
+    parser.add_argument("--time-limit", type=float, default=2.0, help="the branch and bound time budget in seconds")
+    args = parser.parse_args()
+
+    planner = CutPlanner(
+        stock_length_cm=args.stock_cm,
+        kerf_cm=args.kerf_cm,
+        miter_allowance_cm=args.miter_allowance_cm
+    )
+    pieces = synthetic_pieces(planner, frame_count=args.parts // 4)
+
+    for label, time_limit in (("first fit decreasing", 0.0), ("branch and bound", args.time_limit)):
+        plan = planner.plan(pieces, time_limit_s=time_limit)
+        print(
+            f"{label}: {len(pieces)} parts, {plan.bar_count} bars (lower bound {plan.lower_bound}), "
+            f"waste {plan.waste_percent:.2f}%, solved in {plan.solve_seconds:.3f}s"
+        )
+
+
+if __name__ == '__main__':
+    main()
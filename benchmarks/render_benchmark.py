@@ -0,0 +1,54 @@
+"""
+a benchmark of schematic png rendering through svg and straight through cairo
+"""
+import argparse
+import io
+import statistics
+import time
+
+import cairosvg
+
+from benchmarks.synthetic_catalog import synthetic_builders
+from painting.frame_builder import FrameBuilder
+
+
+def render_through_svg(builder: FrameBuilder, dpi: int):
+    """ render a schematic the way draw_schematic does, serializing svg and parsing it again
+    :param builder: the frame builder
+    :param dpi: the resolution
+    """
+    svg = builder.build_schematic().tostring()
+    cairosvg.svg2png(bytestring=svg.encode("utf-8"), write_to=io.BytesIO(), dpi=dpi)
+
+
+def render_through_cairo(builder: FrameBuilder, dpi: int):
+    """ render a schematic straight onto a cairo surface
+    :param builder: the frame builder
+    :param dpi: the resolution
+    """
+    builder.render_png(write_to=io.BytesIO(), dpi=dpi)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark schematic png rendering")
+    parser.add_argument("--renders", type=int, default=50, help="the number of schematics to render per path")
+    parser.add_argument("--dpi", type=int, default=300, help="the png resolution")
+    args = parser.parse_args()
+
+    builders = synthetic_builders(args.renders)
+
+    for label, render in (("svg round trip", render_through_svg), ("direct cairo", render_through_cairo)):
+        latencies = []
+        for builder in builders:
+            start = time.perf_counter()
+            render(builder, args.dpi)
+            latencies.append((time.perf_counter() - start) * 1000)
+        print(
+            f"{label}: {len(latencies)} renders at {args.dpi} dpi, "
+            f"median {statistics.median(latencies):.1f} ms, mean {statistics.mean(latencies):.1f} ms, "
+            f"max {max(latencies):.1f} ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
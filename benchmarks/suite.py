@@ -0,0 +1,257 @@
+"""
+a benchmark suite over the layout, unit and rendering hot paths
+
+timings only compare on the same machine, so the baseline is recorded locally rather than kept in the repo.
+record one on a clean checkout, then compare a change against it, a non zero exit means a regression
+
+    python -m benchmarks --memory --output baseline.json
+    python -m benchmarks --memory --baseline baseline.json
+
+--skip-render leaves out the cases that rasterize, cairo is only imported by those, so the suite runs on a
+machine without the libcairo system library. record and compare with the same flags
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Tuple
+)
+
+from benchmarks.synthetic_catalog import synthetic_builders
+from painting.dataclasses.coordinate_list import CoordinateList
+from painting.enums.rounding_units import RoundingUnits
+from painting.frame_builder import FrameBuilder
+from painting.mathematics.units import in_to_tape_measure
+from painting.memory_profiling import MemoryProfiler
+from painting.profiling import stage
+
+# a case is (name, items per run, run) where run does the work once over the catalog
+Case = Tuple[str, int, Callable[[], None]]
+
+# the cases that need cairo to rasterize
+RENDER_CASES = ("draw_schematic_png",)
+
+
+def layout_boundaries(builder: FrameBuilder) -> Tuple[CoordinateList, ...]:
+    """ lay out a painting and build every boundary, the layout is lazy so nothing is built until it is read
+    :param builder: the frame builder of the painting
+    :return: the painting max, painting min, painting overlap and frame exterior boundaries
+    """
+    layout = builder.calculate_frame_layout()
+    return (
+        layout.painting_max_boundary,
+        layout.painting_min_boundary,
+        layout.painting_overlap_boundary,
+        layout.frame_exterior_boundary
+    )
+
+
+def build_cases(builders: List[FrameBuilder], render_count: int) -> List[Case]:
+    """ build the benchmark cases over a synthetic catalog
+    :param builders: the frame builders of the catalog
+    :param render_count: the number of paintings to render in the svg and png cases
+    :return: the cases
+    """
+
+    lengths_in = [
+        part.outer_length.value_in
+        for builder in builders
+        for part in builder.calculate_build_dimensions().parts
+    ]
+    boundaries = [boundary for builder in builders for boundary in layout_boundaries(builder)]
+    render_builders = builders[:render_count]
+
+    def calculate_frame_layout():
+        for builder in builders:
+            layout_boundaries(builder)
+
+    def calculate_build_dimensions():
+        for builder in builders:
+            builder.calculate_build_dimensions()
+
+    def tape_measure(round_unit: RoundingUnits):
+        def run():
+            for length_in in lengths_in:
+                in_to_tape_measure(length_in, round_unit=round_unit)
+
+        return run
+
+    def coordinate_list_bounds():
+        for boundary in boundaries:
+            (boundary.x_min, boundary.x_max, boundary.y_min, boundary.y_max)
+
+    def build_schematic_svg():
+        for builder in render_builders:
+            builder.build_schematic().tostring()
+
+    def draw_schematic_png():
+        # draw_schematic writes testd.png to the working directory, keep it out of the caller's
+        working_directory = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                for builder in render_builders:
+                    builder.draw_schematic()
+            finally:
+                os.chdir(working_directory)
+
+    cases = [
+        ("calculate_frame_layout", len(builders), calculate_frame_layout),
+        ("calculate_build_dimensions", len(builders), calculate_build_dimensions),
+    ]
+    cases += [
+        (f"in_to_tape_measure_{round_unit.name.lower()}", len(lengths_in), tape_measure(round_unit))
+        for round_unit in RoundingUnits
+    ]
+    cases += [
+        ("coordinate_list_bounds", len(boundaries), coordinate_list_bounds),
+        ("build_schematic_svg", len(render_builders), build_schematic_svg),
+        ("draw_schematic_png", len(render_builders), draw_schematic_png),
+    ]
+    return cases
+
+
+def run_case(run: Callable[[], None], items: int, repeat: int) -> Dict[str, float]:
+    """ time a case
+    :param run: the case run
+    :param items: the number of items per run
+    :param repeat: the number of timed runs
+    :return: the best and median time per item in microseconds
+    """
+    per_item_us = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        per_item_us.append((time.perf_counter() - start) / max(items, 1) * 1e6)
+    return {
+        "items": items,
+        "best_us": min(per_item_us),
+        "median_us": statistics.median(per_item_us),
+    }
+
+
+def measure_memory(builders: List[FrameBuilder], render_count: int, skip_render: bool) -> MemoryProfiler:
+    """ run the layout, parts and rendering stages over a catalog with memory profiling on
+    :param builders: the frame builders of the catalog
+    :param render_count: the number of paintings to render
+    :param skip_render: skip the stages that rasterize with cairo
+    :return: the profiler holding the stage memory
+    """
+    with MemoryProfiler() as profiler:
+        for builder in builders:
+            layout_boundaries(builder)
+            builder.calculate_build_dimensions()
+        for builder in builders[:render_count]:
+            if skip_render:
+                with stage("build_schematic") as build_stage:
+                    build_stage.add_elements(len(builder.build_schematic().elements))
+            else:
+                working_directory = os.getcwd()
+                with tempfile.TemporaryDirectory() as directory:
+                    os.chdir(directory)
+                    try:
+                        builder.draw_schematic()
+                    finally:
+                        os.chdir(working_directory)
+    return profiler
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """ find the cases slower than the baseline
+    :param results: the results of this run
+    :param baseline: the stored results to compare against
+    :param threshold: the slowdown ratio of the best time that counts as a regression
+    :return: a description of each regression
+    """
+    regressions = []
+    for name, result in results["cases"].items():
+        stored = baseline.get("cases", {}).get(name)
+        if stored is None or stored["best_us"] <= 0:
+            continue
+        ratio = result["best_us"] / stored["best_us"]
+        if ratio > threshold:
+            regressions.append(
+                f"{name}: {result['best_us']:.2f} us per item vs {stored['best_us']:.2f} us baseline ({ratio:.2f}x)"
+            )
+    for name, memory in results.get("memory", {}).get("stages", {}).items():
+        stored = baseline.get("memory", {}).get("stages", {}).get(name)
+        if stored is None or stored["peak_bytes"] <= 0:
+            continue
+        ratio = memory["peak_bytes"] / stored["peak_bytes"]
+        if ratio > threshold:
+            regressions.append(
+                f"{name}: {memory['peak_bytes']} bytes peak vs {stored['peak_bytes']} bytes baseline ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="benchmark the hot paths")
+    parser.add_argument("--catalog-size", type=int, default=1000, help="the number of paintings in the catalog")
+    parser.add_argument("--render-count", type=int, default=10, help="the number of paintings rendered per run")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of timed runs per case")
+    parser.add_argument("--seed", type=int, default=0, help="the catalog random seed")
+    parser.add_argument("--only", nargs="*", default=None, help="run only the named cases")
+    parser.add_argument("--skip-render", action="store_true", help="skip the cases that rasterize with cairo")
+    parser.add_argument("--memory", action="store_true", help="also report the memory and objects of each stage")
+    parser.add_argument("--output", default=None, help="write the json results to this file, - for stdout")
+    parser.add_argument("--baseline", default=None, help="compare against the json results in this file")
+    parser.add_argument("--threshold", type=float, default=1.25, help="the slowdown ratio flagged as a regression")
+    args = parser.parse_args(argv)
+
+    builders = synthetic_builders(args.catalog_size, seed=args.seed)
+    cases = build_cases(builders, render_count=min(args.render_count, args.catalog_size))
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "catalog_size": args.catalog_size,
+            "render_count": args.render_count,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "cases": {},
+    }
+    for name, items, run in cases:
+        if args.only is not None and name not in args.only:
+            continue
+        if args.skip_render and name in RENDER_CASES:
+            continue
+        results["cases"][name] = run_case(run, items, args.repeat)
+        print(
+            f"{name:<36} {results['cases'][name]['best_us']:>12.2f} us/item best "
+            f"{results['cases'][name]['median_us']:>12.2f} us/item median",
+            file=sys.stderr
+        )
+
+    if args.memory:
+        profiler = measure_memory(
+            builders,
+            render_count=min(args.render_count, args.catalog_size),
+            skip_render=args.skip_render
+        )
+        results["memory"] = profiler.report()
+        print(profiler.memory_summary(), file=sys.stderr)
+
+    if args.output == "-":
+        print(json.dumps(results, indent=2))
+    elif args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.threshold)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
@@ -0,0 +1,34 @@
+"""
+a random catalog of paintings for the benchmarks
+"""
+import random
+
+from painting.dataclasses.frame_size import FrameSize
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.frame_builder import FrameBuilder
+
+
+def synthetic_builders(count: int, seed: int = 0):
+    """ build frame builders for random paintings
+    :param count: the number of paintings
+    :param seed: the random seed
+    :return: a list of frame builders
+    """
+    rng = random.Random(seed)
+    builders = []
+    for index in range(count):
+        width = rng.uniform(10, 80)
+        height = rng.uniform(10, 80)
+        painting = PaintingInformation(
+            name=f"painting {index}",
+            width_min_cm=width - rng.uniform(0, 0.6),
+            width_max_cm=width,
+            height_min_cm=height - rng.uniform(0, 0.6),
+            height_max_cm=height,
+            left_offset_cm=0.5,
+            top_offset_cm=0.5,
+            right_offset_cm=0.5,
+            bottom_offset_cm=0.5
+        )
+        builders.append(FrameBuilder(painting=painting, frame=FrameSize(width_in=rng.choice([1, 1.5, 2]), height_in=1)))
+    return builders
@@ -0,0 +1,234 @@
+"""
+a class to draw schematic elements straight onto a cairo surface
+"""
+import abc
+import math
+import sys
+from typing import (
+    List,
+    Optional,
+    Sequence,
+    Tuple
+)
+
+import cairocffi
+from cairosvg.colors import color
+
+from painting.dataclasses.schematic_view import SchematicView
+
+
+class _CairoElement(abc.ABC):
+    def __init__(self):
+        # the transforms in svg list order, cairo applies them in the same order
+        self.transforms: List[Tuple[str, Tuple[float, ...]]] = []
+
+    def scale(self, sx: float, sy: Optional[float] = None):
+        """ add a scale to the element transform
+        :param sx: the x scale
+        :param sy: the y scale, defaults to the x scale
+        """
+        self.transforms.append(("scale", (sx, sx if sy is None else sy)))
+
+    def translate(self, tx: float, ty: Optional[float] = None):
+        """ add a translation to the element transform
+        :param tx: the x translation
+        :param ty: the y translation
+        """
+        self.transforms.append(("translate", (tx, 0 if ty is None else ty)))
+
+    def rotate(self, angle: float):
+        """ add a rotation to the element transform
+        :param angle: the rotation in degrees
+        """
+        self.transforms.append(("rotate", (math.radians(angle),)))
+
+    def _apply_transforms(self, context: cairocffi.Context):
+        """ apply the element transform to the context
+        :param context: the cairo context
+        """
+        for name, values in self.transforms:
+            getattr(context, name)(*values)
+
+    @abc.abstractmethod
+    def draw(self, canvas: "CairoCanvas"):
+        """ draw the element
+        :param canvas: the canvas to draw on
+        """
+
+
+class _CairoShape(_CairoElement):
+    def __init__(self, points: Sequence[Tuple[float, float]], closed: bool, fill: Optional[str], stroke: Optional[str],
+                 stroke_width: float):
+        super().__init__()
+        self.points = points
+        self.closed = closed
+        self.fill = fill
+        self.stroke = stroke
+        self.stroke_width = stroke_width
+
+    def draw(self, canvas: "CairoCanvas"):
+        """ draw the element
+        :param canvas: the canvas to draw on
+        """
+        context = canvas.context
+        context.save()
+        self._apply_transforms(context)
+
+        context.move_to(*self.points[0])
+        for point in self.points[1:]:
+            context.line_to(*point)
+        if self.closed:
+            context.close_path()
+
+        if self.fill not in (None, 'none'):
+            context.set_source_rgba(*color(self.fill))
+            context.fill_preserve()
+        if self.stroke not in (None, 'none'):
+            context.set_source_rgba(*color(self.stroke))
+            context.set_line_width(self.stroke_width)
+            context.stroke()
+        context.new_path()
+        context.restore()
+
+
+class _CairoText(_CairoElement):
+    def __init__(self, text, insert: Tuple[float, float], font_size: str, text_anchor: str, fill: str):
+        super().__init__()
+        self.text = str(text)
+        self.insert = insert
+        self.font_size = font_size
+        self.text_anchor = text_anchor
+        self.fill = fill
+
+    def draw(self, canvas: "CairoCanvas"):
+        """ draw the element
+        :param canvas: the canvas to draw on
+        """
+        context = canvas.context
+        context.save()
+        self._apply_transforms(context)
+
+        context.select_font_face('sans-serif', cairocffi.FONT_SLANT_NORMAL, cairocffi.FONT_WEIGHT_NORMAL)
+        context.set_font_size(canvas.font_size(self.font_size))
+
+        # anchor on the ink extents, as cairosvg does
+        x_bearing, _, width, _ = context.text_extents(self.text)[:4]
+        if self.text_anchor == 'middle':
+            x_align = - (width / 2 + x_bearing)
+        elif self.text_anchor == 'end':
+            x_align = - (width + x_bearing)
+        else:
+            x_align = 0
+
+        context.set_source_rgba(*color(self.fill))
+        context.move_to(self.insert[0] + x_align, self.insert[1])
+        context.show_text(self.text)
+        context.new_path()
+        context.restore()
+
+
+class CairoCanvas(object):
+    def __init__(self, context: cairocffi.Context, width: float, height: float, view: SchematicView):
+        """
+        the context is set up to place the view the way cairosvg places a schematic svg, centred and scaled
+        to fit the page with our y up coordinate space flipped, so the schematic drawing helpers can draw
+        on it directly
+
+        :param context: the cairo context of the page
+        :param width: the page width in device units
+        :param height: the page height in device units
+        :param view: the view of the schematic
+        """
+        self.context = context
+
+        view_box_width = view.x_max_pad_in
+        view_box_height = view.y_max_pad_in
+        scale = min(width / view_box_width, height / view_box_height)
+
+        # percent lengths resolve against the diagonal of the viewport in user units
+        self._percent_reference = math.hypot(width / scale, height / scale) / 2 ** .5
+
+        context.rectangle(0, 0, width, height)
+        context.clip()
+        context.scale(scale, scale)
+        context.translate(
+            (width / scale - view_box_width) / 2 - view.x_min_pad_in,
+            (height / scale - view_box_height) / 2 - view.y_min_pad_in
+        )
+
+        # our coordinate space is upside down vs svg standard, so do a y-axis flip and transform
+        context.scale(1, -1)
+        context.translate(0, -(view.y_max_pad_in - view.offset_in * 2))
+
+    def font_size(self, font_size: str) -> float:
+        """ resolve a font size in user units
+        :param font_size: the font size, a number or a percent
+        :return: the font size in user units
+        """
+        if font_size.endswith('%'):
+            return float(font_size[:-1]) * self._percent_reference / 100
+        return float(font_size)
+
+    def line(self, start: Tuple[float, float], end: Tuple[float, float], stroke: str = None,
+             stroke_width: float = 1):
+        """ make a line element
+        :param start: the start point
+        :param end: the end point
+        :param stroke: the stroke color
+        :param stroke_width: the stroke width
+        :return: the line element
+        """
+        return _CairoShape([start, end], closed=False, fill=None, stroke=stroke, stroke_width=stroke_width)
+
+    def polygon(self, points: Sequence[Tuple[float, float]], fill: str = 'black', stroke: str = None,
+                stroke_width: float = 1):
+        """ make a polygon element
+        :param points: the polygon points
+        :param fill: the fill color
+        :param stroke: the stroke color
+        :param stroke_width: the stroke width
+        :return: the polygon element
+        """
+        return _CairoShape(list(points), closed=True, fill=fill, stroke=stroke, stroke_width=stroke_width)
+
+    def text(self, text: str, insert: Tuple[float, float] = (0, 0), font_size: str = "12",
+             text_anchor: str = 'start', fill: str = 'black'):
+        """ make a text element
+        :param text: the text
+        :param insert: the anchor point
+        :param font_size: the font size, a number or a percent
+        :param text_anchor: the text anchor, start, middle or end
+        :param fill: the text color
+        :return: the text element
+        """
+        return _CairoText(text, insert, font_size=font_size, text_anchor=text_anchor, fill=fill)
+
+    def add(self, element: _CairoElement) -> _CairoElement:
+        """ draw an element onto the surface
+        :param element: the element to draw
+        :return: the element
+        """
+        element.draw(self)
+        return element
+
+
+def rgb24_to_rgb(data, width: int, rows: int, stride: int) -> bytes:
+    """ convert the rows of a cairo rgb24 surface to packed 8 bit rgb
+    :param data: the surface data
+    :param width: the surface width in pixels
+    :param rows: the number of rows to convert
+    :param stride: the surface stride in bytes
+    :return: the packed rgb rows
+    """
+
+    pixels = bytearray()
+    for row in range(rows):
+        pixels += bytes(data[row * stride:row * stride + width * 4])
+
+    # pixels are native endian 32 bit words with the unused byte high, so b g r x in memory on little endian
+    red, green, blue = (2, 1, 0) if sys.byteorder == 'little' else (1, 2, 3)
+    rgb = bytearray(width * rows * 3)
+    rgb[0::3] = pixels[red::4]
+    rgb[1::3] = pixels[green::4]
+    rgb[2::3] = pixels[blue::4]
+    return bytes(rgb)
@@ -0,0 +1,316 @@
+"""
+a class to keep the schematics of a catalog up to date as the catalog files are edited
+"""
+import csv
+import dataclasses
+import json
+import os
+import re
+import time
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple
+)
+
+import cairocffi
+
+from painting.dataclasses.catalog_changes import CatalogChanges
+from painting.dataclasses.frame_size import FrameSize
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.dataclasses.paper_dimensions import PaperDimensions
+from painting.enums.text_unit_mode import TextUnitMode
+from painting.frame_builder import FrameBuilder
+from painting.mathematics.validation import PAINTING_COLUMNS
+
+# a catalog record, the painting and the frame it is built with
+CatalogRecord = Tuple[PaintingInformation, FrameSize]
+
+# the frame of a record without frame columns, the FrameBuilder default
+DEFAULT_FRAME = FrameSize(width_in=2, height_in=1)
+
+# the outputs written per painting, removed together when the painting goes
+OUTPUT_EXTENSIONS = (".svg", ".png", ".json")
+
+
+def _record(row: Dict) -> CatalogRecord:
+    """ read a catalog record from a row
+    :param row: the row, keyed by PaintingInformation field, with optional frame_width_in and frame_height_in
+    :return: the painting and its frame
+    """
+    painting = PaintingInformation(name=str(row["name"]), **{column: float(row[column]) for column in PAINTING_COLUMNS})
+    frame = FrameSize(
+        width_in=float(row.get("frame_width_in") or DEFAULT_FRAME.width_in),
+        height_in=float(row.get("frame_height_in") or DEFAULT_FRAME.height_in)
+    )
+    return painting, frame
+
+
+def read_catalog(path: str) -> Dict[str, CatalogRecord]:
+    """ read a catalog file, a json list of records or a csv file with a header row
+    :param path: the catalog file path
+    :return: the records by painting name
+    """
+
+    with open(path, newline='', encoding='utf-8') as catalog_file:
+        if path.lower().endswith(".json"):
+            rows = json.load(catalog_file)
+        else:
+            rows = list(csv.DictReader(catalog_file))
+
+    records = {}
+    for row in rows:
+        painting, frame = _record(row)
+        if painting.name in records:
+            raise ValueError(f"painting {painting.name!r} is in {path} more than once")
+        records[painting.name] = (painting, frame)
+    return records
+
+
+def _write_atomic(path: str, write: Callable[[str], None]):
+    """ write a file through a temporary file in the same directory, so readers only ever see a whole file
+    :param path: the file path
+    :param write: creates the file at the path it is given and writes the content
+    """
+    # made by the writer rather than mkstemp, so the file gets the usual permissions
+    directory, file_name = os.path.split(path)
+    temporary = os.path.join(directory, f".{file_name}.{os.getpid()}.tmp")
+    try:
+        write(temporary)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+
+
+class CatalogWatcher(object):
+    def __init__(
+            self,
+            paths: Sequence[str],
+            write_to: str = "{name}",
+            paper_size: PaperDimensions = PaperDimensions(8, 10),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM,
+            dpi: int = 300
+    ):
+        """
+        each poll only re-reads the catalog files whose modification time or size changed, and only the
+        paintings whose painting or frame differ from the last snapshot are validated and rendered again, so
+        the work of a poll follows the number of edits rather than the size of the catalog. every output is
+        written to a temporary file and moved into place, so a reader never sees a half written file. a
+        painting whose outputs could not be written is tried again on the next poll
+
+        :param paths: the catalog files, a painting name may only be in one of them
+        :param write_to: the output path without extension, formatted with the painting name made file safe, two
+            names that are alike once made file safe are reported as an error like a painting in two files
+        :param paper_size: the size of the paper to draw on
+        :param text_unit_mode: the unit mode to use for text
+        :param dpi: the resolution of the png files
+        """
+        self.paths = list(paths)
+        self.write_to = write_to
+        self.paper_size = paper_size
+        self.text_unit_mode = text_unit_mode
+        self.dpi = dpi
+
+        # the (modification time, size) of each file when it was last read, None for a missing file
+        self._stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._files: Dict[str, Dict[str, CatalogRecord]] = {}
+        # the painting name behind each output path of each file, to catch names that are only file safe alike
+        self._outputs: Dict[str, Dict[str, str]] = {}
+        # the records whose outputs are up to date
+        self.records: Dict[str, CatalogRecord] = {}
+        # the paintings whose outputs could not be written, tried again on the next poll
+        self._retry: Set[str] = set()
+
+    def output_path(self, name: str) -> str:
+        """ get the output path of a painting
+        :param name: the painting name
+        :return: the output path without extension
+        """
+        return self.write_to.format(name=re.sub(r"[^\w.-]+", "_", name))
+
+    def _lookup(self, name: str) -> Optional[CatalogRecord]:
+        """ find a painting in the current file snapshots
+        :param name: the painting name
+        :return: the record from the file that has it, None if no file does
+        """
+        for path in self.paths:
+            record = self._files.get(path, {}).get(name)
+            if record is not None:
+                return record
+        return None
+
+    def _check_unique(self, path: str, records: Dict[str, CatalogRecord]) -> Dict[str, str]:
+        """ check no painting of a catalog file is in another catalog file, and no two paintings share outputs
+        :param path: the catalog file path
+        :param records: the records read from the file
+        :return: the painting name by output path of the file
+        """
+        outputs = {}
+        for name in records:
+            output = self.output_path(name)
+            if output in outputs:
+                raise ValueError(f"paintings {outputs[output]!r} and {name!r} in {path} both write to {output}")
+            outputs[output] = name
+
+        for other_path in self.paths:
+            if other_path == path:
+                continue
+            for name in records.keys() & self._files.get(other_path, {}).keys():
+                raise ValueError(f"painting {name!r} is in {path} and in {other_path}")
+            other_outputs = self._outputs.get(other_path, {})
+            for output in outputs.keys() & other_outputs.keys():
+                raise ValueError(
+                    f"painting {outputs[output]!r} in {path} and painting {other_outputs[output]!r} in {other_path} "
+                    f"both write to {output}"
+                )
+        return outputs
+
+    def _read_changed_files(self, changes: CatalogChanges) -> Set[str]:
+        """ re-read the catalog files that changed since the last poll
+        :param changes: the changes of this poll, read errors are added to it
+        :return: the names in the old or new records of the re-read files
+        """
+        names = set()
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+                stamp = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                stamp = None
+            if path in self._stamps and self._stamps[path] == stamp:
+                continue
+
+            try:
+                records = {} if stamp is None else read_catalog(path)
+                outputs = self._check_unique(path, records)
+            except (OSError, ValueError, KeyError, TypeError) as error:
+                # the file may be half saved or clash with another, keep the old snapshot and try again next poll
+                changes.errors[path] = str(error)
+                continue
+
+            names.update(self._files.get(path, {}))
+            names.update(records)
+            self._files[path] = records
+            self._outputs[path] = outputs
+            self._stamps[path] = stamp
+        return names
+
+    def _remove_outputs(self, name: str):
+        """ delete the outputs of a painting
+        :param name: the painting name
+        """
+        for extension in OUTPUT_EXTENSIONS:
+            path = self.output_path(name) + extension
+            if os.path.exists(path):
+                os.unlink(path)
+
+    def _render(self, builder: FrameBuilder):
+        """ write the build dimensions and the schematic svg and png of a painting
+        :param builder: the frame builder of the painting
+        """
+        path = self.output_path(builder.painting.name)
+        parts = dataclasses.asdict(builder.calculate_build_dimensions())
+        svg = builder.build_schematic(paper_size=self.paper_size, text_unit_mode=self.text_unit_mode).tostring()
+
+        def write_parts(temporary: str):
+            with open(temporary, 'w', encoding='utf-8') as parts_file:
+                json.dump(parts, parts_file, indent=2)
+
+        def write_svg(temporary: str):
+            with open(temporary, 'w', encoding='utf-8') as svg_file:
+                svg_file.write(svg)
+
+        _write_atomic(path + ".json", write_parts)
+        _write_atomic(path + ".svg", write_svg)
+        _write_atomic(
+            path + ".png",
+            lambda temporary: builder.render_png(
+                write_to=temporary,
+                paper_size=self.paper_size,
+                text_unit_mode=self.text_unit_mode,
+                dpi=self.dpi
+            )
+        )
+
+    def _bring_up_to_date(self, name: str, changes: CatalogChanges, update: Callable[..., None], *args) -> bool:
+        """ write or remove the outputs of a painting, a failure leaves its record as it was to try again
+        :param name: the painting name
+        :param changes: the changes of this poll, the error is added to it on a failure
+        :param update: writes or removes the outputs
+        :param args: the arguments of the update
+        :return: True if the outputs are up to date
+        """
+        try:
+            update(*args)
+        except (OSError, cairocffi.CairoError) as error:
+            changes.errors[name] = str(error)
+            self._retry.add(name)
+            return False
+        return True
+
+    def poll(self) -> CatalogChanges:
+        """ pick up the catalog edits since the last poll and bring the outputs up to date
+        :return: what changed, the first poll adds the whole catalog
+        """
+
+        changes = CatalogChanges()
+        retry, self._retry = self._retry, set()
+        to_render: List[FrameBuilder] = []
+
+        for name in sorted(self._read_changed_files(changes) | retry):
+            old = self.records.get(name)
+            new = self._lookup(name)
+            # a failed update may have left some outputs written, so a retry goes ahead even with no edit
+            if old == new and name not in retry:
+                continue
+            if new is None:
+                if self._bring_up_to_date(name, changes, self._remove_outputs, name) and old is not None:
+                    del self.records[name]
+                    changes.removed.append(name)
+                continue
+            to_render.append(FrameBuilder(painting=new[0], frame=new[1]))
+
+        # screen the edits before spending any rendering on them
+        validation = FrameBuilder.validate_batch(to_render)
+        for row, builder in enumerate(to_render):
+            name = builder.painting.name
+            failures = validation.failures(row)
+            if failures:
+                up_to_date = self._bring_up_to_date(name, changes, self._remove_outputs, name)
+            else:
+                up_to_date = self._bring_up_to_date(name, changes, self._render, builder)
+            if not up_to_date:
+                continue
+
+            if failures:
+                changes.invalid[name] = failures
+            else:
+                (changes.changed if name in self.records else changes.added).append(name)
+            self.records[name] = (builder.painting, builder.frame)
+
+        return changes
+
+    def watch(
+            self,
+            interval_s: float = 1.0,
+            callback: Optional[Callable[[CatalogChanges], None]] = None,
+            polls: Optional[int] = None
+    ):
+        """ poll the catalog files until interrupted
+        :param interval_s: the time between polls in seconds
+        :param callback: called with the changes of every poll that found any
+        :param polls: stop after this many polls, None to run until interrupted
+        """
+        count = 0
+        while polls is None or count < polls:
+            changes = self.poll()
+            if callback is not None and not changes.empty:
+                callback(changes)
+            count += 1
+            if polls is None or count < polls:
+                time.sleep(interval_s)
@@ -0,0 +1,93 @@
+"""
+a class to plan the cutting of frame parts from stock molding
+"""
+import math
+import time
+from typing import List
+
+from painting.dataclasses.cut_piece import CutPiece
+from painting.dataclasses.cut_plan import CutPlan
+from painting.dataclasses.frame_part_list import FramePartList
+from painting.dataclasses.stock_bar import StockBar
+from painting.enums.frame_index import FrameIndex
+from painting.mathematics.bin_packing import (
+    bin_lower_bound,
+    first_fit_decreasing,
+    refine_packing
+)
+
+# lengths are packed as whole micrometres so the packing compares exact integers
+_UNITS_PER_CM = 10_000
+
+
+class CutPlanner(object):
+    def __init__(
+            self,
+            stock_length_cm: float,
+            kerf_cm: float = 0.3,
+            miter_allowance_cm: float = 0.0
+    ):
+        """
+        :param stock_length_cm: the length of the stock molding in cm
+        :param kerf_cm: the width of material removed by each saw cut in cm
+        :param miter_allowance_cm: the extra length added to each part for trimming its miters in cm
+        """
+        self.stock_length_cm = stock_length_cm
+        self.kerf_cm = kerf_cm
+        self.miter_allowance_cm = miter_allowance_cm
+
+    def pieces_from_parts(self, name: str, parts: FramePartList) -> List[CutPiece]:
+        """ get the pieces to cut for the parts of one frame
+        :param name: the name of the painting the frame is for
+        :param parts: the frame parts from calculate_build_dimensions
+        :return: a list of pieces, one per frame part
+        """
+        return [
+            CutPiece(
+                label=f"{name} {FrameIndex(index).name.lower()}",
+                length_cm=part.outer_length.value_cm + self.miter_allowance_cm
+            )
+            for index, part in enumerate(parts.parts)
+        ]
+
+    def plan(self, pieces: List[CutPiece], time_limit_s: float = 0.0) -> CutPlan:
+        """ plan the cuts for a batch of pieces
+
+        the pieces are packed with first fit decreasing, then optionally refined with a time bounded
+        branch and bound. each piece consumes its length plus one kerf, the last cut on a bar may run
+        off its end so a bar holds its length plus one kerf
+
+        :param pieces: the pieces to cut
+        :param time_limit_s: the time budget for the branch and bound refinement, zero to skip it
+        :return: the cut plan
+        """
+
+        start = time.perf_counter()
+
+        capacity = math.floor((self.stock_length_cm + self.kerf_cm) * _UNITS_PER_CM)
+        sizes = [math.ceil((piece.length_cm + self.kerf_cm) * _UNITS_PER_CM) for piece in pieces]
+
+        for piece, size in zip(pieces, sizes):
+            if size > capacity:
+                raise ValueError(
+                    f"piece {piece.label} of {piece.length_cm} cm is longer than the {self.stock_length_cm} cm stock"
+                )
+
+        bins = first_fit_decreasing(sizes, capacity)
+        if time_limit_s > 0:
+            bins = refine_packing(bins, sizes, capacity, time_limit_s)
+
+        bars = [
+            StockBar(
+                length_cm=self.stock_length_cm,
+                kerf_cm=self.kerf_cm,
+                pieces=[pieces[index] for index in sorted(b, key=lambda i: sizes[i], reverse=True)]
+            )
+            for b in bins
+        ]
+
+        return CutPlan(
+            bars=bars,
+            lower_bound=bin_lower_bound(sizes, capacity),
+            solve_seconds=time.perf_counter() - start
+        )
@@ -0,0 +1,48 @@
+"""
+a class to hold the frames chosen for a shipment of paintings
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+from painting.dataclasses.frame_assignment import FrameAssignment
+from painting.enums.assignment_method import AssignmentMethod
+
+
+@dataclass
+class AssignmentResult:
+    """
+    A class to hold the frames chosen for a shipment of paintings
+    Attributes:
+        assignments: the frame chosen per painting, in shipment order
+        lower_bound_cm: a lower bound on the total waste of any assignment in cm
+        solve_seconds: the time taken to find the assignment in seconds
+        method: the algorithm used
+    """
+    assignments: List[FrameAssignment]
+    lower_bound_cm: float
+    solve_seconds: float
+    method: AssignmentMethod
+
+    @property
+    def total_cost_cm(self) -> float:
+        """ get the total waste of the assignment
+        :return: the total waste in cm
+        """
+        return sum(assignment.cost_cm for assignment in self.assignments)
+
+    @property
+    def stocked_count(self) -> int:
+        """ get the number of paintings given a stocked frame
+        :return: the number of paintings
+        """
+        return sum(1 for assignment in self.assignments if assignment.frame is not None)
+
+    @property
+    def gap_percent(self) -> float:
+        """ get how far the total waste is above the lower bound
+        :return: the gap as a percentage of the lower bound
+        """
+        if self.lower_bound_cm <= 0:
+            return 0.0
+        return (self.total_cost_cm - self.lower_bound_cm) / self.lower_bound_cm * 100
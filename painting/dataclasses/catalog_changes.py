@@ -0,0 +1,39 @@
+"""
+a class to hold what changed in a watched catalog since the last poll
+"""
+
+from dataclasses import (
+    dataclass,
+    field
+)
+from typing import (
+    Dict,
+    List
+)
+
+
+@dataclass
+class CatalogChanges:
+    """
+    A class to hold what changed in a watched catalog since the last poll
+    Attributes:
+        added: the names of the valid paintings new to the catalog, rendered
+        changed: the names of the valid paintings whose painting or frame changed, rendered again
+        removed: the names of the paintings gone from the catalog, their outputs deleted
+        invalid: the reasons each new or edited painting failed validation, its outputs deleted rather than
+            rendered, not in added or changed
+        errors: the error of each catalog file that could not be read and each painting whose outputs could
+            not be written, keyed by file path or painting name, retried on the next poll
+    """
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    invalid: Dict[str, List[str]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def empty(self) -> bool:
+        """ check whether the poll found nothing to do
+        :return: True if nothing changed
+        """
+        return not (self.added or self.changed or self.removed or self.invalid or self.errors)
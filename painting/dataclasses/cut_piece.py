@@ -0,0 +1,17 @@
+"""
+a piece of molding to be cut from stock
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class CutPiece:
+    """
+    a piece of molding to be cut from stock
+    Attributes:
+        label: a label to identify the piece, such as the painting name and frame side
+        length_cm: the length of the piece in cm, including any miter allowance
+    """
+    label: str
+    length_cm: float
@@ -0,0 +1,59 @@
+"""
+a plan of the cuts to make from stock molding
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+from painting.dataclasses.stock_bar import StockBar
+
+
+@dataclass
+class CutPlan:
+    """
+    a plan of the cuts to make from stock molding
+    Attributes:
+        bars: the stock bars used and the pieces cut from each
+        lower_bound: the least number of bars any plan could use
+        solve_seconds: the time taken to find the plan in seconds
+    """
+    bars: List[StockBar]
+    lower_bound: int
+    solve_seconds: float
+
+    @property
+    def bar_count(self) -> int:
+        """ get the number of stock bars used
+        :return: the number of stock bars
+        """
+        return len(self.bars)
+
+    @property
+    def is_optimal(self) -> bool:
+        """ check if the plan is known to use the fewest possible bars
+        :return: True if the plan meets the lower bound
+        """
+        return self.bar_count == self.lower_bound
+
+    @property
+    def stock_cm(self) -> float:
+        """ get the total length of stock used
+        :return: the total stock length in cm
+        """
+        return sum(bar.length_cm for bar in self.bars)
+
+    @property
+    def waste_cm(self) -> float:
+        """ get the total length of offcuts
+        :return: the total offcut length in cm
+        """
+        return sum(bar.offcut_cm for bar in self.bars)
+
+    @property
+    def waste_percent(self) -> float:
+        """ get the offcuts as a percentage of the stock used
+        :return: the waste percentage
+        """
+        if not self.bars:
+            return 0.0
+        return self.waste_cm / self.stock_cm * 100
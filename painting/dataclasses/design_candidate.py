@@ -0,0 +1,31 @@
+"""
+a class to hold a frame design that meets the search constraints
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class DesignCandidate:
+    """
+    A class to hold a frame design that meets the search constraints
+    Attributes:
+        frame_width_in: the width of the frame wood in inches
+        left_offset_cm: the left offset of the painting in cm
+        top_offset_cm: the top offset of the painting in cm
+        right_offset_cm: the right offset of the painting in cm
+        bottom_offset_cm: the bottom offset of the painting in cm
+        exterior_width_cm: the exterior width of the frame in cm
+        exterior_height_cm: the exterior height of the frame in cm
+        aspect_ratio: the width over height ratio of the visible area
+        score: the normalised distance from the targets, lower is closer
+    """
+    frame_width_in: float
+    left_offset_cm: float
+    top_offset_cm: float
+    right_offset_cm: float
+    bottom_offset_cm: float
+    exterior_width_cm: float
+    exterior_height_cm: float
+    aspect_ratio: float
+    score: float
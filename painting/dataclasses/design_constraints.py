@@ -0,0 +1,26 @@
+"""
+a class to hold the constraints of a frame design search
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class DesignConstraints:
+    """
+    A class to hold the constraints of a frame design search
+    Attributes:
+        exterior_width_cm: the target exterior width of the frame in cm, None for any width
+        exterior_height_cm: the target exterior height of the frame in cm, None for any height
+        exterior_tolerance_cm: the allowed distance from the target exterior size in cm
+        aspect_ratio: the target width over height ratio of the visible area, None for any ratio
+        aspect_tolerance: the allowed distance from the target aspect ratio
+        min_coverage_cm: the least coverage of the minimum painting on every side in cm
+    """
+    exterior_width_cm: Optional[float] = None
+    exterior_height_cm: Optional[float] = None
+    exterior_tolerance_cm: float = 0.5
+    aspect_ratio: Optional[float] = None
+    aspect_tolerance: float = 0.01
+    min_coverage_cm: float = 0.0
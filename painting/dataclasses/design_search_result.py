@@ -0,0 +1,24 @@
+"""
+a class to hold the result of a frame design search
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+from painting.dataclasses.design_candidate import DesignCandidate
+
+
+@dataclass
+class DesignSearchResult:
+    """
+    A class to hold the result of a frame design search
+    Attributes:
+        evaluated_count: the number of designs in the search space
+        match_count: the number of designs meeting the constraints
+        best: the closest designs to the targets, best first
+        solve_seconds: the time taken by the search in seconds
+    """
+    evaluated_count: int
+    match_count: int
+    best: List[DesignCandidate]
+    solve_seconds: float
@@ -0,0 +1,33 @@
+"""
+a data class to hold the formatted text of every dimension drawn on a schematic
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class DimensionText:
+    """
+    A data class to hold the formatted text of every dimension drawn on a schematic
+    Attributes:
+        bottom_outer: the outer length of the bottom part
+        right_outer: the outer length of the right part
+        bottom_inlay: the inlay width of the bottom part
+        right_inlay: the inlay width of the right part
+        top_inlay: the inlay width of the top part
+        left_inlay: the inlay width of the left part
+        painting_max_width: the width of the maximum painting boundary
+        painting_max_height: the height of the maximum painting boundary
+        interior_width: the width of the frame interior
+        interior_height: the height of the frame interior
+    """
+    bottom_outer: str
+    right_outer: str
+    bottom_inlay: str
+    right_inlay: str
+    top_inlay: str
+    left_inlay: str
+    painting_max_width: str
+    painting_max_height: str
+    interior_width: str
+    interior_height: str
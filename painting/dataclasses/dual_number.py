@@ -0,0 +1,117 @@
+"""
+a class to hold a value and its partial derivatives
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import (
+    Tuple,
+    Union
+)
+
+import numpy
+
+
+@dataclass
+class DualNumber:
+    """
+    A class to hold a value and its partial derivatives, used for forward mode differentiation
+    the value and partials may be numpy columns, which differentiates a whole batch in one pass
+    Attributes:
+        value: the value, or a column of values
+        partials: the partial derivatives of the value with respect to each input, each a number or a column
+    """
+    value: float
+    partials: Tuple[float, ...]
+
+    @staticmethod
+    def variable(value: float, index: int, count: int) -> DualNumber:
+        """
+        Get an input variable, its partial derivative is one with respect to itself and zero otherwise
+        :param value: the value of the variable
+        :param index: the index of the variable in the inputs
+        :param count: the number of inputs
+        :return: the dual number
+        """
+        return DualNumber(value, tuple(1.0 if i == index else 0.0 for i in range(count)))
+
+    def _coerce(self, other: Union[DualNumber, float]) -> DualNumber:
+        """
+        Get a dual number from a value, a plain number becomes a constant
+        :param other: a dual number or a number
+        :return: the dual number
+        """
+        if isinstance(other, DualNumber):
+            return other
+        return DualNumber(other, (0.0,) * len(self.partials))
+
+    def __add__(self, other: Union[DualNumber, float]) -> DualNumber:
+        """
+        Add a dual number or a number to this dual number
+        :param other: the dual number or number to add
+        :return:
+        """
+        other = self._coerce(other)
+        return DualNumber(
+            self.value + other.value,
+            tuple(a + b for a, b in zip(self.partials, other.partials))
+        )
+
+    __radd__ = __add__
+
+    def __neg__(self) -> DualNumber:
+        """
+        Negate this dual number
+        :return:
+        """
+        return DualNumber(-self.value, tuple(-a for a in self.partials))
+
+    def __sub__(self, other: Union[DualNumber, float]) -> DualNumber:
+        """
+        Subtract a dual number or a number from this dual number
+        :param other: the dual number or number to subtract
+        :return:
+        """
+        return self + -self._coerce(other)
+
+    def __rsub__(self, other: float) -> DualNumber:
+        """
+        Subtract this dual number from a number
+        :param other: the number to subtract from
+        :return:
+        """
+        return self._coerce(other) - self
+
+    def __mul__(self, other: Union[DualNumber, float]) -> DualNumber:
+        """
+        Multiply this dual number by a dual number or a number
+        :param other: the dual number or number to multiply by
+        :return:
+        """
+        other = self._coerce(other)
+        return DualNumber(
+            self.value * other.value,
+            tuple(a * other.value + b * self.value for a, b in zip(self.partials, other.partials))
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: float) -> DualNumber:
+        """
+        Divide this dual number by a number
+        :param other: the number to divide by
+        :return:
+        """
+        return self * (1 / other)
+
+    def __abs__(self) -> DualNumber:
+        """
+        Get the absolute value, at zero the derivative of the positive side is used
+        :return:
+        """
+        if isinstance(self.value, numpy.ndarray):
+            sign = numpy.where(self.value < 0, -1.0, 1.0)
+            return DualNumber(numpy.abs(self.value), tuple(a * sign for a in self.partials))
+        if self.value < 0:
+            return -self
+        return DualNumber(self.value, self.partials)
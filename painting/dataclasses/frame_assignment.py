@@ -0,0 +1,26 @@
+"""
+a class to hold the frame chosen for a painting
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from painting.dataclasses.frame_part_list import FramePartList
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.dataclasses.stocked_frame import StockedFrame
+
+
+@dataclass
+class FrameAssignment:
+    """
+    A class to hold the frame chosen for a painting
+    Attributes:
+        painting: the painting
+        frame: the stocked frame assigned to the painting, None if it is built from molding
+        parts: the parts to build from molding, None if a stocked frame is assigned
+        cost_cm: the waste of the choice in cm
+    """
+    painting: PaintingInformation
+    frame: Optional[StockedFrame]
+    parts: Optional[FramePartList]
+    cost_cm: float
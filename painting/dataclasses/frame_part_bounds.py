@@ -0,0 +1,23 @@
+"""
+the bounds of a part of the frame to be built
+"""
+
+from dataclasses import dataclass
+
+from painting.dataclasses.interval import Interval
+
+
+@dataclass
+class FramePartBounds:
+    """
+    the bounds of a part of the frame to be built
+    Attributes:
+        inner_length: the bounds of the length of the part inside the frame in cm
+        outer_length: the bounds of the length of the part outside the frame in cm
+        inlay_width: the bounds of the width of the inlay in cm
+        coverage_width: the bounds of the width of the coverage from painting min to inlay width in cm
+    """
+    inner_length: Interval
+    outer_length: Interval
+    inlay_width: Interval
+    coverage_width: Interval
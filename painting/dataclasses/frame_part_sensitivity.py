@@ -0,0 +1,23 @@
+"""
+the sensitivity of a part of the frame to be built
+"""
+
+from dataclasses import dataclass
+
+from painting.dataclasses.sensitivity import Sensitivity
+
+
+@dataclass
+class FramePartSensitivity:
+    """
+    the sensitivity of a part of the frame to be built
+    Attributes:
+        inner_length: the sensitivity of the length of the part inside the frame
+        outer_length: the sensitivity of the length of the part outside the frame
+        inlay_width: the sensitivity of the width of the inlay
+        coverage_width: the sensitivity of the width of the coverage from painting min to inlay width
+    """
+    inner_length: Sensitivity
+    outer_length: Sensitivity
+    inlay_width: Sensitivity
+    coverage_width: Sensitivity
@@ -0,0 +1,139 @@
+"""
+a class to hold a closed interval of values
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Union
+
+
+@dataclass
+class Interval:
+    """
+    A class to hold a closed interval of values
+    Attributes:
+        low: the lower bound of the interval
+        high: the upper bound of the interval
+    """
+    low: float
+    high: float
+
+    def __post_init__(self):
+        if self.low > self.high:
+            raise ValueError(f"interval lower bound {self.low} is greater than upper bound {self.high}")
+
+    @staticmethod
+    def of(value: Union[Interval, float]) -> Interval:
+        """
+        Get an interval from a value, a plain number becomes a degenerate interval
+        :param value: an interval or a number
+        :return: the interval
+        """
+        if isinstance(value, Interval):
+            return value
+        return Interval(value, value)
+
+    @staticmethod
+    def around(value: float, tolerance: float) -> Interval:
+        """
+        Get an interval centered on a value
+        :param value: the center of the interval
+        :param tolerance: the distance from the center to either bound
+        :return: the interval
+        """
+        return Interval(value - abs(tolerance), value + abs(tolerance))
+
+    @property
+    def width(self) -> float:
+        """ get the width of the interval
+        :return: the width of the interval
+        """
+        return self.high - self.low
+
+    @property
+    def midpoint(self) -> float:
+        """ get the midpoint of the interval
+        :return: the midpoint of the interval
+        """
+        return (self.low + self.high) / 2
+
+    def contains(self, value: float) -> bool:
+        """
+        Check if a value is within the interval
+        :param value: the value to check
+        :return: True if the value is within the interval
+        """
+        return self.low <= value <= self.high
+
+    def __add__(self, other: Union[Interval, float]) -> Interval:
+        """
+        Add an interval or a number to this interval
+        :param other: the interval or number to add
+        :return:
+        """
+        other = Interval.of(other)
+        return Interval(self.low + other.low, self.high + other.high)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union[Interval, float]) -> Interval:
+        """
+        Subtract an interval or a number from this interval
+        :param other: the interval or number to subtract
+        :return:
+        """
+        other = Interval.of(other)
+        return Interval(self.low - other.high, self.high - other.low)
+
+    def __rsub__(self, other: float) -> Interval:
+        """
+        Subtract this interval from a number
+        :param other: the number to subtract from
+        :return:
+        """
+        return Interval.of(other) - self
+
+    def __neg__(self) -> Interval:
+        """
+        Negate this interval
+        :return:
+        """
+        return Interval(-self.high, -self.low)
+
+    def __mul__(self, other: Union[Interval, float]) -> Interval:
+        """
+        Multiply this interval by an interval or a number
+        :param other: the interval or number to multiply by
+        :return:
+        """
+        other = Interval.of(other)
+        products = [
+            self.low * other.low,
+            self.low * other.high,
+            self.high * other.low,
+            self.high * other.high
+        ]
+        return Interval(min(products), max(products))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: float) -> Interval:
+        """
+        Divide this interval by a non-zero number
+        :param other: the number to divide by
+        :return:
+        """
+        if other == 0:
+            raise ZeroDivisionError("interval division by zero")
+        return self * (1 / other)
+
+    def __abs__(self) -> Interval:
+        """
+        Get the interval of absolute values
+        :return:
+        """
+        if self.low >= 0:
+            return Interval(self.low, self.high)
+        if self.high <= 0:
+            return Interval(-self.high, -self.low)
+        return Interval(0, max(-self.low, self.high))
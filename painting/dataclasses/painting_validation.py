@@ -0,0 +1,51 @@
+"""
+a data class to hold the result of validating a batch of painting specs
+"""
+
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    List
+)
+
+import numpy
+
+
+@dataclass
+class PaintingValidation:
+    """
+    A data class to hold the result of validating a batch of painting specs
+    Attributes:
+        masks: a boolean mask per rule, True where the row passes
+        reasons: the reason a row fails each rule
+    """
+    masks: Dict[str, numpy.ndarray]
+    reasons: Dict[str, str]
+
+    @property
+    def valid(self) -> numpy.ndarray:
+        """ get the rows that pass every rule
+        :return: a boolean mask, True where the row passes
+        """
+        return numpy.logical_and.reduce(list(self.masks.values()))
+
+    @property
+    def invalid_rows(self) -> List[int]:
+        """ get the rows that fail any rule
+        :return: the row indexes
+        """
+        return numpy.flatnonzero(~self.valid).tolist()
+
+    @property
+    def failure_counts(self) -> Dict[str, int]:
+        """ get the number of rows failing each rule
+        :return: the count of failing rows by rule
+        """
+        return {rule: int(numpy.count_nonzero(~mask)) for rule, mask in self.masks.items()}
+
+    def failures(self, row: int) -> List[str]:
+        """ get the reasons a row fails
+        :param row: the row index
+        :return: the reason of every rule the row fails, empty if it is valid
+        """
+        return [self.reasons[rule] for rule, mask in self.masks.items() if not mask[row]]
@@ -0,0 +1,89 @@
+"""
+a class to hold the view of a schematic drawing
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class SchematicView:
+    """
+    A class to hold the view of a schematic drawing, our coordinate space has y pointing up
+    Attributes:
+        x_min_in: the minimum x value of the drawn content in inches
+        y_min_in: the minimum y value of the drawn content in inches
+        x_max_in: the maximum x value of the drawn content in inches
+        y_max_in: the maximum y value of the drawn content in inches
+        offset_in: the padding around the drawn content in inches
+    """
+    x_min_in: float
+    y_min_in: float
+    x_max_in: float
+    y_max_in: float
+    offset_in: float = 5
+
+    @property
+    def x_min_pad_in(self) -> float:
+        """ get the padded minimum x value
+        :return: the padded minimum x value in inches
+        """
+        return self.x_min_in - self.offset_in
+
+    @property
+    def y_min_pad_in(self) -> float:
+        """ get the padded minimum y value
+        :return: the padded minimum y value in inches
+        """
+        return self.y_min_in - self.offset_in
+
+    @property
+    def x_max_pad_in(self) -> float:
+        """ get the padded maximum x value
+        :return: the padded maximum x value in inches
+        """
+        return self.x_max_in + self.offset_in * 2
+
+    @property
+    def y_max_pad_in(self) -> float:
+        """ get the padded maximum y value
+        :return: the padded maximum y value in inches
+        """
+        return self.y_max_in + self.offset_in * 2
+
+    @property
+    def width_in(self) -> float:
+        """ get the padded width of the view
+        :return: the padded width in inches
+        """
+        return self.x_max_pad_in - self.x_min_pad_in
+
+    @property
+    def height_in(self) -> float:
+        """ get the padded height of the view
+        :return: the padded height in inches
+        """
+        return self.y_max_pad_in - self.y_min_pad_in
+
+    @property
+    def view_box(self) -> str:
+        """ get the svg viewBox attribute
+        :return: the viewBox attribute value
+        """
+        return f"{self.x_min_pad_in} " \
+               f"{self.y_min_pad_in} " \
+               f"{self.x_max_pad_in} " \
+               f"{self.y_max_pad_in}"
+
+    @property
+    def flip_transform(self) -> str:
+        """ get the svg transform that flips our y up coordinate space into the svg y down space
+        :return: the transform attribute value
+        """
+        return f"scale(1, -1) translate(0, -{self.y_max_pad_in - self.offset_in * 2})"
+
+    def percent_length_in(self, percent: float) -> float:
+        """ resolve a percent length against the view box, the way svg renderers resolve a percent font size
+        :param percent: the length in percent
+        :return: the length in inches
+        """
+        return percent / 100 * ((self.x_max_pad_in ** 2 + self.y_max_pad_in ** 2) / 2) ** .5
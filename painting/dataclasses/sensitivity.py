@@ -0,0 +1,25 @@
+"""
+a class to hold the sensitivity of a value to its inputs
+"""
+
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass
+class Sensitivity:
+    """
+    A class to hold the sensitivity of a value to its inputs
+    Attributes:
+        value_cm: the value in cm
+        partials: the partial derivative of the value with respect to each named input
+    """
+    value_cm: float
+    partials: Dict[str, float]
+
+    @property
+    def driver(self) -> str:
+        """ get the input the value is most sensitive to
+        :return: the name of the input with the largest absolute partial derivative
+        """
+        return max(self.partials, key=lambda name: abs(self.partials[name]))
@@ -0,0 +1,34 @@
+"""
+a data class to hold the collected memory use of a profiled stage
+"""
+
+from dataclasses import (
+    dataclass,
+    field
+)
+from typing import Dict
+
+
+@dataclass
+class StageMemory:
+    """
+    A data class to hold the collected memory use of a profiled stage
+    Attributes:
+        name: the name of the stage
+        calls: the number of times the stage ran
+        peak_bytes: the highest traced memory of a single run above what was traced when it started
+        retained_bytes: the total traced memory still held as the runs ended, their results included
+        objects: the number of each counted class made by the runs, by class name
+    """
+    name: str
+    calls: int = 0
+    peak_bytes: int = 0
+    retained_bytes: int = 0
+    objects: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def objects_per_call(self) -> Dict[str, float]:
+        """ get the mean number of each counted class made by a run
+        :return: the mean counts by class name
+        """
+        return {name: count / self.calls for name, count in self.objects.items()} if self.calls else {}
@@ -0,0 +1,30 @@
+"""
+a data class to hold the collected timings of a profiled stage
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class StageTiming:
+    """
+    A data class to hold the collected timings of a profiled stage
+    Attributes:
+        name: the name of the stage
+        calls: the number of times the stage ran
+        total_s: the total time spent in the stage in seconds
+        max_s: the longest single run of the stage in seconds
+        elements: the number of elements the stage produced, where it counts them
+    """
+    name: str
+    calls: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    elements: int = 0
+
+    @property
+    def mean_ms(self) -> float:
+        """ get the mean time of a run
+        :return: the mean run time in milliseconds
+        """
+        return self.total_s / self.calls * 1000 if self.calls else 0.0
@@ -0,0 +1,77 @@
+"""
+a class to hold a ready-made standard frame size
+"""
+
+from dataclasses import dataclass
+
+from painting.dataclasses.stocked_frame import StockedFrame
+from painting.mathematics.units import in_to_cm
+
+
+@dataclass
+class StandardFrame:
+    """
+    A class to hold a ready-made standard frame size, sized by the artwork it holds
+    Attributes:
+        width_in: the nominal width of the recess in inches
+        height_in: the nominal height of the recess in inches
+        lip_in: the width of the lip overlapping the artwork on each side in inches
+        face_width_in: the width of the visible molding face in inches
+    """
+    width_in: float
+    height_in: float
+    lip_in: float = 0.25
+    face_width_in: float = 1.0
+
+    @property
+    def name(self) -> str:
+        """ get the trade name of the size
+        :return: the name, such as 8x10
+        """
+        return f"{self.width_in:g}x{self.height_in:g}"
+
+    @property
+    def opening_width_in(self) -> float:
+        """ get the width of the visible opening
+        :return: the width of the visible opening in inches
+        """
+        return self.width_in - self.lip_in * 2
+
+    @property
+    def opening_height_in(self) -> float:
+        """ get the height of the visible opening
+        :return: the height of the visible opening in inches
+        """
+        return self.height_in - self.lip_in * 2
+
+    @property
+    def exterior_width_in(self) -> float:
+        """ get the exterior width of the frame
+        :return: the exterior width in inches
+        """
+        return self.opening_width_in + self.face_width_in * 2
+
+    @property
+    def exterior_height_in(self) -> float:
+        """ get the exterior height of the frame
+        :return: the exterior height in inches
+        """
+        return self.opening_height_in + self.face_width_in * 2
+
+    def stocked_frame(self, rotated: bool = False) -> StockedFrame:
+        """
+        Get the frame dimensions in cm, in portrait or rotated orientation
+        :param rotated: if True, swap the width and height
+        :return: the stocked frame
+        """
+        width_in, height_in = (self.height_in, self.width_in) if rotated else (self.width_in, self.height_in)
+        lip_cm = in_to_cm(self.lip_in)
+        return StockedFrame(
+            name=f"{width_in:g}x{height_in:g}",
+            rabbet_width_cm=in_to_cm(width_in),
+            rabbet_height_cm=in_to_cm(height_in),
+            left_lip_cm=lip_cm,
+            top_lip_cm=lip_cm,
+            right_lip_cm=lip_cm,
+            bottom_lip_cm=lip_cm
+        )
@@ -0,0 +1,36 @@
+"""
+a stock length of molding and the pieces cut from it
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+from painting.dataclasses.cut_piece import CutPiece
+
+
+@dataclass
+class StockBar:
+    """
+    a stock length of molding and the pieces cut from it
+    Attributes:
+        length_cm: the length of the stock in cm
+        kerf_cm: the width of material removed by each saw cut in cm
+        pieces: the pieces cut from the stock, in cutting order
+    """
+    length_cm: float
+    kerf_cm: float
+    pieces: List[CutPiece]
+
+    @property
+    def used_cm(self) -> float:
+        """ get the length of stock consumed by the pieces and their saw cuts
+        :return: the used length in cm
+        """
+        return min(sum(piece.length_cm + self.kerf_cm for piece in self.pieces), self.length_cm)
+
+    @property
+    def offcut_cm(self) -> float:
+        """ get the length of stock left over after cutting
+        :return: the offcut length in cm
+        """
+        return self.length_cm - self.used_cm
@@ -0,0 +1,154 @@
+"""
+a class to hold the dimensions of a finished frame
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    Iterable,
+    Mapping,
+    Sequence
+)
+
+import numpy
+
+from painting.dataclasses.frame_layout import FrameLayout
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.mathematics.validation import painting_columns
+
+# the frame fields a fit reads, the columns of a stock
+FRAME_COLUMNS = (
+    "rabbet_width_cm",
+    "rabbet_height_cm",
+    "left_lip_cm",
+    "top_lip_cm",
+    "right_lip_cm",
+    "bottom_lip_cm",
+)
+
+# the rounding allowed in a fit, a frame measured from a layout is a few ulps off the painting it was built for
+FIT_TOLERANCE_CM = 1e-9
+
+
+@dataclass
+class StockedFrame:
+    """
+    A class to hold the dimensions of a finished frame
+    Attributes:
+        name: the name of the frame
+        rabbet_width_cm: the width of the recess the painting sits in in cm
+        rabbet_height_cm: the height of the recess the painting sits in in cm
+        left_lip_cm: the width of the lip between the recess edge and the opening on the left in cm
+        top_lip_cm: the width of the lip between the recess edge and the opening on the top in cm
+        right_lip_cm: the width of the lip between the recess edge and the opening on the right in cm
+        bottom_lip_cm: the width of the lip between the recess edge and the opening on the bottom in cm
+    """
+    name: str
+    rabbet_width_cm: float
+    rabbet_height_cm: float
+    left_lip_cm: float
+    top_lip_cm: float
+    right_lip_cm: float
+    bottom_lip_cm: float
+
+    @property
+    def opening_width_cm(self) -> float:
+        """ get the width of the visible opening
+        :return: the width of the visible opening in cm
+        """
+        return self.rabbet_width_cm - self.left_lip_cm - self.right_lip_cm
+
+    @property
+    def opening_height_cm(self) -> float:
+        """ get the height of the visible opening
+        :return: the height of the visible opening in cm
+        """
+        return self.rabbet_height_cm - self.top_lip_cm - self.bottom_lip_cm
+
+    @staticmethod
+    def from_layout(name: str, layout: FrameLayout) -> StockedFrame:
+        """
+        Get the dimensions of a frame built from a layout
+        :param name: the name of the frame
+        :param layout: the layout the frame was built from
+        :return: the stocked frame
+        """
+        opening = layout.painting_overlap_boundary
+        rabbet = layout.painting_max_boundary
+        return StockedFrame(
+            name=name,
+            rabbet_width_cm=rabbet.width,
+            rabbet_height_cm=rabbet.height,
+            left_lip_cm=opening.x_min - rabbet.x_min,
+            top_lip_cm=rabbet.y_max - opening.y_max,
+            right_lip_cm=rabbet.x_max - opening.x_max,
+            bottom_lip_cm=opening.y_min - rabbet.y_min
+        )
+
+    @staticmethod
+    def frame_columns(frames: Iterable[StockedFrame]) -> Dict[str, numpy.ndarray]:
+        """ gather frames into columns
+        :param frames: the frames
+        :return: a float array per frame field in FRAME_COLUMNS, one row per frame
+        """
+        rows = [[getattr(frame, column) for column in FRAME_COLUMNS] for frame in frames]
+        table = numpy.array(rows, dtype=float).reshape(len(rows), len(FRAME_COLUMNS))
+        return {column: table[:, index] for index, column in enumerate(FRAME_COLUMNS)}
+
+    @staticmethod
+    def fit_matrix(
+            frames: Mapping[str, Sequence[float]],
+            paintings: Mapping[str, Sequence[float]]
+    ) -> numpy.ndarray:
+        """ check which frames accept which paintings, with the rules calculate_frame_layout builds a frame by
+
+        the largest painting has to fit the recess, and sits centred in it like the smallest painting sits
+        centred in the largest. so on each side the lip, less the half of the recess the largest painting
+        leaves free, has to hide at least that side's offset, which keeps the coverage of the smallest
+        painting at least the offset less half the size spread. a frame built from a painting's own layout
+        has lips equal to the offsets and a recess equal to the largest painting, so it accepts the painting
+
+        :param frames: a column per frame field in FRAME_COLUMNS
+        :param paintings: a column per painting field, as painting_columns gives
+        :return: a paintings by frames boolean matrix, True where the frame accepts the painting
+        """
+
+        rabbet_width, rabbet_height, left_lip, top_lip, right_lip, bottom_lip = (
+            numpy.asarray(frames[column], dtype=float)[None, :] for column in FRAME_COLUMNS
+        )
+        width_max = numpy.asarray(paintings["width_max_cm"], dtype=float)[:, None]
+        height_max = numpy.asarray(paintings["height_max_cm"], dtype=float)[:, None]
+
+        # the recess left free around the largest painting on each side
+        width_gap = (rabbet_width - width_max) / 2
+        height_gap = (rabbet_height - height_max) / 2
+
+        return (
+                (width_gap >= -FIT_TOLERANCE_CM)
+                & (height_gap >= -FIT_TOLERANCE_CM)
+                & (left_lip - width_gap - numpy.asarray(paintings["left_offset_cm"])[:, None] >= -FIT_TOLERANCE_CM)
+                & (top_lip - height_gap - numpy.asarray(paintings["top_offset_cm"])[:, None] >= -FIT_TOLERANCE_CM)
+                & (right_lip - width_gap - numpy.asarray(paintings["right_offset_cm"])[:, None] >= -FIT_TOLERANCE_CM)
+                & (bottom_lip - height_gap - numpy.asarray(paintings["bottom_offset_cm"])[:, None] >= -FIT_TOLERANCE_CM)
+        )
+
+    def accepts(self, painting: PaintingInformation) -> bool:
+        """
+        Check if a painting can be mounted in this frame with valid coverage, the single row case of fit_matrix
+        :param painting: the painting to check
+        :return: True if the painting can be mounted
+        """
+        return bool(StockedFrame.fit_matrix(StockedFrame.frame_columns([self]), painting_columns([painting]))[0, 0])
+
+    def slack_cm(self, painting: PaintingInformation) -> float:
+        """
+        Get how much more of a painting is hidden than its offsets ask for
+        :param painting: the painting to check
+        :return: the extra hidden width plus the extra hidden height of the painting in cm
+        """
+        # summed over both sides, the lips less the free recess less the offsets
+        return (
+                painting.width_max_cm - painting.left_offset_cm - painting.right_offset_cm - self.opening_width_cm
+                + painting.height_max_cm - painting.top_offset_cm - painting.bottom_offset_cm - self.opening_height_cm
+        )
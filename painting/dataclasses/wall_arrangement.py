@@ -0,0 +1,25 @@
+"""
+a class to hold an arrangement of framed paintings on a wall
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.dataclasses.wall_placement import WallPlacement
+
+
+@dataclass
+class WallArrangement:
+    """
+    A class to hold an arrangement of framed paintings on a wall
+    Attributes:
+        width_cm: the width of the wall in cm
+        height_cm: the height of the wall in cm
+        placements: the framed paintings placed on the wall
+        unplaced: the paintings that did not fit on the wall
+    """
+    width_cm: float
+    height_cm: float
+    placements: List[WallPlacement]
+    unplaced: List[PaintingInformation]
@@ -0,0 +1,23 @@
+"""
+a class to hold a framed painting placed on a wall
+"""
+
+from dataclasses import dataclass
+
+from painting.dataclasses.frame_layout import FrameLayout
+from painting.dataclasses.frame_size import FrameSize
+from painting.dataclasses.painting_information import PaintingInformation
+
+
+@dataclass
+class WallPlacement:
+    """
+    A class to hold a framed painting placed on a wall
+    Attributes:
+        painting: the painting
+        frame: the size of the frame wood
+        layout: the frame layout at its place on the wall, in wall coordinates in cm
+    """
+    painting: PaintingInformation
+    frame: FrameSize
+    layout: FrameLayout
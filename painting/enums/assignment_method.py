@@ -0,0 +1,17 @@
+"""
+an enumeration to hold assignment solver methods
+"""
+
+from enum import (
+    IntEnum,
+    auto
+)
+
+
+class AssignmentMethod(IntEnum):
+    """
+    an enumeration to hold assignment solver methods
+    """
+    AUTO = auto()
+    HUNGARIAN = auto()
+    GREEDY = auto()
@@ -0,0 +1,17 @@
+"""
+an enumeration to hold the in memory forms of a rendered raster
+"""
+
+from enum import (
+    IntEnum,
+    auto
+)
+
+
+class RasterFormat(IntEnum):
+    """
+    an enumeration to hold the in memory forms of a rendered raster
+    """
+    MEMORYVIEW = auto()
+    NUMPY = auto()
+    PILLOW = auto()
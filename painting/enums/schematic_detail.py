@@ -0,0 +1,18 @@
+"""
+an enumeration to hold how much annotation a schematic is drawn with
+"""
+
+from enum import (
+    IntEnum,
+    auto
+)
+
+
+class SchematicDetail(IntEnum):
+    """
+    an enumeration to hold how much annotation a schematic is drawn with
+    FULL draws every dimension, LABELS only the name and interior size, OUTLINE only the frame parts
+    """
+    FULL = auto()
+    LABELS = auto()
+    OUTLINE = auto()
@@ -15,3 +15,5 @@ class TextUnitMode(IntEnum):
     CM = auto()
     INCH = auto()
     TAPE = auto()
+    MM = auto()
+    FEET = auto()
@@ -0,0 +1,17 @@
+"""
+an enumeration to hold the alignment of frames along a wall line
+"""
+
+from enum import (
+    IntEnum,
+    auto
+)
+
+
+class WallAlignment(IntEnum):
+    """
+    an enumeration to hold the alignment of frames along a wall line
+    """
+    CENTER = auto()
+    TOP = auto()
+    BOTTOM = auto()
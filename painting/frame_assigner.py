@@ -0,0 +1,182 @@
+"""
+a class to assign a shipment of paintings to stocked frames and molding
+"""
+import time
+from typing import (
+    List,
+    Tuple
+)
+
+import numpy
+
+from painting.dataclasses.assignment_result import AssignmentResult
+from painting.dataclasses.frame_assignment import FrameAssignment
+from painting.dataclasses.frame_part_list import FramePartList
+from painting.dataclasses.frame_size import FrameSize
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.dataclasses.stocked_frame import StockedFrame
+from painting.enums.assignment_method import AssignmentMethod
+from painting.frame_builder import FrameBuilder
+from painting.frame_inventory import FrameInventory
+from painting.mathematics.assignment import (
+    greedy_with_repair,
+    hungarian
+)
+from painting.mathematics.validation import painting_columns
+
+# the largest paintings^2 * (paintings + frames) the automatic method solves with the hungarian algorithm,
+# the hungarian matrix has a molding column per painting next to the frame columns
+HUNGARIAN_LIMIT = 10_000_000
+
+
+class FrameAssigner(object):
+    def __init__(
+            self,
+            frames: List[StockedFrame],
+            molding: FrameSize = FrameSize(width_in=2, height_in=1)
+    ):
+        """
+        :param frames: the stocked frames available
+        :param molding: the molding used for paintings that get no stocked frame
+        """
+        self.inventory = FrameInventory(frames)
+        self.molding = molding
+
+    def stocked_costs(
+            self,
+            paintings: List[PaintingInformation]
+    ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """ calculate the waste of every painting in every stocked frame that accepts it
+
+        the inventory index finds the accepting frames of each painting, so only those pairs are costed
+
+        :param paintings: the paintings in the shipment
+        :return: the painting indexes, frame indexes and waste in cm of the accepting pairs
+        """
+
+        frame_indexes = [self.inventory.accepting_indexes(painting) for painting in paintings]
+        painting_indexes = numpy.repeat(numpy.arange(len(paintings)), [len(indexes) for indexes in frame_indexes])
+        frame_indexes = numpy.concatenate(frame_indexes) if frame_indexes else numpy.zeros(0, dtype=int)
+
+        columns = painting_columns(paintings)
+        width_max = columns["width_max_cm"][painting_indexes]
+        height_max = columns["height_max_cm"][painting_indexes]
+
+        # the outer lengths grow one for one with the recess, so the oversize shows on all four parts
+        waste = (
+                2 * (self.inventory.columns["rabbet_width_cm"][frame_indexes] - width_max)
+                + 2 * (self.inventory.columns["rabbet_height_cm"][frame_indexes] - height_max)
+        )
+        return painting_indexes, frame_indexes, waste
+
+    def calculate_costs(
+            self,
+            paintings: List[PaintingInformation]
+    ) -> Tuple[List[FramePartList], numpy.ndarray, Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]:
+        """ calculate the cost of every option for a shipment
+
+        both options are measured as molding length. building from molding uses up the four part outer
+        lengths from calculate_build_dimensions, a stocked frame wastes the molding it has beyond a frame
+        built to the painting
+
+        :param paintings: the paintings in the shipment
+        :return: the molding parts per painting, the molding cost per painting, and the painting indexes,
+            frame indexes and costs of the accepting stocked frames
+        """
+
+        custom_parts = [
+            FrameBuilder(painting=painting, frame=self.molding).calculate_build_dimensions()
+            for painting in paintings
+        ]
+        custom_costs = numpy.array(
+            [sum(part.outer_length.value_cm for part in parts.parts) for parts in custom_parts],
+            dtype=float
+        )
+
+        return custom_parts, custom_costs, self.stocked_costs(paintings)
+
+    def assign(
+            self,
+            paintings: List[PaintingInformation],
+            method: AssignmentMethod = AssignmentMethod.AUTO,
+            time_limit_s: float = 1.0
+    ) -> AssignmentResult:
+        """ assign each painting of a shipment a stocked frame or molding, keeping the total waste low
+
+        each stocked frame goes to at most one painting, every other painting is built from molding
+
+        :param paintings: the paintings in the shipment
+        :param method: the solver to use, AUTO picks the hungarian algorithm for small shipments
+        :param time_limit_s: the time budget for the greedy repair passes in seconds
+        :return: the assignment result
+        """
+
+        start = time.perf_counter()
+
+        custom_parts, custom_costs, (painting_indexes, frame_indexes, stocked_costs) = self.calculate_costs(paintings)
+
+        # work with the change in cost over building from molding, staying with molding costs nothing
+        savings = stocked_costs - custom_costs[painting_indexes]
+        painting_count, frame_count = len(paintings), len(self.inventory.frames)
+        costs = {
+            (painting_index, frame_index): cost
+            for painting_index, frame_index, cost in zip(
+                painting_indexes.tolist(), frame_indexes.tolist(), stocked_costs.tolist()
+            )
+        }
+
+        if method == AssignmentMethod.AUTO:
+            if painting_count ** 2 * (painting_count + frame_count) <= HUNGARIAN_LIMIT:
+                method = AssignmentMethod.HUNGARIAN
+            else:
+                method = AssignmentMethod.GREEDY
+
+        if method == AssignmentMethod.HUNGARIAN:
+            # one molding column per painting keeps the matrix wide enough for every painting, a frame that
+            # does not accept a painting is no better than molding
+            matrix = numpy.zeros((painting_count, frame_count + painting_count))
+            matrix[painting_indexes, frame_indexes] = numpy.minimum(savings, 0.0)
+            chosen = {
+                painting_index: frame_index
+                for painting_index, frame_index in enumerate(hungarian(matrix.tolist()))
+                if frame_index < frame_count and matrix[painting_index, frame_index] < 0
+            }
+        else:
+            # only the frames that save something are worth offering the greedy solver
+            edges = {}
+            saving = savings < 0
+            for painting_index, frame_index, edge_saving in zip(
+                    painting_indexes[saving].tolist(), frame_indexes[saving].tolist(), savings[saving].tolist()
+            ):
+                edges.setdefault(painting_index, {})[frame_index] = edge_saving
+            chosen = greedy_with_repair(edges, time_limit_s=time_limit_s)
+
+        assignments = []
+        for painting_index, painting in enumerate(paintings):
+            if painting_index in chosen:
+                frame_index = chosen[painting_index]
+                assignments.append(FrameAssignment(
+                    painting=painting,
+                    frame=self.inventory.frames[frame_index],
+                    parts=None,
+                    cost_cm=costs[painting_index, frame_index]
+                ))
+            else:
+                assignments.append(FrameAssignment(
+                    painting=painting,
+                    frame=None,
+                    parts=custom_parts[painting_index],
+                    cost_cm=float(custom_costs[painting_index])
+                ))
+
+        # every painting takes its cheapest option, ignoring that frames can only be used once
+        best_savings = numpy.zeros(painting_count)
+        numpy.minimum.at(best_savings, painting_indexes, savings)
+        lower_bound = float(numpy.sum(custom_costs + best_savings))
+
+        return AssignmentResult(
+            assignments=assignments,
+            lower_bound_cm=lower_bound,
+            solve_seconds=time.perf_counter() - start,
+            method=method
+        )
@@ -2,25 +2,104 @@
 a class to build a frame for a painting
 """
 import io
-from typing import Tuple
-
-import cairosvg
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union
+)
+
+import numpy
 import svgwrite
 from matplotlib import pyplot as plt
 
 from painting.dataclasses.coordinate import Coordinate
-from painting.dataclasses.coordinate_list import CoordinateList
+from painting.dataclasses.dual_number import DualNumber
 from painting.dataclasses.frame_layout import FrameLayout
-from painting.dataclasses.frame_part import FramePart
+from painting.dataclasses.frame_part_bounds import FramePartBounds
 from painting.dataclasses.frame_part_list import FramePartList
+from painting.dataclasses.frame_part_sensitivity import FramePartSensitivity
 from painting.dataclasses.frame_size import FrameSize
+from painting.dataclasses.interval import Interval
 from painting.dataclasses.painting_information import PaintingInformation
+from painting.dataclasses.painting_validation import PaintingValidation
 from painting.dataclasses.paper_dimensions import PaperDimensions
-from painting.dataclasses.unit_cm_value import UnitCm
+from painting.dataclasses.sensitivity import Sensitivity
 from painting.enums.frame_coordinate import FrameCoordinate
 from painting.enums.frame_index import FrameIndex
+from painting.enums.raster_format import RasterFormat
+from painting.enums.schematic_detail import SchematicDetail
 from painting.enums.text_unit_mode import TextUnitMode
-from painting.mathematics.units import cm_to_in
+from painting.frame_plan import FramePlan
+from painting.lazy_frame_layout import LazyFrameLayout
+from painting.mathematics.layout import part_dimensions
+from painting.mathematics.units import in_to_cm
+from painting.mathematics.validation import (
+    painting_columns,
+    validate_paintings
+)
+from painting.png_strip_writer import PngStripWriter
+from painting.profiling import (
+    profiled,
+    stage
+)
+from painting.streaming_svg_writer import StreamingSvgWriter
+
+# cairo needs the libcairo system library, so it is imported by the methods that rasterize. laying out, measuring
+# and building svg work without it
+if TYPE_CHECKING:
+    import cairocffi
+
+# the inputs the build sensitivities are reported against, in evaluation order
+SENSITIVITY_INPUTS = (
+    "width_min_cm",
+    "width_max_cm",
+    "height_min_cm",
+    "height_max_cm",
+    "left_offset_cm",
+    "top_offset_cm",
+    "right_offset_cm",
+    "bottom_offset_cm",
+    "frame_width_in",
+    "frame_height_in",
+)
+
+
+def _sensitivities(dual: DualNumber, count: int) -> List[Sensitivity]:
+    """ split a dual number over a batch into a sensitivity per row
+    :param dual: the dual number, its value and partials are numbers or columns of the batch
+    :param count: the number of rows in the batch
+    :return: the sensitivity of each row
+    """
+    values = numpy.broadcast_to(dual.value, (count,)).tolist()
+    partials = [numpy.broadcast_to(partial, (count,)).tolist() for partial in dual.partials]
+    return [
+        Sensitivity(value_cm=value, partials=dict(zip(SENSITIVITY_INPUTS, row_partials)))
+        for value, row_partials in zip(values, zip(*partials))
+    ]
+
+
+def _straight_rgba(pixels: bytearray, width: int, height: int, stride: int) -> numpy.ndarray:
+    """ convert cairo argb32 pixels to straight rgba
+    :param pixels: the pixels, premultiplied native endian argb words in rows of stride bytes
+    :param width: the width in pixels
+    :param height: the height in pixels
+    :param stride: the bytes per row
+    :return: a (height, width, 4) uint8 array of r g b a bytes, not premultiplied
+    """
+    words = numpy.ndarray((height, width), dtype=numpy.uint32, buffer=pixels, strides=(stride, 4))
+    alpha = (words >> 24).astype(numpy.uint32)
+    # the way cairo unpremultiplies when it writes a png, rounding to nearest
+    safe_alpha = numpy.maximum(alpha, 1)
+    rgba = numpy.empty((height, width, 4), dtype=numpy.uint8)
+    for channel, shift in enumerate((16, 8, 0)):
+        premultiplied = (words >> shift) & 0xFF
+        rgba[:, :, channel] = numpy.where(alpha > 0, (premultiplied * 255 + alpha // 2) // safe_alpha, 0)
+    rgba[:, :, 3] = alpha
+    return rgba
 
 
 class FrameBuilder(object):
@@ -40,243 +119,158 @@ class FrameBuilder(object):
         :param at: the location of the painting
         :return: the frame layout
         """
+        return LazyFrameLayout(self.painting, self.frame, at).frame_layout()
 
-        # find the delta between the min and max painting size
-        od_width_delta = self.painting.width_max_cm - self.painting.width_min_cm
-        od_height_delta = self.painting.height_max_cm - self.painting.height_min_cm
+    def plan(self, at: Coordinate = Coordinate(x=0, y=0)) -> FramePlan:
+        """ get the plan layout, parts and rendering read from, each quantity is computed once when first read
+        :param at: the location of the painting
+        :return: the frame plan
+        """
+        return FramePlan(self.painting, self.frame, at)
 
-        # find the center offset between the min and max painting size
-        minimum_edge_at = Coordinate(
-            x=at.x + od_width_delta / 2,
-            y=at.y + od_height_delta / 2
-        )
+    def calculate_build_dimensions(self) -> FramePartList:
+        """ calculate the build dimensions for the frame
 
-        # find the interior edge that covers the painting
-        interior_edge_at = Coordinate(
-            x=at.x + self.painting.left_offset_cm,
-            y=at.y + self.painting.bottom_offset_cm
-        )
+        :return: a list of frame parts
+        """
+        return FramePlan(self.painting, self.frame).parts
 
-        # build a vertex list of the maximum painting boundary
-        painting_maximum_boundary = CoordinateList(
-            [
-                Coordinate(
-                    x=at.x,
-                    y=at.y
-                ),
-                Coordinate(
-                    x=at.x + self.painting.width_max_cm,
-                    y=at.y
-                ),
-                Coordinate(
-                    x=at.x + self.painting.width_max_cm,
-                    y=at.y + self.painting.height_max_cm
-                ),
-                Coordinate(
-                    x=at.x,
-                    y=at.y + self.painting.height_max_cm
-                ),
-                Coordinate(
-                    x=at.x,
-                    y=at.y
-                )
-            ]
-        )
+    def calculate_build_dimension_bounds(
+            self,
+            tolerance_cm: float = 0.0,
+            frame_tolerance_in: float = 0.0
+    ) -> List[FramePartBounds]:
+        """ calculate guaranteed bounds of the build dimensions for the frame
+
+        every painting measurement and the frame width may be given as an Interval, plain numbers are
+        widened by the tolerance. the bounds are evaluated in one pass over the closed form layout
+        expressions, each input appears once per expression so the bounds are tight
+
+        :param tolerance_cm: the measurement tolerance to apply to plain painting values in cm
+        :param frame_tolerance_in: the tolerance to apply to a plain frame width in inches
+        :return: a list of frame part bounds in FrameIndex order
+        """
 
-        # build a vertex list of the minimum painting boundary
-        painting_minimum_boundary = CoordinateList(
-            [
-                Coordinate(
-                    x=minimum_edge_at.x,
-                    y=minimum_edge_at.y
-                ),
-                Coordinate(
-                    x=minimum_edge_at.x + self.painting.width_min_cm,
-                    y=minimum_edge_at.y
-                ),
-                Coordinate(
-                    x=minimum_edge_at.x + self.painting.width_min_cm,
-                    y=minimum_edge_at.y + self.painting.height_min_cm
-                ),
-                Coordinate(
-                    x=minimum_edge_at.x,
-                    y=minimum_edge_at.y + self.painting.height_min_cm
-                ),
-                Coordinate(
-                    x=minimum_edge_at.x,
-                    y=minimum_edge_at.y
-                )
-            ]
-        )
+        def widen(value, tolerance: float) -> Interval:
+            if isinstance(value, Interval):
+                return value
+            return Interval.around(value, tolerance)
+
+        dimensions = part_dimensions(
+            width_min=widen(self.painting.width_min_cm, tolerance_cm),
+            width_max=widen(self.painting.width_max_cm, tolerance_cm),
+            height_min=widen(self.painting.height_min_cm, tolerance_cm),
+            height_max=widen(self.painting.height_max_cm, tolerance_cm),
+            left_offset=widen(self.painting.left_offset_cm, tolerance_cm),
+            top_offset=widen(self.painting.top_offset_cm, tolerance_cm),
+            right_offset=widen(self.painting.right_offset_cm, tolerance_cm),
+            bottom_offset=widen(self.painting.bottom_offset_cm, tolerance_cm),
+            frame_width=in_to_cm(widen(self.frame.width_in, frame_tolerance_in))
+        )
+
+        return [
+            FramePartBounds(
+                inner_length=inner_length,
+                outer_length=outer_length,
+                inlay_width=inlay_width,
+                coverage_width=coverage_width
+            )
+            for inner_length, outer_length, inlay_width, coverage_width in dimensions
+        ]
 
-        # build a vertex list of the interior edge of the frame overlapping the painting
-        interior_edge = CoordinateList(
-            [
-                Coordinate(
-                    x=interior_edge_at.x,
-                    y=interior_edge_at.y
-                ),
-                Coordinate(
-                    x=interior_edge_at.x + (
-                            self.painting.width_max_cm - self.painting.right_offset_cm - self.painting.left_offset_cm
-                    ),
-                    y=interior_edge_at.y
-                ),
-                Coordinate(
-                    x=interior_edge_at.x + (
-                            self.painting.width_max_cm - self.painting.right_offset_cm - self.painting.left_offset_cm
-                    ),
-                    y=interior_edge_at.y + (
-                            self.painting.height_max_cm - self.painting.top_offset_cm - self.painting.bottom_offset_cm
-                    )
-                ),
-                Coordinate(
-                    x=interior_edge_at.x,
-                    y=interior_edge_at.y + (
-                            self.painting.height_max_cm - self.painting.top_offset_cm - self.painting.bottom_offset_cm
-                    )
-                ),
-                Coordinate(
-                    x=interior_edge_at.x,
-                    y=interior_edge_at.y
-                )
-            ]
-        )
+    def calculate_build_sensitivities(self) -> List[FramePartSensitivity]:
+        """ calculate the partial derivatives of the build dimensions with respect to every input
 
-        # build a vertex list of the exterior edge of the frame
-        exterior_edge = CoordinateList(
-            [
-                interior_edge[FrameCoordinate.BOTTOM_LEFT] + Coordinate(
-                    x=-self.frame.width_cm,
-                    y=-self.frame.width_cm
-                ),
-                interior_edge[FrameCoordinate.BOTTOM_RIGHT] + Coordinate(
-                    x=self.frame.width_cm,
-                    y=-self.frame.width_cm
-                ),
-                interior_edge[FrameCoordinate.TOP_RIGHT] + Coordinate(
-                    x=self.frame.width_cm,
-                    y=self.frame.width_cm
-                ),
-                interior_edge[FrameCoordinate.TOP_LEFT] + Coordinate(
-                    x=-self.frame.width_cm,
-                    y=self.frame.width_cm
-                ),
-                interior_edge[FrameCoordinate.BOTTOM_LEFT_OVERLAY] + Coordinate(
-                    x=-self.frame.width_cm,
-                    y=-self.frame.width_cm
-                )
-            ]
-        )
+        :return: a list of frame part sensitivities in FrameIndex order
+        """
+        return self.calculate_batch_build_sensitivities([self])[0]
 
-        # cleanup the vertex lists to get all vertexes into quadrant 1
-        # find min x and y
-        min_x = at.x - exterior_edge.x_min
-        min_y = at.y - exterior_edge.y_min
-
-        # create an offset coordinate
-        min_offset = Coordinate(x=min_x, y=min_y)
-
-        # apply the offset to all vertexes lists
-        painting_maximum_boundary += min_offset
-        painting_minimum_boundary += min_offset
-        interior_edge += min_offset
-        exterior_edge += min_offset
-
-        return FrameLayout(
-            painting_max_boundary=painting_maximum_boundary,
-            painting_min_boundary=painting_minimum_boundary,
-            painting_overlap_boundary=interior_edge,
-            frame_exterior_boundary=exterior_edge
-        )
+    @staticmethod
+    def calculate_batch_build_sensitivities(
+            builders: List["FrameBuilder"]
+    ) -> List[List[FramePartSensitivity]]:
+        """ calculate the partial derivatives of the build dimensions for a batch of frames
 
-    def calculate_build_dimensions(self) -> FramePartList:
-        """ calculate the build dimensions for the frame
+        the closed form layout expressions are evaluated once for the whole batch with forward mode dual
+        numbers over numpy columns, which gives the exact partial derivatives with respect to all inputs of
+        every frame in a single pass
 
-        :return: a list of frame parts
+        :param builders: the frame builders to calculate the sensitivities for
+        :return: a list of frame part sensitivities in FrameIndex order per builder
         """
 
-        # calculate the frame layout
-        base_frame = self.calculate_frame_layout()
-
-        # pull out the needed edges
-        inner_frame = base_frame.painting_overlap_boundary
-        outer_frame = base_frame.frame_exterior_boundary
-        inlay_frame = base_frame.painting_max_boundary
-        delta_inlay = base_frame.painting_min_boundary
-
-        # calculate the inner build dimensions
-        bottom_id_cm = inner_frame[FrameCoordinate.BOTTOM_LEFT].distance(inner_frame[FrameCoordinate.BOTTOM_RIGHT])
-        right_id_cm = inner_frame[FrameCoordinate.BOTTOM_RIGHT].distance(inner_frame[FrameCoordinate.TOP_RIGHT])
-        top_id_cm = inner_frame[FrameCoordinate.TOP_RIGHT].distance(inner_frame[FrameCoordinate.TOP_LEFT])
-        left_id_cm = inner_frame[FrameCoordinate.TOP_LEFT].distance(inner_frame[FrameCoordinate.BOTTOM_LEFT])
-
-        # calculate the outer build dimensions
-        bottom_od_cm = outer_frame[FrameCoordinate.BOTTOM_LEFT].distance(outer_frame[FrameCoordinate.BOTTOM_RIGHT])
-        right_od_cm = outer_frame[FrameCoordinate.BOTTOM_RIGHT].distance(outer_frame[FrameCoordinate.TOP_RIGHT])
-        top_od_cm = outer_frame[FrameCoordinate.TOP_RIGHT].distance(outer_frame[FrameCoordinate.TOP_LEFT])
-        left_od_cm = outer_frame[FrameCoordinate.TOP_LEFT].distance(outer_frame[FrameCoordinate.BOTTOM_LEFT])
-
-        # calculate the inlay build dimensions
-        bottom_inlay_cm = inner_frame[FrameCoordinate.BOTTOM_LEFT].y_delta(inlay_frame[FrameCoordinate.BOTTOM_RIGHT])
-        right_inlay_cm = inner_frame[FrameCoordinate.BOTTOM_RIGHT].x_delta(inlay_frame[FrameCoordinate.TOP_RIGHT])
-        top_inlay_cm = inner_frame[FrameCoordinate.TOP_RIGHT].y_delta(inlay_frame[FrameCoordinate.TOP_LEFT])
-        left_inlay_cm = inner_frame[FrameCoordinate.TOP_LEFT].x_delta(inlay_frame[FrameCoordinate.BOTTOM_LEFT])
-
-        # calculate the delta inlay build dimensions
-        bottom_coverage_cm = inner_frame[FrameCoordinate.BOTTOM_LEFT].y_delta(delta_inlay[FrameCoordinate.BOTTOM_RIGHT])
-        right_coverage_cm = inner_frame[FrameCoordinate.BOTTOM_RIGHT].x_delta(delta_inlay[FrameCoordinate.TOP_RIGHT])
-        top_coverage_cm = inner_frame[FrameCoordinate.TOP_RIGHT].y_delta(delta_inlay[FrameCoordinate.TOP_LEFT])
-        left_coverage_cm = inner_frame[FrameCoordinate.TOP_LEFT].x_delta(delta_inlay[FrameCoordinate.BOTTOM_LEFT])
-
-        # build the frame part list
-        parts_list = FramePartList(
+        count = len(builders)
+        columns = painting_columns(builder.painting for builder in builders)
+        values = [columns[name] for name in SENSITIVITY_INPUTS[:8]] + [
+            numpy.array([builder.frame.width_in for builder in builders], dtype=float),
+            numpy.array([builder.frame.height_in for builder in builders], dtype=float)
+        ]
+        variables = [
+            DualNumber.variable(value, index, len(SENSITIVITY_INPUTS)) for index, value in enumerate(values)
+        ]
+
+        dimensions = part_dimensions(
+            width_min=variables[0],
+            width_max=variables[1],
+            height_min=variables[2],
+            height_max=variables[3],
+            left_offset=variables[4],
+            top_offset=variables[5],
+            right_offset=variables[6],
+            bottom_offset=variables[7],
+            # the frame height does not take part in the layout, so its partials stay zero
+            frame_width=in_to_cm(variables[8])
+        )
+
+        # one sensitivity list per part per dimension, each covering the whole batch
+        part_sensitivities = [
+            [_sensitivities(dual, count) for dual in part_duals]
+            for part_duals in dimensions
+        ]
+
+        return [
             [
-                FramePart(
-                    inner_length=UnitCm(bottom_id_cm),
-                    outer_length=UnitCm(bottom_od_cm),
-                    inlay_width=UnitCm(bottom_inlay_cm),
-                    coverage_width=UnitCm(bottom_coverage_cm)
-                ),
-                FramePart(
-                    inner_length=UnitCm(right_id_cm),
-                    outer_length=UnitCm(right_od_cm),
-                    inlay_width=UnitCm(right_inlay_cm),
-                    coverage_width=UnitCm(right_coverage_cm)
-                ),
-                FramePart(
-                    inner_length=UnitCm(top_id_cm),
-                    outer_length=UnitCm(top_od_cm),
-                    inlay_width=UnitCm(top_inlay_cm),
-                    coverage_width=UnitCm(top_coverage_cm)
-                ),
-                FramePart(
-                    inner_length=UnitCm(left_id_cm),
-                    outer_length=UnitCm(left_od_cm),
-                    inlay_width=UnitCm(left_inlay_cm),
-                    coverage_width=UnitCm(left_coverage_cm)
+                FramePartSensitivity(
+                    inner_length=inner_lengths[row],
+                    outer_length=outer_lengths[row],
+                    inlay_width=inlay_widths[row],
+                    coverage_width=coverage_widths[row]
                 )
+                for inner_lengths, outer_lengths, inlay_widths, coverage_widths in part_sensitivities
             ]
+            for row in range(count)
+        ]
+
+    @staticmethod
+    def validate_batch(builders: List["FrameBuilder"]) -> PaintingValidation:
+        """ check the painting specs and frame widths of a batch of frames in one vectorized pass
+
+        rows that fail would lay out as nonsense, drop them before spending a layout or a render on them
+
+        :param builders: the frame builders to validate
+        :return: the validation, with a mask and a reason per rule in builder order
+        """
+        return validate_paintings(
+            painting_columns(builder.painting for builder in builders),
+            frame_width_in=[builder.frame.width_in for builder in builders]
         )
-        return parts_list
 
     @staticmethod
     def _draw_od_bottom_dimension(
             dwg: svgwrite.Drawing,
             x1_xy: Tuple[float, float],
             x2_xy: Tuple[float, float],
-            frame_part: FramePart,
+            dimension_text: str,
             ruler_offset: float,
             svg_dim_stroke_width: float,
-            font_size: str,
-            text_unit_mode: TextUnitMode
+            font_size: str
 
     ):
         """ draw the od bottom dimension
         :param dwg: the drawing to draw on
         :param x1_xy: the left x,y coordinate
         :param x2_xy: the right x,y coordinate
-        :param frame_part: the frame part to draw
+        :param dimension_text: the dimension text
         :param ruler_offset: the ruler offset
         :param svg_dim_stroke_width: the stroke width
         """
@@ -309,19 +303,10 @@ class FrameBuilder(object):
             )
         )
 
-        if text_unit_mode == TextUnitMode.CM:
-            output_text = frame_part.outer_length.value_cm_round
-        elif text_unit_mode == TextUnitMode.INCH:
-            output_text = frame_part.outer_length.value_in_round
-        elif text_unit_mode == TextUnitMode.TAPE:
-            output_text = frame_part.outer_length.value_tape
-        else:
-            output_text = frame_part.outer_length.value_cm_round
-
         # draw the bottom text in inches
         # note the font_size is not directly related to the viewbox. best result so far is in percent
         bottom_text = dwg.text(
-            output_text,
+            dimension_text,
             insert=(0, 0),
             text_anchor="middle",
             font_size=font_size,
@@ -341,17 +326,16 @@ class FrameBuilder(object):
             dwg: svgwrite.Drawing,
             x1_xy: Tuple[float, float],
             x2_xy: Tuple[float, float],
-            frame_part: FramePart,
+            dimension_text: str,
             ruler_offset: float,
             svg_dim_stroke_width: float,
-            font_size: str,
-            text_unit_mode: TextUnitMode
+            font_size: str
     ):
         """ draw the od side dimension
         :param dwg: the drawing to draw on
         :param x1_xy: the top x,y coordinate
         :param x2_xy: the bottom x,y coordinate
-        :param frame_part: the frame part to draw
+        :param dimension_text: the dimension text
         :param ruler_offset: the ruler offset
         :param svg_dim_stroke_width: the stroke width
         """
@@ -384,19 +368,10 @@ class FrameBuilder(object):
             )
         )
 
-        if text_unit_mode == TextUnitMode.CM:
-            output_text = frame_part.outer_length.value_cm_round
-        elif text_unit_mode == TextUnitMode.INCH:
-            output_text = frame_part.outer_length.value_in_round
-        elif text_unit_mode == TextUnitMode.TAPE:
-            output_text = frame_part.outer_length.value_tape
-        else:
-            output_text = frame_part.outer_length.value_cm_round
-
         # draw the side text in inches
         # note the font_size is not directly related to the viewbox. best result so far is in percent
         side_text = dwg.text(
-            output_text,
+            dimension_text,
             insert=(0, 0),
             text_anchor="start",
             font_size=font_size,
@@ -417,17 +392,16 @@ class FrameBuilder(object):
             dwg: svgwrite.Drawing,
             x1_xy: Tuple[float, float],
             x2_xy: Tuple[float, float],
-            side_length: UnitCm,
+            dimension_text: str,
             ruler_offset: float,
             svg_dim_stroke_width: float,
-            font_size: str,
-            text_unit_mode: TextUnitMode
+            font_size: str
     ):
         """ draw the max painting dimension
         :param dwg: the drawing to draw on
         :param x1_xy: the top x,y coordinate
         :param x2_xy: the bottom x,y coordinate
-        :param side_length: the length of the side
+        :param dimension_text: the dimension text
         :param ruler_offset: the ruler offset
         :param svg_dim_stroke_width: the stroke width
         """
@@ -460,19 +434,10 @@ class FrameBuilder(object):
             )
         )
 
-        if text_unit_mode == TextUnitMode.CM:
-            output_text = side_length.value_cm_round
-        elif text_unit_mode == TextUnitMode.INCH:
-            output_text = side_length.value_in_round
-        elif text_unit_mode == TextUnitMode.TAPE:
-            output_text = side_length.value_tape
-        else:
-            output_text = side_length.value_cm_round
-
         # draw the side text in inches
         # note the font_size is not directly related to the viewbox. best result so far is in percent
         side_text = dwg.text(
-            output_text,
+            dimension_text,
             insert=(0, 0),
             text_anchor="start",
             font_size=font_size,
@@ -494,18 +459,17 @@ class FrameBuilder(object):
             dwg: svgwrite.Drawing,
             x1_xy: Tuple[float, float],
             x2_xy: Tuple[float, float],
-            side_length: UnitCm,
+            dimension_text: str,
             ruler_offset: float,
             svg_dim_stroke_width: float,
-            font_size: str,
-            text_unit_mode: TextUnitMode
+            font_size: str
 
     ):
         """ draw the id top dimension
         :param dwg: the drawing to draw on
         :param x1_xy: the left x,y coordinate
         :param x2_xy: the right x,y coordinate
-        :param side_length: the side length to draw
+        :param dimension_text: the dimension text
         :param ruler_offset: the ruler offset
         :param svg_dim_stroke_width: the stroke width
         """
@@ -538,19 +502,10 @@ class FrameBuilder(object):
             )
         )
 
-        if text_unit_mode == TextUnitMode.CM:
-            output_text = side_length.value_cm_round
-        elif text_unit_mode == TextUnitMode.INCH:
-            output_text = side_length.value_in_round
-        elif text_unit_mode == TextUnitMode.TAPE:
-            output_text = side_length.value_tape
-        else:
-            output_text = side_length.value_cm_round
-
         # draw the bottom text in inches
         # note the font_size is not directly related to the viewbox. best result so far is in percent
         bottom_text = dwg.text(
-            output_text,
+            dimension_text,
             insert=(0, 0),
             text_anchor="middle",
             font_size=font_size,
@@ -572,18 +527,17 @@ class FrameBuilder(object):
             xy1: Tuple[float, float],
             xy2: Tuple[float, float],
             xy3: Tuple[float, float],
-            frame_part: FramePart,
+            dimension_text: str,
             ruler_offset: float,
             svg_dim_stroke_width: float,
-            font_size: str,
-            text_unit_mode: TextUnitMode
+            font_size: str
     ):
         """ draw the bottom dimension
         :param dwg: the drawing to draw on
         :param xy1: the xy 1 x,y coordinate
         :param xy2: the xy 2 x,y coordinate
         :param xy3: the xy 3 x,y coordinate
-        :param frame_part: the frame part to draw
+        :param dimension_text: the dimension text
         :param ruler_offset: the ruler offset
         :param svg_dim_stroke_width: the stroke width
         """
@@ -629,19 +583,10 @@ class FrameBuilder(object):
             )
         )
 
-        if text_unit_mode == TextUnitMode.CM:
-            output_text = frame_part.inlay_width.value_cm_round
-        elif text_unit_mode == TextUnitMode.INCH:
-            output_text = frame_part.inlay_width.value_in_round
-        elif text_unit_mode == TextUnitMode.TAPE:
-            output_text = frame_part.inlay_width.value_tape
-        else:
-            output_text = frame_part.inlay_width.value_cm_round
-
         # draw the side text in inches
         # note the font_size is not directly related to the viewbox. best result so far is in percent
         side_text = dwg.text(
-            output_text,
+            dimension_text,
             insert=(0, 0),
             text_anchor="middle",
             font_size=font_size,
@@ -663,18 +608,17 @@ class FrameBuilder(object):
             xy1: Tuple[float, float],
             xy2: Tuple[float, float],
             xy3: Tuple[float, float],
-            frame_part: FramePart,
+            dimension_text: str,
             ruler_offset: float,
             svg_dim_stroke_width: float,
-            font_size: str,
-            text_unit_mode: TextUnitMode
+            font_size: str
     ):
         """ draw the bottom dimension
         :param dwg: the drawing to draw on
         :param xy1: the xy 1 x,y coordinate
         :param xy2: the xy 2 x,y coordinate
         :param xy3: the xy 3 x,y coordinate
-        :param frame_part: the frame part to draw
+        :param dimension_text: the dimension text
         :param ruler_offset: the ruler offset
         :param svg_dim_stroke_width: the stroke width
         """
@@ -720,19 +664,10 @@ class FrameBuilder(object):
             )
         )
 
-        if text_unit_mode == TextUnitMode.CM:
-            output_text = frame_part.inlay_width.value_cm_round
-        elif text_unit_mode == TextUnitMode.INCH:
-            output_text = frame_part.inlay_width.value_in_round
-        elif text_unit_mode == TextUnitMode.TAPE:
-            output_text = frame_part.inlay_width.value_tape
-        else:
-            output_text = frame_part.inlay_width.value_cm_round
-
         # draw the side text in inches
         # note the font_size is not directly related to the viewbox. best result so far is in percent
         side_text = dwg.text(
-            output_text,
+            dimension_text,
             insert=(0, 0),
             text_anchor="middle",
             font_size=font_size,
@@ -754,18 +689,17 @@ class FrameBuilder(object):
             xy1: Tuple[float, float],
             xy2: Tuple[float, float],
             xy3: Tuple[float, float],
-            frame_part: FramePart,
+            dimension_text: str,
             ruler_offset: float,
             svg_dim_stroke_width: float,
-            font_size: str,
-            text_unit_mode: TextUnitMode
+            font_size: str
     ):
         """ draw the right dimension
         :param dwg: the drawing to draw on
         :param xy1: the xy 1 x,y coordinate
         :param xy2: the xy 2 x,y coordinate
         :param xy3: the xy 3 x,y coordinate
-        :param frame_part: the frame part to draw
+        :param dimension_text: the dimension text
         :param ruler_offset: the ruler offset
         :param svg_dim_stroke_width: the stroke width
         """
@@ -811,19 +745,10 @@ class FrameBuilder(object):
             )
         )
 
-        if text_unit_mode == TextUnitMode.CM:
-            output_text = frame_part.inlay_width.value_cm_round
-        elif text_unit_mode == TextUnitMode.INCH:
-            output_text = frame_part.inlay_width.value_in_round
-        elif text_unit_mode == TextUnitMode.TAPE:
-            output_text = frame_part.inlay_width.value_tape
-        else:
-            output_text = frame_part.inlay_width.value_cm_round
-
         # draw the side text in inches
         # note the font_size is not directly related to the viewbox. best result so far is in percent
         side_text = dwg.text(
-            output_text,
+            dimension_text,
             insert=(0, 0),
             text_anchor="end",
             font_size=font_size,
@@ -845,18 +770,17 @@ class FrameBuilder(object):
             xy1: Tuple[float, float],
             xy2: Tuple[float, float],
             xy3: Tuple[float, float],
-            frame_part: FramePart,
+            dimension_text: str,
             ruler_offset: float,
             svg_dim_stroke_width: float,
-            font_size: str,
-            text_unit_mode: TextUnitMode
+            font_size: str
     ):
         """ draw the left dimension
         :param dwg: the drawing to draw on
         :param xy1: the xy 1 x,y coordinate
         :param xy2: the xy 2 x,y coordinate
         :param xy3: the xy 3 x,y coordinate
-        :param frame_part: the frame part to draw
+        :param dimension_text: the dimension text
         :param ruler_offset: the ruler offset
         :param svg_dim_stroke_width: the stroke width
         """
@@ -902,19 +826,10 @@ class FrameBuilder(object):
             )
         )
 
-        if text_unit_mode == TextUnitMode.CM:
-            output_text = frame_part.inlay_width.value_cm_round
-        elif text_unit_mode == TextUnitMode.INCH:
-            output_text = frame_part.inlay_width.value_in_round
-        elif text_unit_mode == TextUnitMode.TAPE:
-            output_text = frame_part.inlay_width.value_tape
-        else:
-            output_text = frame_part.inlay_width.value_cm_round
-
         # draw the side text in inches
         # note the font_size is not directly related to the viewbox. best result so far is in percent
         side_text = dwg.text(
-            output_text,
+            dimension_text,
             insert=(0, 0),
             text_anchor="start",
             font_size=font_size,
@@ -931,7 +846,7 @@ class FrameBuilder(object):
         dwg.add(side_text)
 
     @staticmethod
-    def _draw_text(
+    def draw_text(
             dwg: svgwrite.Drawing,
             x: float,
             y: float,
@@ -940,6 +855,15 @@ class FrameBuilder(object):
             color: str,
             text_anchor: str,
     ):
+        """ draw a line of text the right way up in the flipped coordinate space of a schematic
+        :param dwg: the drawing, or a container with the drawing factories, to draw on
+        :param x: the x location of the text anchor in inches
+        :param y: the y location of the text anchor in inches
+        :param text: the text
+        :param font_size: the font size
+        :param color: the text color
+        :param text_anchor: the svg text anchor, start, middle or end
+        """
         draw_text = dwg.text(
             text,
             insert=(0, 0),
@@ -957,37 +881,32 @@ class FrameBuilder(object):
         # we cant chain transforms so i had to do a dedicated object here
         dwg.add(draw_text)
 
-    def draw_schematic(
+    def draw_frame(
             self,
-            paper_size: PaperDimensions = PaperDimensions(8, 10),
-            text_unit_mode: TextUnitMode = TextUnitMode.CM,
-            at: Coordinate = Coordinate(x=0, y=0),
+            dwg: svgwrite.Drawing,
+            plan: FramePlan,
+            text_unit_mode: TextUnitMode,
+            font_size: str,
+            ruler_offset: float = .5,
+            svg_stroke_width: float = .01,
+            svg_dim_stroke_width: float = .05,
+            draw_dimensions: bool = True
     ):
-        """
-        Draw a schematic of the frame layout
-        :param paper_size: the size of the paper to draw on
+        """ draw the frame parts of a layout and their dimensions, on a schematic or on a larger drawing
+        :param dwg: the drawing, or a container with the drawing factories, to draw on
+        :param plan: the plan of the frame to draw
         :param text_unit_mode: the unit mode to use for text
-        :param at: the coordinate to draw the schematic at
-        :return: 
+        :param font_size: the font size
+        :param ruler_offset: the ruler offset
+        :param svg_stroke_width: the stroke width of the frame parts
+        :param svg_dim_stroke_width: the stroke width of the dimensions
+        :param draw_dimensions: False to draw the frame parts only
         """
 
-        frame_to_plot = self.calculate_frame_layout(at=at)
-        parts = self.calculate_build_dimensions()
-
-        exterior_coordinates = list(zip(
-            [cm_to_in(v) for v in frame_to_plot.frame_exterior_boundary.xs],
-            [cm_to_in(v) for v in frame_to_plot.frame_exterior_boundary.ys]
-        ))
-
-        interior_coordinates = list(zip(
-            [cm_to_in(v) for v in frame_to_plot.painting_overlap_boundary.xs],
-            [cm_to_in(v) for v in frame_to_plot.painting_overlap_boundary.ys]
-        ))
-
-        inlay_coordinates = list(zip(
-            [cm_to_in(v) for v in frame_to_plot.painting_max_boundary.xs],
-            [cm_to_in(v) for v in frame_to_plot.painting_max_boundary.ys]
-        ))
+        exterior_coordinates = plan.exterior_in
+        interior_coordinates = plan.interior_in
+        inlay_coordinates = plan.inlay_in
+        text = plan.dimension_text(text_unit_mode)
 
         bottom_vertex = [
             exterior_coordinates[FrameCoordinate.BOTTOM_LEFT],
@@ -1024,93 +943,34 @@ class FrameBuilder(object):
             inlay_coordinates[FrameCoordinate.TOP_LEFT]
         ]
 
-        interior_width = UnitCm(
-            frame_to_plot.painting_overlap_boundary[FrameCoordinate.BOTTOM_RIGHT].distance(
-                frame_to_plot.painting_overlap_boundary[FrameCoordinate.BOTTOM_LEFT]
-            )
-        )
-
-        interior_height = UnitCm(
-            frame_to_plot.painting_overlap_boundary[FrameCoordinate.BOTTOM_RIGHT].distance(
-                frame_to_plot.painting_overlap_boundary[FrameCoordinate.TOP_RIGHT]
-            )
-        )
-
-        painting_max_height = UnitCm(
-            frame_to_plot.painting_max_boundary[FrameCoordinate.TOP_LEFT].distance(
-                frame_to_plot.painting_max_boundary[FrameCoordinate.BOTTOM_LEFT]
-            )
-        )
-
-        painting_max_width = UnitCm(
-            frame_to_plot.painting_max_boundary[FrameCoordinate.TOP_LEFT].distance(
-                frame_to_plot.painting_max_boundary[FrameCoordinate.TOP_RIGHT]
-            )
-        )
-
-        exterior_x_min_in = cm_to_in(frame_to_plot.frame_exterior_boundary.x_min)
-        exterior_y_min_in = cm_to_in(frame_to_plot.frame_exterior_boundary.y_min)
-        exterior_x_max_in = cm_to_in(frame_to_plot.frame_exterior_boundary.x_max)
-        exterior_y_max_in = cm_to_in(frame_to_plot.frame_exterior_boundary.y_max)
-
-        svg_offset = 5
-        ruler_offset = .5
-        svg_stroke_width = .01
-        svg_dim_stroke_width = .05
-        font_size = "2%"
-
-        svg_view_x_min_pad_in = exterior_x_min_in - svg_offset
-        svg_view_y_min_pad_in = exterior_y_min_in - svg_offset
-        svg_view_x_max_pad_in = exterior_x_max_in + svg_offset * 2
-        svg_view_y_max_pad_in = exterior_y_max_in + svg_offset * 2
-
-        svg_width_in = svg_view_x_max_pad_in - svg_view_x_min_pad_in
-        svg_height_in = svg_view_y_max_pad_in - svg_view_y_min_pad_in
-
-        # create the svg object
-        dwg = svgwrite.Drawing(
-            profile='tiny',
-            size=(f"{paper_size.width}in", f"{paper_size.height}in")
-
-        )
-
-        # set up our view box
-        dwg.attribs['viewBox'] = f"{svg_view_x_min_pad_in} " \
-                                 f"{svg_view_y_min_pad_in} " \
-                                 f"{svg_view_x_max_pad_in} " \
-                                 f"{svg_view_y_max_pad_in}"
-
-        # our coordinate space is upside down vs svg standard, so do a y-axis flip and transform
-        dwg.attribs['transform'] = f"scale(1, -1) translate(0, -{svg_view_y_max_pad_in - svg_offset * 2})"
-
         # draw our bottom frame
         dwg.add(dwg.polygon(bottom_vertex, fill='lightblue', stroke='black', stroke_width=svg_stroke_width))
 
-        self._draw_od_bottom_dimension(
-            dwg=dwg,
-            frame_part=parts.parts[FrameIndex.BOTTOM],
-            x1_xy=bottom_vertex[0],
-            x2_xy=bottom_vertex[1],
-            ruler_offset=ruler_offset,
-            svg_dim_stroke_width=svg_dim_stroke_width,
-            font_size=font_size,
-            text_unit_mode=text_unit_mode
-        )
+        if draw_dimensions:
+            self._draw_od_bottom_dimension(
+                dwg=dwg,
+                dimension_text=text.bottom_outer,
+                x1_xy=bottom_vertex[0],
+                x2_xy=bottom_vertex[1],
+                ruler_offset=ruler_offset,
+                svg_dim_stroke_width=svg_dim_stroke_width,
+                font_size=font_size
+            )
 
         # draw our right frame
         dwg.add(dwg.polygon(right_vertex, fill='green', stroke='black', stroke_width=svg_stroke_width))
 
         # draw right side dimensions
-        self._draw_od_side_dimension(
-            dwg=dwg,
-            frame_part=parts.parts[FrameIndex.RIGHT],
-            x1_xy=right_vertex[0],
-            x2_xy=right_vertex[1],
-            ruler_offset=ruler_offset,
-            svg_dim_stroke_width=svg_dim_stroke_width,
-            font_size=font_size,
-            text_unit_mode=text_unit_mode
-        )
+        if draw_dimensions:
+            self._draw_od_side_dimension(
+                dwg=dwg,
+                dimension_text=text.right_outer,
+                x1_xy=right_vertex[0],
+                x2_xy=right_vertex[1],
+                ruler_offset=ruler_offset,
+                svg_dim_stroke_width=svg_dim_stroke_width,
+                font_size=font_size
+            )
 
         # draw top
         dwg.add(dwg.polygon(top_vertex, fill='lightblue', stroke='black', stroke_width=svg_stroke_width))
@@ -1122,136 +982,453 @@ class FrameBuilder(object):
         dwg.add(dwg.polygon(inlay_vertex, fill='none', stroke='black', stroke_width=svg_stroke_width * 2))
 
         # draw the bottom inlay dimension
-        self._draw_bottom_inlay_dimension(
-            dwg=dwg,
-            frame_part=parts.parts[FrameIndex.BOTTOM],
-            xy1=inlay_vertex[0],
-            xy2=inlay_vertex[1],
-            xy3=bottom_vertex[2],
-            ruler_offset=ruler_offset,
-            svg_dim_stroke_width=svg_dim_stroke_width,
-            font_size=font_size,
-            text_unit_mode=text_unit_mode
-        )
+        if draw_dimensions:
+            self._draw_bottom_inlay_dimension(
+                dwg=dwg,
+                dimension_text=text.bottom_inlay,
+                xy1=inlay_vertex[0],
+                xy2=inlay_vertex[1],
+                xy3=bottom_vertex[2],
+                ruler_offset=ruler_offset,
+                svg_dim_stroke_width=svg_dim_stroke_width,
+                font_size=font_size
+            )
 
         # draw the top inlay dimension
-        self._draw_top_inlay_dimension(
-            dwg=dwg,
-            frame_part=parts.parts[FrameIndex.TOP],
-            xy1=inlay_vertex[3],
-            xy2=inlay_vertex[2],
-            xy3=top_vertex[2],
-            ruler_offset=ruler_offset,
-            svg_dim_stroke_width=svg_dim_stroke_width,
-            font_size=font_size,
-            text_unit_mode=text_unit_mode
-        )
+        if draw_dimensions:
+            self._draw_top_inlay_dimension(
+                dwg=dwg,
+                dimension_text=text.top_inlay,
+                xy1=inlay_vertex[3],
+                xy2=inlay_vertex[2],
+                xy3=top_vertex[2],
+                ruler_offset=ruler_offset,
+                svg_dim_stroke_width=svg_dim_stroke_width,
+                font_size=font_size
+            )
 
         # draw the right side inlay dimension
-        self._draw_right_inlay_dimension(
-            dwg=dwg,
-            frame_part=parts.parts[FrameIndex.RIGHT],
-            xy1=inlay_vertex[2],
-            xy2=inlay_vertex[1],
-            xy3=right_vertex[2],
-            ruler_offset=ruler_offset,
-            svg_dim_stroke_width=svg_dim_stroke_width,
-            font_size=font_size,
-            text_unit_mode=text_unit_mode
-        )
+        if draw_dimensions:
+            self._draw_right_inlay_dimension(
+                dwg=dwg,
+                dimension_text=text.right_inlay,
+                xy1=inlay_vertex[2],
+                xy2=inlay_vertex[1],
+                xy3=right_vertex[2],
+                ruler_offset=ruler_offset,
+                svg_dim_stroke_width=svg_dim_stroke_width,
+                font_size=font_size
+            )
 
         # draw the left side inlay dimension
-        self._draw_left_inlay_dimension(
-            dwg=dwg,
-            frame_part=parts.parts[FrameIndex.LEFT],
-            xy1=inlay_vertex[3],
-            xy2=inlay_vertex[0],
-            xy3=left_vertex[2],
-            ruler_offset=ruler_offset,
-            svg_dim_stroke_width=svg_dim_stroke_width,
-            font_size=font_size,
-            text_unit_mode=text_unit_mode
-        )
+        if draw_dimensions:
+            self._draw_left_inlay_dimension(
+                dwg=dwg,
+                dimension_text=text.left_inlay,
+                xy1=inlay_vertex[3],
+                xy2=inlay_vertex[0],
+                xy3=left_vertex[2],
+                ruler_offset=ruler_offset,
+                svg_dim_stroke_width=svg_dim_stroke_width,
+                font_size=font_size
+            )
 
         # draw painting max side dimensions
-        self._draw_id_side_dimension(
-            dwg=dwg,
-            side_length=painting_max_height,
-            x1_xy=inlay_vertex[0],
-            x2_xy=inlay_vertex[3],
-            ruler_offset=ruler_offset,
-            svg_dim_stroke_width=svg_dim_stroke_width,
-            font_size=font_size,
-            text_unit_mode=text_unit_mode
-        )
+        if draw_dimensions:
+            self._draw_id_side_dimension(
+                dwg=dwg,
+                dimension_text=text.painting_max_height,
+                x1_xy=inlay_vertex[0],
+                x2_xy=inlay_vertex[3],
+                ruler_offset=ruler_offset,
+                svg_dim_stroke_width=svg_dim_stroke_width,
+                font_size=font_size
+            )
 
         # draw the painting max top dimension
-        self._draw_id_top_dimension(
+        if draw_dimensions:
+            self._draw_id_top_dimension(
+                dwg=dwg,
+                dimension_text=text.painting_max_width,
+                x1_xy=inlay_vertex[3],
+                x2_xy=inlay_vertex[2],
+                ruler_offset=ruler_offset,
+                svg_dim_stroke_width=svg_dim_stroke_width,
+                font_size=font_size
+            )
+
+    def draw_schematic_content(
+            self,
+            dwg: svgwrite.Drawing,
+            plan: FramePlan,
+            text_unit_mode: TextUnitMode,
+            font_size: str,
+            detail: SchematicDetail = SchematicDetail.FULL
+    ):
+        """ draw the frame, the painting name and the interior dimensions of a schematic
+        :param dwg: the drawing, or a container with the drawing factories, to draw on
+        :param plan: the plan of the frame to draw
+        :param text_unit_mode: the unit mode to use for text
+        :param font_size: the font size
+        :param detail: how much annotation to draw
+        """
+
+        view = plan.view
+
+        # draw the frame parts and their dimensions
+        self.draw_frame(
             dwg=dwg,
-            side_length=painting_max_width,
-            x1_xy=inlay_vertex[3],
-            x2_xy=inlay_vertex[2],
-            ruler_offset=ruler_offset,
-            svg_dim_stroke_width=svg_dim_stroke_width,
+            plan=plan,
+            text_unit_mode=text_unit_mode,
             font_size=font_size,
-            text_unit_mode=text_unit_mode
+            draw_dimensions=detail == SchematicDetail.FULL
         )
 
+        if detail == SchematicDetail.OUTLINE:
+            return
+
         # draw the painting name
-        self._draw_text(
+        self.draw_text(
             dwg=dwg,
             x=0,
-            y=svg_height_in - svg_offset * 3 + .5,
+            y=view.height_in - view.offset_in * 3 + .5,
             text=f"Name: {self.painting.name}",
             font_size=font_size,
             color='orange',
             text_anchor='start',
         )
 
-        if text_unit_mode == TextUnitMode.CM:
-            id_width_text = interior_width.value_cm_round
-        elif text_unit_mode == TextUnitMode.INCH:
-            id_width_text = interior_width.value_in_round
-        elif text_unit_mode == TextUnitMode.TAPE:
-            id_width_text = interior_width.value_tape
-        else:
-            id_width_text = interior_width.value_cm_round
-
-        if text_unit_mode == TextUnitMode.CM:
-            id_height_text = interior_height.value_cm_round
-        elif text_unit_mode == TextUnitMode.INCH:
-            id_height_text = interior_height.value_in_round
-        elif text_unit_mode == TextUnitMode.TAPE:
-            id_height_text = interior_height.value_tape
-        else:
-            id_height_text = interior_height.value_cm_round
-
-        self._draw_text(
+        text = plan.dimension_text(text_unit_mode)
+
+        self.draw_text(
             dwg=dwg,
-            x=(svg_width_in - svg_offset * 3) / 2,
-            y=(svg_height_in - svg_offset * 3) / 2 - .5,
-            text=f"ID Width: {id_width_text}",
+            x=(view.width_in - view.offset_in * 3) / 2,
+            y=(view.height_in - view.offset_in * 3) / 2 - .5,
+            text=f"ID Width: {text.interior_width}",
             font_size=font_size,
             color='orange',
             text_anchor='middle',
         )
 
-        self._draw_text(
+        self.draw_text(
             dwg=dwg,
-            x=(svg_width_in - svg_offset * 3) / 2,
-            y=(svg_height_in - svg_offset * 3) / 2 + .5,
-            text=f"ID Height: {id_height_text}",
+            x=(view.width_in - view.offset_in * 3) / 2,
+            y=(view.height_in - view.offset_in * 3) / 2 + .5,
+            text=f"ID Height: {text.interior_height}",
             font_size=font_size,
             color='orange',
             text_anchor='middle',
         )
 
-        svg_file = io.StringIO()
-        dwg.write(svg_file)
-        svg_file.seek(0)
+    def build_schematic(
+            self,
+            paper_size: PaperDimensions = PaperDimensions(8, 10),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM,
+            at: Coordinate = Coordinate(x=0, y=0),
+    ) -> svgwrite.Drawing:
+        """
+        Build the svg drawing of a schematic of the frame layout
+        :param paper_size: the size of the paper to draw on
+        :param text_unit_mode: the unit mode to use for text
+        :param at: the coordinate to draw the schematic at
+        :return: the drawing
+        """
+
+        plan = self.plan(at=at)
+        view = plan.view
+
+        font_size = "2%"
+
+        # create the svg object
+        dwg = svgwrite.Drawing(
+            profile='tiny',
+            size=(f"{paper_size.width}in", f"{paper_size.height}in")
+
+        )
+
+        # set up our view box
+        dwg.attribs['viewBox'] = view.view_box
+
+        # our coordinate space is upside down vs svg standard, so do a y-axis flip and transform
+        dwg.attribs['transform'] = view.flip_transform
+
+        self.draw_schematic_content(
+            dwg=dwg,
+            plan=plan,
+            text_unit_mode=text_unit_mode,
+            font_size=font_size
+        )
+
+        return dwg
+
+    def stream_schematic(
+            self,
+            write_to: Union[str, TextIO],
+            paper_size: PaperDimensions = PaperDimensions(8, 10),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM,
+            at: Coordinate = Coordinate(x=0, y=0),
+    ):
+        """
+        Write the svg of a schematic of the frame layout element by element, without building the drawing
+        :param write_to: the svg file path, or a writable text file object
+        :param paper_size: the size of the paper to draw on
+        :param text_unit_mode: the unit mode to use for text
+        :param at: the coordinate to draw the schematic at
+        """
+
+        plan = self.plan(at=at)
+
+        with StreamingSvgWriter(write_to=write_to, paper_size=paper_size, view=plan.view) as writer:
+            self.draw_schematic_content(
+                dwg=writer,
+                plan=plan,
+                text_unit_mode=text_unit_mode,
+                font_size="2%"
+            )
+
+    def _render_onto(
+            self,
+            context: "cairocffi.Context",
+            width: float,
+            height: float,
+            plan: FramePlan,
+            text_unit_mode: TextUnitMode,
+            detail: SchematicDetail
+    ):
+        """ draw a schematic page straight onto a cairo context
+        :param context: the cairo context of the page
+        :param width: the page width in device units
+        :param height: the page height in device units
+        :param plan: the plan of the frame to draw
+        :param text_unit_mode: the unit mode to use for text
+        :param detail: how much annotation to draw
+        """
+        from painting.cairo_canvas import CairoCanvas
+
+        self.draw_schematic_content(
+            dwg=CairoCanvas(context=context, width=width, height=height, view=plan.view),
+            plan=plan,
+            text_unit_mode=text_unit_mode,
+            font_size="2%",
+            detail=detail
+        )
+
+    def render_png(
+            self,
+            write_to: Union[str, BinaryIO],
+            paper_size: PaperDimensions = PaperDimensions(8, 10),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM,
+            at: Coordinate = Coordinate(x=0, y=0),
+            dpi: float = 300,
+            detail: SchematicDetail = SchematicDetail.FULL
+    ):
+        """
+        Render a schematic of the frame layout straight onto a cairo surface, skipping the svg round trip
+        :param write_to: the png file path, or a writable binary file object
+        :param paper_size: the size of the paper to draw on
+        :param text_unit_mode: the unit mode to use for text
+        :param at: the coordinate to draw the schematic at
+        :param dpi: the resolution of the png
+        :param detail: how much annotation to draw
+        """
+        import cairocffi
+
+        surface = cairocffi.ImageSurface(
+            cairocffi.FORMAT_ARGB32,
+            round(paper_size.width * dpi),
+            round(paper_size.height * dpi)
+        )
+        self._render_onto(
+            context=cairocffi.Context(surface),
+            width=surface.get_width(),
+            height=surface.get_height(),
+            plan=self.plan(at=at),
+            text_unit_mode=text_unit_mode,
+            detail=detail
+        )
+
+        surface.write_to_png(write_to)
+        surface.finish()
+
+    def render_png_strips(
+            self,
+            write_to: Union[str, BinaryIO],
+            paper_size: PaperDimensions = PaperDimensions(8, 10),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM,
+            at: Coordinate = Coordinate(x=0, y=0),
+            dpi: float = 300,
+            strip_height_px: int = 256,
+            detail: SchematicDetail = SchematicDetail.FULL
+    ):
+        """
+        Render a schematic of the frame layout a strip of rows at a time, for pages too large for one raster
+        buffer. each strip is drawn onto the same small surface and streamed into the png, so peak memory
+        depends on the strip size rather than the page size. the page is drawn on white rather than transparent
+        :param write_to: the png file path, or a writable binary file object
+        :param paper_size: the size of the paper to draw on
+        :param text_unit_mode: the unit mode to use for text
+        :param at: the coordinate to draw the schematic at
+        :param dpi: the resolution of the png
+        :param strip_height_px: the height of a strip in pixels
+        :param detail: how much annotation to draw
+        """
+        import cairocffi
+        from painting.cairo_canvas import rgb24_to_rgb
+
+        plan = self.plan(at=at)
+
+        width = round(paper_size.width * dpi)
+        height = round(paper_size.height * dpi)
+        surface = cairocffi.ImageSurface(cairocffi.FORMAT_RGB24, width, min(strip_height_px, height))
+
+        with PngStripWriter(write_to=write_to, width=width, height=height) as writer:
+            for top in range(0, height, strip_height_px):
+                context = cairocffi.Context(surface)
+                context.set_source_rgb(1, 1, 1)
+                context.paint()
+
+                # shift the page up so this strip lands on the surface, the rest is clipped away
+                context.translate(0, -top)
+                self._render_onto(
+                    context=context,
+                    width=width,
+                    height=height,
+                    plan=plan,
+                    text_unit_mode=text_unit_mode,
+                    detail=detail
+                )
+
+                surface.flush()
+                writer.write_rows(rgb24_to_rgb(
+                    data=surface.get_data(),
+                    width=width,
+                    rows=min(strip_height_px, height - top),
+                    stride=surface.get_stride()
+                ))
+
+        surface.finish()
+
+    def render_raster(
+            self,
+            paper_size: PaperDimensions = PaperDimensions(8, 10),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM,
+            at: Coordinate = Coordinate(x=0, y=0),
+            dpi: float = 300,
+            detail: SchematicDetail = SchematicDetail.FULL,
+            raster_format: RasterFormat = RasterFormat.MEMORYVIEW
+    ):
+        """
+        Render a schematic of the frame layout into memory, without png encoding
+
+        cairo draws into a buffer we own, whose premultiplied native endian argb words are converted once into
+        straight rgba, the byte order every format returns. Pillow is imported only when asked for
+        :param paper_size: the size of the paper to draw on
+        :param text_unit_mode: the unit mode to use for text
+        :param at: the coordinate to draw the schematic at
+        :param dpi: the resolution of the raster
+        :param detail: how much annotation to draw
+        :param raster_format: the form of the result
+        :return: a (height, width, 4) byte memoryview or uint8 numpy array of straight rgba pixels, or an rgba
+            Pillow image
+        """
+        import cairocffi
+
+        width = round(paper_size.width * dpi)
+        height = round(paper_size.height * dpi)
+        stride = cairocffi.ImageSurface.format_stride_for_width(cairocffi.FORMAT_ARGB32, width)
+        pixels = bytearray(stride * height)
+
+        surface = cairocffi.ImageSurface.create_for_data(pixels, cairocffi.FORMAT_ARGB32, width, height, stride)
+        self._render_onto(
+            context=cairocffi.Context(surface),
+            width=width,
+            height=height,
+            plan=self.plan(at=at),
+            text_unit_mode=text_unit_mode,
+            detail=detail
+        )
+        # the pixels stay in our buffer once the surface is gone
+        surface.finish()
+        rgba = _straight_rgba(pixels, width, height, stride)
+
+        if raster_format == RasterFormat.NUMPY:
+            return rgba
+        if raster_format == RasterFormat.PILLOW:
+            from PIL import Image
+            # Pillow shares the rgba array rather than copying it again
+            return Image.frombuffer('RGBA', (width, height), rgba, 'raw', 'RGBA', 0, 1)
+        return memoryview(rgba)
+
+    def render_preview(
+            self,
+            max_width_px: int = 256,
+            max_height_px: int = 256,
+            detail: SchematicDetail = SchematicDetail.LABELS,
+            paper_size: PaperDimensions = PaperDimensions(8, 10),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM
+    ) -> bytes:
+        """
+        Render a small schematic for on screen previews and thumbnails
+        :param max_width_px: the largest preview width in pixels
+        :param max_height_px: the largest preview height in pixels
+        :param detail: how much annotation to draw, dimensions are unreadable at thumbnail sizes
+        :param paper_size: the paper the preview is a picture of
+        :param text_unit_mode: the unit mode to use for text
+        :return: the png bytes
+        """
+
+        # the resolution that fits the whole paper inside the pixel box
+        dpi = min(max_width_px / paper_size.width, max_height_px / paper_size.height)
+
+        png_file = io.BytesIO()
+        self.render_png(
+            write_to=png_file,
+            paper_size=paper_size,
+            text_unit_mode=text_unit_mode,
+            dpi=dpi,
+            detail=detail
+        )
+        return png_file.getvalue()
+
+    @profiled("draw_schematic")
+    def draw_schematic(
+            self,
+            paper_size: PaperDimensions = PaperDimensions(8, 10),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM,
+            at: Coordinate = Coordinate(x=0, y=0),
+            raster_format: Optional[RasterFormat] = None
+    ):
+        """
+        Draw a schematic of the frame layout
+        :param paper_size: the size of the paper to draw on
+        :param text_unit_mode: the unit mode to use for text
+        :param at: the coordinate to draw the schematic at
+        :param raster_format: return the raster in this form from render_raster rather than writing a png
+        :return: the raster if a raster format is given
+        """
+        import cairosvg
+
+        if raster_format is not None:
+            return self.render_raster(
+                paper_size=paper_size,
+                text_unit_mode=text_unit_mode,
+                at=at,
+                raster_format=raster_format
+            )
+
+        with stage("build_schematic") as build_stage:
+            dwg = self.build_schematic(paper_size=paper_size, text_unit_mode=text_unit_mode, at=at)
+            build_stage.add_elements(len(dwg.elements))
+
+        with stage("serialize_svg"):
+            svg_file = io.StringIO()
+            dwg.write(svg_file)
+            svg_file.seek(0)
 
-        cairosvg.svg2png(file_obj=svg_file, write_to="testd.png", dpi=300)
+        with stage("rasterize_png"):
+            cairosvg.svg2png(file_obj=svg_file, write_to="testd.png", dpi=300)
 
+    @profiled("plot")
     def plot(
             self,
             at: Coordinate = Coordinate(x=0, y=0),
@@ -1262,7 +1439,7 @@ class FrameBuilder(object):
         :param axis_offset: the offset to apply to the axis
         """
 
-        frame_to_plot = self.calculate_frame_layout(at=at)
+        frame_to_plot = self.plan(at=at).layout
 
         # find the min and max axis ranges from the outside boundary
         min_x = frame_to_plot.frame_exterior_boundary.x_min
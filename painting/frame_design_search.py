@@ -0,0 +1,281 @@
+"""
+a class to search frame widths and painting offsets for designs meeting constraints
+"""
+import bisect
+import heapq
+import math
+import time
+from typing import (
+    List,
+    Tuple
+)
+
+from painting.dataclasses.design_candidate import DesignCandidate
+from painting.dataclasses.design_constraints import DesignConstraints
+from painting.dataclasses.design_search_result import DesignSearchResult
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.mathematics.units import in_to_cm
+
+
+class FrameDesignSearch(object):
+    def __init__(self, painting: PaintingInformation):
+        """
+        :param painting: the painting to design a frame for, its offsets are replaced by the search
+        """
+        self.painting = painting
+
+    @staticmethod
+    def grid(start: float, stop: float, count: int) -> List[float]:
+        """ get evenly spaced values, including both ends
+        :param start: the first value
+        :param stop: the last value
+        :param count: the number of values
+        :return: the values
+        """
+        if count == 1:
+            return [start]
+        step = (stop - start) / (count - 1)
+        return [start + step * index for index in range(count)]
+
+    @staticmethod
+    def _axis_candidates(
+            size_min_cm: float,
+            size_max_cm: float,
+            first_offsets_cm: List[float],
+            second_offsets_cm: List[float],
+            frame_width_cm: float,
+            target_cm,
+            constraints: DesignConstraints
+    ) -> List[Tuple[float, float, float]]:
+        """ find the offset pairs along one axis meeting the coverage and exterior size constraints
+
+        along an axis the visible size is the maximum painting size less both offsets, the exterior size
+        adds two frame widths, and each side covers its offset less half the painting size spread
+
+        :param size_min_cm: the minimum painting size along the axis in cm
+        :param size_max_cm: the maximum painting size along the axis in cm
+        :param first_offsets_cm: the offsets to try on the left or top side in cm
+        :param second_offsets_cm: the offsets to try on the right or bottom side in cm
+        :param frame_width_cm: the width of the frame wood in cm
+        :param target_cm: the target exterior size along the axis in cm, None for any size
+        :param constraints: the search constraints
+        :return: (visible size, first offset, second offset) tuples sorted by visible size
+        """
+
+        least_offset = constraints.min_coverage_cm + (size_max_cm - size_min_cm) / 2
+        firsts = [offset for offset in first_offsets_cm if offset >= least_offset]
+        seconds = sorted(offset for offset in second_offsets_cm if offset >= least_offset)
+
+        candidates = []
+        for first in firsts:
+            # the visible size falls as the second offset grows, so the valid seconds are one run
+            if target_cm is None:
+                low, high = 0, len(seconds)
+            else:
+                # exterior = size_max - first - second + 2 * frame_width within the tolerance of the target
+                base = size_max_cm - first + frame_width_cm * 2
+                low = bisect.bisect_left(seconds, base - target_cm - constraints.exterior_tolerance_cm)
+                high = bisect.bisect_right(seconds, base - target_cm + constraints.exterior_tolerance_cm)
+            for second in seconds[low:high]:
+                visible = size_max_cm - first - second
+                if visible > 0:
+                    candidates.append((visible, first, second))
+
+        candidates.sort()
+        return candidates
+
+    def search(
+            self,
+            frame_widths_in: List[float],
+            left_offsets_cm: List[float],
+            top_offsets_cm: List[float],
+            right_offsets_cm: List[float],
+            bottom_offsets_cm: List[float],
+            constraints: DesignConstraints,
+            limit: int = 100
+    ) -> DesignSearchResult:
+        """ search every combination of frame width and offsets for designs meeting the constraints
+
+        the exterior size and coverage constraints only couple the offsets along one axis, so each axis
+        is solved on its own per frame width. the aspect ratio couples the axes, the matching heights for
+        each width are found by bisecting the height candidates, so the designs are counted without
+        visiting each one. only the designs that can still make the closest limit are scored, the rest are
+        cut off by a lower bound per width and by walking each run of heights outwards from its targets.
+        this stays in plain python on purpose, a numpy pass over the matches would still build every match
+        while the pruned walk only scores the few that can rank
+
+        :param frame_widths_in: the frame widths to try in inches
+        :param left_offsets_cm: the left offsets to try in cm
+        :param top_offsets_cm: the top offsets to try in cm
+        :param right_offsets_cm: the right offsets to try in cm
+        :param bottom_offsets_cm: the bottom offsets to try in cm
+        :param constraints: the search constraints
+        :param limit: the number of closest designs to return
+        :return: the search result
+        """
+
+        start = time.perf_counter()
+
+        evaluated_count = (
+                len(frame_widths_in) * len(left_offsets_cm) * len(top_offsets_cm)
+                * len(right_offsets_cm) * len(bottom_offsets_cm)
+        )
+        match_count = 0
+        joined = []
+
+        for frame_width_in in frame_widths_in:
+            frame_width_cm = in_to_cm(frame_width_in)
+
+            widths = self._axis_candidates(
+                size_min_cm=self.painting.width_min_cm,
+                size_max_cm=self.painting.width_max_cm,
+                first_offsets_cm=left_offsets_cm,
+                second_offsets_cm=right_offsets_cm,
+                frame_width_cm=frame_width_cm,
+                target_cm=constraints.exterior_width_cm,
+                constraints=constraints
+            )
+            heights = self._axis_candidates(
+                size_min_cm=self.painting.height_min_cm,
+                size_max_cm=self.painting.height_max_cm,
+                first_offsets_cm=top_offsets_cm,
+                second_offsets_cm=bottom_offsets_cm,
+                frame_width_cm=frame_width_cm,
+                target_cm=constraints.exterior_height_cm,
+                constraints=constraints
+            )
+            visible_heights = [height[0] for height in heights]
+
+            for width in widths:
+                if constraints.aspect_ratio is None:
+                    low, high = 0, len(heights)
+                else:
+                    # width / height within the tolerance of the ratio bounds the height from both sides
+                    ratio_high = constraints.aspect_ratio + constraints.aspect_tolerance
+                    ratio_low = constraints.aspect_ratio - constraints.aspect_tolerance
+                    low = bisect.bisect_left(visible_heights, width[0] / ratio_high)
+                    high = len(heights) if ratio_low <= 0 else bisect.bisect_right(
+                        visible_heights, width[0] / ratio_low
+                    )
+                if high > low:
+                    match_count += high - low
+                    joined.append((frame_width_in, frame_width_cm, width, heights, visible_heights, low, high))
+
+        exterior_scale = max(constraints.exterior_tolerance_cm, math.ulp(1.0))
+        aspect_scale = max(constraints.aspect_tolerance, math.ulp(1.0))
+
+        def width_score(frame_width_cm: float, visible_width: float) -> float:
+            if constraints.exterior_width_cm is None:
+                return 0.0
+            return abs(visible_width + frame_width_cm * 2 - constraints.exterior_width_cm) / exterior_scale
+
+        def height_score(frame_width_cm: float, visible_height: float) -> float:
+            if constraints.exterior_height_cm is None:
+                return 0.0
+            return abs(visible_height + frame_width_cm * 2 - constraints.exterior_height_cm) / exterior_scale
+
+        def aspect_score(visible_width: float, visible_height: float) -> float:
+            if constraints.aspect_ratio is None:
+                return 0.0
+            return abs(visible_width / visible_height - constraints.aspect_ratio) / aspect_scale
+
+        def score(base: float, frame_width_cm: float, visible_width: float, visible_height: float) -> float:
+            # added in the same order every time, so a bound built from the same terms never rounds above it
+            return base + height_score(frame_width_cm, visible_height) + aspect_score(visible_width, visible_height)
+
+        def closest(visible_heights: List[float], low: int, high: int, target: float) -> int:
+            return min(max(bisect.bisect_left(visible_heights, target, low, high), low), high)
+
+        # each joined row is one width against a run of heights. both height terms fall towards their target
+        # height and rise away from it, so past both targets the score only grows and a walk outwards can
+        # stop at the first height that cannot make the top designs. rows are taken lowest bound first
+        rows = []
+        for order, (frame_width_in, frame_width_cm, width, heights, visible_heights, low, high) in enumerate(joined):
+            base = width_score(frame_width_cm, width[0])
+
+            # each term is least at a height either side of its target, the sum of those is a bound on the row
+            targets = []
+            height_bound = aspect_bound = 0.0
+            if constraints.exterior_height_cm is not None:
+                target = closest(visible_heights, low, high, constraints.exterior_height_cm - frame_width_cm * 2)
+                height_bound = min(
+                    height_score(frame_width_cm, visible_heights[index])
+                    for index in {max(target - 1, low), min(target, high - 1)}
+                )
+                targets.append(target)
+            if constraints.aspect_ratio is not None:
+                # a ratio at or below zero is closest at the tallest height
+                target = high
+                if constraints.aspect_ratio > 0:
+                    target = closest(visible_heights, low, high, width[0] / constraints.aspect_ratio)
+                aspect_bound = min(
+                    aspect_score(width[0], visible_heights[index])
+                    for index in {max(target - 1, low), min(target, high - 1)}
+                )
+                targets.append(target)
+
+            bound = base + height_bound + aspect_bound
+            rows.append((bound, order, frame_width_in, frame_width_cm, width, heights, low, high, targets))
+        rows.sort(key=lambda row: (row[0], row[1]))
+
+        # designs rank by score, then by search order. the worst kept design is on top of the negated heap
+        kept: List[Tuple] = []
+
+        def worst() -> Tuple:
+            if len(kept) < limit:
+                return (math.inf,)
+            negated_score, negated_order, negated_index, design = kept[0]
+            return -negated_score, -negated_order, -negated_index
+
+        def offer(rank: Tuple, design: Tuple):
+            entry = (-rank[0], -rank[1], -rank[2], design)
+            if len(kept) < limit:
+                heapq.heappush(kept, entry)
+            elif rank < worst():
+                heapq.heapreplace(kept, entry)
+
+        for bound, order, frame_width_in, frame_width_cm, width, heights, low, high, targets in rows:
+            if limit <= 0 or (bound, order) > worst()[:2]:
+                break
+            base = width_score(frame_width_cm, width[0])
+            first = min(targets, default=low)
+            last = max(targets, default=low)
+
+            # between the targets the terms pull opposite ways, so every height there is scored. walking down,
+            # the search order falls, so a tie on score may still rank ahead until the row order is passed
+            for index in range(first, last):
+                rank = (score(base, frame_width_cm, width[0], heights[index][0]), order, index)
+                offer(rank, (frame_width_in, frame_width_cm, width, heights[index]))
+            for index in range(first - 1, low - 1, -1):
+                rank = (score(base, frame_width_cm, width[0], heights[index][0]), order, index)
+                if rank[:2] > worst()[:2]:
+                    break
+                offer(rank, (frame_width_in, frame_width_cm, width, heights[index]))
+            for index in range(last, high):
+                rank = (score(base, frame_width_cm, width[0], heights[index][0]), order, index)
+                if rank > worst():
+                    break
+                offer(rank, (frame_width_in, frame_width_cm, width, heights[index]))
+
+        kept.sort(key=lambda entry: entry[:3], reverse=True)
+        best = [(-negated_score, *design) for negated_score, negated_order, negated_index, design in kept]
+
+        return DesignSearchResult(
+            evaluated_count=evaluated_count,
+            match_count=match_count,
+            best=[
+                DesignCandidate(
+                    frame_width_in=frame_width_in,
+                    left_offset_cm=width[1],
+                    top_offset_cm=height[1],
+                    right_offset_cm=width[2],
+                    bottom_offset_cm=height[2],
+                    exterior_width_cm=width[0] + frame_width_cm * 2,
+                    exterior_height_cm=height[0] + frame_width_cm * 2,
+                    aspect_ratio=width[0] / height[0],
+                    score=candidate_score
+                )
+                for candidate_score, frame_width_in, frame_width_cm, width, height in best
+            ],
+            solve_seconds=time.perf_counter() - start
+        )
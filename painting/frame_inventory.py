@@ -0,0 +1,84 @@
+"""
+a class to match paintings to an inventory of finished frames
+"""
+from typing import (
+    List,
+    Optional
+)
+
+import numpy
+
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.dataclasses.stocked_frame import (
+    FIT_TOLERANCE_CM,
+    StockedFrame
+)
+from painting.mathematics.kd_tree import KdTree
+from painting.mathematics.validation import painting_columns
+
+
+class FrameInventory(object):
+    def __init__(self, frames: List[StockedFrame]):
+        """
+        :param frames: the finished frames in stock
+        """
+        self.frames = list(frames)
+        self.columns = StockedFrame.frame_columns(self.frames)
+
+        # index the frames on opening width, opening height, recess width and recess height
+        self._index = KdTree(
+            [
+                (frame.opening_width_cm, frame.opening_height_cm, frame.rabbet_width_cm, frame.rabbet_height_cm)
+                for frame in self.frames
+            ]
+        )
+
+    def accepting_indexes(self, painting: PaintingInformation) -> numpy.ndarray:
+        """ find the indexes of the stocked frames a painting can be mounted in
+        :param painting: the painting to match
+        :return: the indexes of the accepting frames in the inventory, in no particular order
+        """
+
+        # the recess has to hold the largest painting, and summing the lip rule of both sides of an axis
+        # bounds the opening, which makes a box in the index. the lip rule per side is checked on the matches
+        candidates = numpy.array(
+            self._index.range_query(
+                lows=(None, None, painting.width_max_cm - FIT_TOLERANCE_CM, painting.height_max_cm - FIT_TOLERANCE_CM),
+                highs=(
+                    painting.width_max_cm - painting.left_offset_cm - painting.right_offset_cm + 2 * FIT_TOLERANCE_CM,
+                    painting.height_max_cm - painting.top_offset_cm - painting.bottom_offset_cm + 2 * FIT_TOLERANCE_CM,
+                    None,
+                    None
+                )
+            ),
+            dtype=int
+        )
+
+        fits = StockedFrame.fit_matrix(
+            {column: values[candidates] for column, values in self.columns.items()},
+            painting_columns([painting])
+        )[0]
+        return candidates[fits]
+
+    def accepting(self, painting: PaintingInformation) -> List[StockedFrame]:
+        """ find the stocked frames a painting can be mounted in
+        :param painting: the painting to match
+        :return: the accepting frames, closest fit first
+        """
+        matches = [self.frames[index] for index in self.accepting_indexes(painting)]
+        return sorted(matches, key=lambda frame: frame.slack_cm(painting))
+
+    def accepting_many(self, paintings: List[PaintingInformation]) -> List[List[StockedFrame]]:
+        """ find the stocked frames each painting of a shipment can be mounted in
+        :param paintings: the paintings to match
+        :return: the accepting frames per painting, closest fit first
+        """
+        return [self.accepting(painting) for painting in paintings]
+
+    def best_fit(self, painting: PaintingInformation) -> Optional[StockedFrame]:
+        """ find the stocked frame that hides the least extra of a painting
+        :param painting: the painting to match
+        :return: the closest fitting frame, or None if no frame accepts the painting
+        """
+        matches = self.accepting(painting)
+        return matches[0] if matches else None
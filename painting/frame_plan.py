@@ -0,0 +1,221 @@
+"""
+a class to hold every derived quantity of a framed painting, each computed once
+"""
+from functools import cached_property
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+from painting.dataclasses.coordinate import Coordinate
+from painting.dataclasses.coordinate_list import CoordinateList
+from painting.dataclasses.dimension_text import DimensionText
+from painting.dataclasses.frame_layout import FrameLayout
+from painting.dataclasses.frame_part import FramePart
+from painting.dataclasses.frame_part_list import FramePartList
+from painting.dataclasses.frame_size import FrameSize
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.dataclasses.schematic_view import SchematicView
+from painting.dataclasses.unit_cm_value import UnitCm
+from painting.enums.frame_coordinate import FrameCoordinate
+from painting.enums.frame_index import FrameIndex
+from painting.enums.text_unit_mode import TextUnitMode
+from painting.lazy_frame_layout import LazyFrameLayout
+from painting.mathematics.units import cm_to_in
+from painting.profiling import stage
+from painting.unit_formatting import format_lengths
+
+ORIGIN = Coordinate(x=0, y=0)
+
+
+def _boundary_in(boundary: CoordinateList) -> List[Tuple[float, float]]:
+    """ convert the vertexes of a boundary to inches
+    :param boundary: the boundary in cm
+    :return: the (x, y) vertexes in inches
+    """
+    return [(cm_to_in(c.x), cm_to_in(c.y)) for c in boundary.coordinates]
+
+
+class FramePlan(object):
+    def __init__(
+            self,
+            painting: PaintingInformation,
+            frame: FrameSize,
+            at: Coordinate = ORIGIN,
+            layout: Optional[FrameLayout] = None
+    ):
+        """
+        the plan is what layout, parts and rendering all read from. every quantity is computed the first
+        time it is read and then kept, so one render never works anything out twice. lengths are UnitCm,
+        which carry both cm and inches, and the drawn boundaries are kept in both cm and inches
+
+        :param painting: the painting information
+        :param frame: the frame size
+        :param at: the location of the painting
+        :param layout: the layout of the painting if it is already known, built at the location otherwise
+        """
+        self.painting = painting
+        self.frame = frame
+        self.at = at
+        self.layout: Union[FrameLayout, LazyFrameLayout] = (
+            LazyFrameLayout(painting, frame, at) if layout is None else layout
+        )
+        self._dimension_text: Dict[TextUnitMode, DimensionText] = {}
+
+    @cached_property
+    def parts(self) -> FramePartList:
+        """ get the build dimensions of the frame
+        :return: a list of frame parts
+        """
+
+        with stage("calculate_build_dimensions"):
+            # the parts are lengths and widths, so they are the same wherever the layout was built
+            inner_frame = self.layout.painting_overlap_boundary
+            outer_frame = self.layout.frame_exterior_boundary
+            inlay_frame = self.layout.painting_max_boundary
+            delta_inlay = self.layout.painting_min_boundary
+
+            # calculate the inner build dimensions
+            bottom_id_cm = inner_frame[FrameCoordinate.BOTTOM_LEFT].distance(inner_frame[FrameCoordinate.BOTTOM_RIGHT])
+            right_id_cm = inner_frame[FrameCoordinate.BOTTOM_RIGHT].distance(inner_frame[FrameCoordinate.TOP_RIGHT])
+            top_id_cm = inner_frame[FrameCoordinate.TOP_RIGHT].distance(inner_frame[FrameCoordinate.TOP_LEFT])
+            left_id_cm = inner_frame[FrameCoordinate.TOP_LEFT].distance(inner_frame[FrameCoordinate.BOTTOM_LEFT])
+
+            # calculate the outer build dimensions
+            bottom_od_cm = outer_frame[FrameCoordinate.BOTTOM_LEFT].distance(outer_frame[FrameCoordinate.BOTTOM_RIGHT])
+            right_od_cm = outer_frame[FrameCoordinate.BOTTOM_RIGHT].distance(outer_frame[FrameCoordinate.TOP_RIGHT])
+            top_od_cm = outer_frame[FrameCoordinate.TOP_RIGHT].distance(outer_frame[FrameCoordinate.TOP_LEFT])
+            left_od_cm = outer_frame[FrameCoordinate.TOP_LEFT].distance(outer_frame[FrameCoordinate.BOTTOM_LEFT])
+
+            # calculate the inlay build dimensions
+            bottom_inlay_cm = inner_frame[FrameCoordinate.BOTTOM_LEFT].y_delta(inlay_frame[FrameCoordinate.BOTTOM_RIGHT])
+            right_inlay_cm = inner_frame[FrameCoordinate.BOTTOM_RIGHT].x_delta(inlay_frame[FrameCoordinate.TOP_RIGHT])
+            top_inlay_cm = inner_frame[FrameCoordinate.TOP_RIGHT].y_delta(inlay_frame[FrameCoordinate.TOP_LEFT])
+            left_inlay_cm = inner_frame[FrameCoordinate.TOP_LEFT].x_delta(inlay_frame[FrameCoordinate.BOTTOM_LEFT])
+
+            # calculate the delta inlay build dimensions
+            bottom_coverage_cm = inner_frame[FrameCoordinate.BOTTOM_LEFT].y_delta(delta_inlay[FrameCoordinate.BOTTOM_RIGHT])
+            right_coverage_cm = inner_frame[FrameCoordinate.BOTTOM_RIGHT].x_delta(delta_inlay[FrameCoordinate.TOP_RIGHT])
+            top_coverage_cm = inner_frame[FrameCoordinate.TOP_RIGHT].y_delta(delta_inlay[FrameCoordinate.TOP_LEFT])
+            left_coverage_cm = inner_frame[FrameCoordinate.TOP_LEFT].x_delta(delta_inlay[FrameCoordinate.BOTTOM_LEFT])
+
+            # build the frame part list
+            return FramePartList(
+                [
+                    FramePart(
+                        inner_length=UnitCm(bottom_id_cm),
+                        outer_length=UnitCm(bottom_od_cm),
+                        inlay_width=UnitCm(bottom_inlay_cm),
+                        coverage_width=UnitCm(bottom_coverage_cm)
+                    ),
+                    FramePart(
+                        inner_length=UnitCm(right_id_cm),
+                        outer_length=UnitCm(right_od_cm),
+                        inlay_width=UnitCm(right_inlay_cm),
+                        coverage_width=UnitCm(right_coverage_cm)
+                    ),
+                    FramePart(
+                        inner_length=UnitCm(top_id_cm),
+                        outer_length=UnitCm(top_od_cm),
+                        inlay_width=UnitCm(top_inlay_cm),
+                        coverage_width=UnitCm(top_coverage_cm)
+                    ),
+                    FramePart(
+                        inner_length=UnitCm(left_id_cm),
+                        outer_length=UnitCm(left_od_cm),
+                        inlay_width=UnitCm(left_inlay_cm),
+                        coverage_width=UnitCm(left_coverage_cm)
+                    )
+                ]
+            )
+
+    @cached_property
+    def exterior_in(self) -> List[Tuple[float, float]]:
+        """ get the exterior edge of the frame in inches
+        :return: the (x, y) vertexes in inches
+        """
+        return _boundary_in(self.layout.frame_exterior_boundary)
+
+    @cached_property
+    def interior_in(self) -> List[Tuple[float, float]]:
+        """ get the interior edge of the frame overlapping the painting in inches
+        :return: the (x, y) vertexes in inches
+        """
+        return _boundary_in(self.layout.painting_overlap_boundary)
+
+    @cached_property
+    def inlay_in(self) -> List[Tuple[float, float]]:
+        """ get the maximum boundary of the painting in inches
+        :return: the (x, y) vertexes in inches
+        """
+        return _boundary_in(self.layout.painting_max_boundary)
+
+    @cached_property
+    def view(self) -> SchematicView:
+        """ get the view of a schematic around the exterior of the frame
+        :return: the schematic view
+        """
+        exterior = self.layout.frame_exterior_boundary
+        return SchematicView(
+            x_min_in=cm_to_in(exterior.x_min),
+            y_min_in=cm_to_in(exterior.y_min),
+            x_max_in=cm_to_in(exterior.x_max),
+            y_max_in=cm_to_in(exterior.y_max)
+        )
+
+    @cached_property
+    def interior_width(self) -> UnitCm:
+        """ get the width of the interior edge of the frame
+        :return: the interior width
+        """
+        overlap = self.layout.painting_overlap_boundary
+        return UnitCm(overlap[FrameCoordinate.BOTTOM_RIGHT].distance(overlap[FrameCoordinate.BOTTOM_LEFT]))
+
+    @cached_property
+    def interior_height(self) -> UnitCm:
+        """ get the height of the interior edge of the frame
+        :return: the interior height
+        """
+        overlap = self.layout.painting_overlap_boundary
+        return UnitCm(overlap[FrameCoordinate.BOTTOM_RIGHT].distance(overlap[FrameCoordinate.TOP_RIGHT]))
+
+    @cached_property
+    def painting_max_width(self) -> UnitCm:
+        """ get the width of the maximum boundary of the painting
+        :return: the painting maximum width
+        """
+        inlay = self.layout.painting_max_boundary
+        return UnitCm(inlay[FrameCoordinate.TOP_LEFT].distance(inlay[FrameCoordinate.TOP_RIGHT]))
+
+    @cached_property
+    def painting_max_height(self) -> UnitCm:
+        """ get the height of the maximum boundary of the painting
+        :return: the painting maximum height
+        """
+        inlay = self.layout.painting_max_boundary
+        return UnitCm(inlay[FrameCoordinate.TOP_LEFT].distance(inlay[FrameCoordinate.BOTTOM_LEFT]))
+
+    def dimension_text(self, text_unit_mode: TextUnitMode) -> DimensionText:
+        """ get the text of every drawn dimension, formatted in one call the first time a mode is asked for
+        :param text_unit_mode: the unit mode to use for text
+        :return: the dimension text
+        """
+        text = self._dimension_text.get(text_unit_mode)
+        if text is None:
+            parts = self.parts.parts
+            text = self._dimension_text[text_unit_mode] = DimensionText(*format_lengths(text_unit_mode, [
+                parts[FrameIndex.BOTTOM].outer_length,
+                parts[FrameIndex.RIGHT].outer_length,
+                parts[FrameIndex.BOTTOM].inlay_width,
+                parts[FrameIndex.RIGHT].inlay_width,
+                parts[FrameIndex.TOP].inlay_width,
+                parts[FrameIndex.LEFT].inlay_width,
+                self.painting_max_width,
+                self.painting_max_height,
+                self.interior_width,
+                self.interior_height,
+            ]))
+        return text
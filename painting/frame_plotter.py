@@ -0,0 +1,146 @@
+"""
+a class to plot many frame layouts headless for review
+"""
+import math
+from typing import (
+    List,
+    Tuple
+)
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from painting.dataclasses.coordinate import Coordinate
+from painting.dataclasses.frame_layout import FrameLayout
+
+# the boundaries of a layout and their colors, matching FrameBuilder.plot
+BOUNDARY_COLORS = (
+    ("painting_max_boundary", "k"),
+    ("painting_min_boundary", "b"),
+    ("painting_overlap_boundary", "r"),
+    ("frame_exterior_boundary", "g"),
+)
+
+
+class FramePlotter(object):
+    def __init__(self, figure_size_in: Tuple[float, float] = (8, 8), dpi: int = 100, axis_offset: float = 1):
+        """
+        the plotter owns one agg figure with one line collection per boundary kind, every plot reuses them,
+        so no pyplot state or windows are involved
+
+        :param figure_size_in: the figure size in inches
+        :param dpi: the figure resolution
+        :param axis_offset: the offset to apply to the axis
+        """
+        self.axis_offset = axis_offset
+
+        self.figure = Figure(figsize=figure_size_in, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        self.axes.set_aspect('equal', adjustable='box')
+
+        self._collections = []
+        for _, color in BOUNDARY_COLORS:
+            collection = LineCollection([], colors=color)
+            self.axes.add_collection(collection)
+            self._collections.append(collection)
+
+        self._labels = []
+
+    @staticmethod
+    def _segments(layouts: List[FrameLayout], offsets: List[Coordinate], boundary: str) -> List[List[Tuple]]:
+        """ get one boundary of each layout as polylines
+        :param layouts: the frame layouts
+        :param offsets: the shift of each layout
+        :param boundary: the name of the boundary
+        :return: the polylines
+        """
+        return [
+            list(zip(
+                [x + offset.x for x in getattr(layout, boundary).xs],
+                [y + offset.y for y in getattr(layout, boundary).ys]
+            ))
+            for layout, offset in zip(layouts, offsets)
+        ]
+
+    def _draw(self, layouts: List[FrameLayout], offsets: List[Coordinate], labels: List[str]):
+        """ replace the plotted layouts
+        :param layouts: the frame layouts
+        :param offsets: the shift of each layout
+        :param labels: the label under each layout, empty for none
+        """
+
+        for collection, (boundary, _) in zip(self._collections, BOUNDARY_COLORS):
+            collection.set_segments(self._segments(layouts, offsets, boundary))
+
+        for label in self._labels:
+            label.remove()
+        self._labels = [
+            self.axes.text(
+                (layout.frame_exterior_boundary.x_min + layout.frame_exterior_boundary.x_max) / 2 + offset.x,
+                layout.frame_exterior_boundary.y_min + offset.y - self.axis_offset,
+                label,
+                ha='center',
+                va='top',
+                fontsize='small'
+            )
+            for layout, offset, label in zip(layouts, offsets, labels) if label
+        ]
+
+        # to make the axis equal, find the common min and max between x and y and add small offset
+        eq_min = min(
+            min(layout.frame_exterior_boundary.x_min + offset.x, layout.frame_exterior_boundary.y_min + offset.y)
+            for layout, offset in zip(layouts, offsets)
+        ) - self.axis_offset * (3 if self._labels else 1)
+        eq_max = max(
+            max(layout.frame_exterior_boundary.x_max + offset.x, layout.frame_exterior_boundary.y_max + offset.y)
+            for layout, offset in zip(layouts, offsets)
+        ) + self.axis_offset
+        self.axes.set_xlim(eq_min, eq_max)
+        self.axes.set_ylim(eq_min, eq_max)
+
+    def save_each(self, layouts: List[FrameLayout], write_to: str = "layout_{index}.png"):
+        """ plot each layout on its own, reusing the figure for every file
+        :param layouts: the frame layouts
+        :param write_to: the image file path, formatted with the layout index
+        """
+        for index, layout in enumerate(layouts):
+            self._draw([layout], [Coordinate(x=0, y=0)], [""])
+            self.figure.savefig(write_to.format(index=index))
+
+    def save_grid(
+            self,
+            layouts: List[FrameLayout],
+            write_to: str,
+            columns: int = 0,
+            spacing: float = 5,
+            labels: List[str] = None
+    ):
+        """ plot all layouts side by side in a grid on one axes, in one line collection per boundary kind
+        :param layouts: the frame layouts
+        :param write_to: the image file path
+        :param columns: the number of columns, zero for a square grid
+        :param spacing: the gap between layouts
+        :param labels: the label under each layout, None for none
+        """
+
+        if not layouts:
+            raise ValueError("there are no layouts to plot")
+
+        columns = columns or math.ceil(math.sqrt(len(layouts)))
+        # the cells are all sized to fit the largest layout
+        cell_width = max(layout.frame_exterior_boundary.width for layout in layouts) + spacing
+        cell_height = max(layout.frame_exterior_boundary.height for layout in layouts) + spacing
+        rows = math.ceil(len(layouts) / columns)
+
+        offsets = [
+            Coordinate(
+                x=(index % columns) * cell_width - layout.frame_exterior_boundary.x_min,
+                y=(rows - 1 - index // columns) * cell_height - layout.frame_exterior_boundary.y_min
+            )
+            for index, layout in enumerate(layouts)
+        ]
+
+        self._draw(layouts, offsets, labels or [""] * len(layouts))
+        self.figure.savefig(write_to)
@@ -0,0 +1,160 @@
+"""
+a class to preview a frame layout live while its offsets and frame size are tuned
+"""
+import dataclasses
+import statistics
+import time
+from typing import (
+    List,
+    Tuple
+)
+
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.widgets import Slider
+
+from painting.dataclasses.frame_layout import FrameLayout
+from painting.frame_builder import FrameBuilder
+from painting.frame_plotter import BOUNDARY_COLORS
+
+# the painting offsets a slider is made for
+OFFSET_FIELDS = (
+    "left_offset_cm",
+    "top_offset_cm",
+    "right_offset_cm",
+    "bottom_offset_cm",
+)
+
+# the frame size fields, prefixed so they do not clash with the painting fields
+FRAME_FIELDS = {
+    "frame_width_in": "width_in",
+    "frame_height_in": "height_in",
+}
+
+
+class FramePreview(object):
+    def __init__(self, builder: FrameBuilder, figure: Figure = None, axis_offset: float = 1):
+        """
+        the boundary lines are made once, each change only recomputes the layout, moves the lines with
+        set_data and blits them over the saved background. the axes are only redrawn when the frame grows
+        past them
+
+        :param builder: the frame builder to preview, its painting and frame are replaced as they are tuned
+        :param figure: the figure to draw on, defaults to a new pyplot figure
+        :param axis_offset: the offset to apply to the axis
+        """
+        self.builder = builder
+        self.axis_offset = axis_offset
+        self.frame_times_s: List[float] = []
+
+        self.figure = plt.figure() if figure is None else figure
+        self.axes = self.figure.add_subplot()
+        self.axes.set_aspect('equal', adjustable='box')
+
+        self._lines = [self.axes.plot([], [], color, animated=True)[0] for _, color in BOUNDARY_COLORS]
+        self._sliders: List[Slider] = []
+        self._background = None
+        self.figure.canvas.mpl_connect('draw_event', self._on_draw)
+
+        self.update()
+
+    @property
+    def mean_frame_ms(self) -> float:
+        """ get the mean time of an update
+        :return: the mean update time in milliseconds
+        """
+        return statistics.mean(self.frame_times_s) * 1000 if self.frame_times_s else 0.0
+
+    @property
+    def max_frame_ms(self) -> float:
+        """ get the slowest update time
+        :return: the slowest update time in milliseconds
+        """
+        return max(self.frame_times_s) * 1000 if self.frame_times_s else 0.0
+
+    def _on_draw(self, event):
+        """ save the background after a full draw and put the lines back over it
+        :param event: the draw event
+        """
+        self._background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        for line in self._lines:
+            self.axes.draw_artist(line)
+
+    def _limits(self, layout: FrameLayout) -> Tuple[float, float]:
+        """ get the equal axis range that shows a layout
+        :param layout: the frame layout
+        :return: the axis minimum and maximum
+        """
+        exterior = layout.frame_exterior_boundary
+        return (
+            min(exterior.x_min, exterior.y_min) - self.axis_offset,
+            max(exterior.x_max, exterior.y_max) + self.axis_offset
+        )
+
+    def update(self, **changes) -> float:
+        """ apply changes to the painting or frame and redraw the layout
+        :param changes: new values for painting fields, or frame_width_in and frame_height_in
+        :return: the time the update took in seconds
+        """
+
+        start = time.perf_counter()
+
+        painting_changes = {name: value for name, value in changes.items() if name not in FRAME_FIELDS}
+        frame_changes = {FRAME_FIELDS[name]: value for name, value in changes.items() if name in FRAME_FIELDS}
+        if painting_changes:
+            self.builder.painting = dataclasses.replace(self.builder.painting, **painting_changes)
+        if frame_changes:
+            self.builder.frame = dataclasses.replace(self.builder.frame, **frame_changes)
+
+        layout = self.builder.calculate_frame_layout()
+        for line, (boundary, _) in zip(self._lines, BOUNDARY_COLORS):
+            line.set_data(getattr(layout, boundary).xs, getattr(layout, boundary).ys)
+
+        canvas = self.figure.canvas
+        low, high = self._limits(layout)
+        axis_low, axis_high = self.axes.get_xlim()
+        if self._background is None or low < axis_low or high > axis_high:
+            # grow the axes with some room to spare, the full draw saves a new background
+            margin = (high - low) * 0.1
+            self.axes.set_xlim(low - margin, high + margin)
+            self.axes.set_ylim(low - margin, high + margin)
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            for line in self._lines:
+                self.axes.draw_artist(line)
+            canvas.blit(self.figure.bbox)
+        canvas.flush_events()
+
+        elapsed = time.perf_counter() - start
+        self.frame_times_s.append(elapsed)
+        return elapsed
+
+    def add_sliders(
+            self,
+            offset_range_cm: Tuple[float, float] = (0, 5),
+            frame_range_in: Tuple[float, float] = (0.5, 4)
+    ):
+        """ add sliders under the plot for the painting offsets and the frame width
+        :param offset_range_cm: the slider range of the offsets in cm
+        :param frame_range_in: the slider range of the frame width in inches
+        """
+
+        fields = [(name, offset_range_cm, getattr(self.builder.painting, name)) for name in OFFSET_FIELDS]
+        fields.append(("frame_width_in", frame_range_in, self.builder.frame.width_in))
+
+        slider_height = 0.03
+        self.figure.subplots_adjust(bottom=0.1 + slider_height * 1.5 * len(fields))
+        for index, (name, (low, high), value) in enumerate(fields):
+            slider_axes = self.figure.add_axes((0.25, 0.05 + index * slider_height * 1.5, 0.5, slider_height))
+            slider = Slider(slider_axes, name, low, high, valinit=value)
+            slider.on_changed(lambda changed, field=name: self.update(**{field: changed}))
+            self._sliders.append(slider)
+        self._background = None
+        self.update()
+
+    def show(self):
+        """ add the sliders and open the preview window
+        """
+        self.add_sliders()
+        plt.show()
@@ -0,0 +1,285 @@
+"""
+a class to arrange framed paintings on a wall
+"""
+from typing import (
+    Dict,
+    List,
+    Optional,
+    TextIO,
+    Union
+)
+
+import svgwrite
+
+from painting.dataclasses.coordinate import Coordinate
+from painting.dataclasses.frame_layout import FrameLayout
+from painting.dataclasses.paper_dimensions import PaperDimensions
+from painting.dataclasses.schematic_view import SchematicView
+from painting.dataclasses.wall_arrangement import WallArrangement
+from painting.dataclasses.wall_placement import WallPlacement
+from painting.enums.text_unit_mode import TextUnitMode
+from painting.enums.wall_alignment import WallAlignment
+from painting.frame_builder import FrameBuilder
+from painting.frame_plan import FramePlan
+from painting.mathematics.spatial_hash import (
+    Rectangle,
+    SpatialHash
+)
+from painting.mathematics.units import cm_to_in
+from painting.streaming_svg_writer import StreamingSvgWriter
+
+
+class GalleryWall(object):
+    def __init__(
+            self,
+            width_cm: float,
+            height_cm: float,
+            spacing_cm: float = 5.0,
+            alignment: WallAlignment = WallAlignment.CENTER,
+            line_height_cm: Optional[float] = None
+    ):
+        """
+        :param width_cm: the width of the wall in cm
+        :param height_cm: the height of the wall in cm
+        :param spacing_cm: the least gap between frames, and between frames and the wall edges in cm
+        :param alignment: how the frames of a row line up
+        :param line_height_cm: the height of the alignment line in cm, defaults to the middle of the wall
+        """
+        self.width_cm = width_cm
+        self.height_cm = height_cm
+        self.spacing_cm = spacing_cm
+        self.alignment = alignment
+        self.line_height_cm = height_cm / 2 if line_height_cm is None else line_height_cm
+
+        self._placements: Dict[int, WallPlacement] = {}
+        self._next_key = 0
+        # frames are hashed grown by half the spacing, so spaced frames only ever touch
+        self._index = SpatialHash(cell_size=50.0)
+
+    @property
+    def arrangement(self) -> WallArrangement:
+        """ get the current arrangement of the wall
+        :return: the wall arrangement
+        """
+        return WallArrangement(
+            width_cm=self.width_cm,
+            height_cm=self.height_cm,
+            placements=list(self._placements.values()),
+            unplaced=[]
+        )
+
+    def _spaced_rectangle(self, layout: FrameLayout) -> Rectangle:
+        """ get the exterior of a frame grown by half the spacing on every side
+        :param layout: the frame layout
+        :return: the grown rectangle
+        """
+        exterior = layout.frame_exterior_boundary
+        half = self.spacing_cm / 2
+        return exterior.x_min - half, exterior.y_min - half, exterior.x_max + half, exterior.y_max + half
+
+    def fits(self, layout: FrameLayout) -> bool:
+        """ check if a frame layout is inside the wall margins and clear of every placed frame
+        :param layout: the frame layout in wall coordinates
+        :return: True if the frame can be placed
+        """
+        exterior = layout.frame_exterior_boundary
+        inside = (
+                exterior.x_min >= self.spacing_cm
+                and exterior.y_min >= self.spacing_cm
+                and exterior.x_max <= self.width_cm - self.spacing_cm
+                and exterior.y_max <= self.height_cm - self.spacing_cm
+        )
+        return inside and not self._index.overlapping(self._spaced_rectangle(layout))
+
+    def place(self, builder: FrameBuilder, at: Coordinate) -> Optional[WallPlacement]:
+        """ place a framed painting with the bottom left of its exterior at a point on the wall
+        :param builder: the frame builder of the painting
+        :param at: the wall coordinate in cm
+        :return: the placement, or None if the frame would leave the wall or crowd another frame
+        """
+        layout = builder.calculate_frame_layout(at=at)
+        if not self.fits(layout):
+            return None
+
+        placement = WallPlacement(painting=builder.painting, frame=builder.frame, layout=layout)
+        self._placements[self._next_key] = placement
+        self._index.insert(self._next_key, self._spaced_rectangle(layout))
+        self._next_key += 1
+        return placement
+
+    def remove(self, placement: WallPlacement):
+        """ take a framed painting off the wall
+        :param placement: the placement to remove
+        """
+        for key, placed in self._placements.items():
+            if placed is placement:
+                del self._placements[key]
+                self._index.remove(key)
+                return
+
+    def clear(self):
+        """ take every framed painting off the wall
+        """
+        for key in list(self._placements):
+            self._index.remove(key)
+        self._placements.clear()
+
+    def arrange(self, builders: List[FrameBuilder]) -> WallArrangement:
+        """ arrange framed paintings in rows along the alignment line, in the given order
+
+        rows are filled left to right and centred on the wall, then the block of rows is centred on,
+        hung from or stood on the alignment line to match the alignment, and kept inside the margins
+
+        :param builders: the frame builders of the paintings
+        :return: the wall arrangement, with the paintings that did not fit listed as unplaced
+        """
+
+        self.clear()
+
+        usable_width = self.width_cm - self.spacing_cm * 2
+        sizes = []
+        for builder in builders:
+            exterior = builder.calculate_frame_layout().frame_exterior_boundary
+            sizes.append((exterior.width, exterior.height))
+
+        # fill the rows
+        rows: List[List[int]] = []
+        row_width = 0.0
+        for index, (width, height) in enumerate(sizes):
+            needed = width if not rows or not rows[-1] else row_width + self.spacing_cm + width
+            if rows and rows[-1] and needed <= usable_width:
+                rows[-1].append(index)
+                row_width = needed
+            else:
+                rows.append([index])
+                row_width = width
+
+        row_heights = [max(sizes[index][1] for index in row) for row in rows]
+        block_height = sum(row_heights) + self.spacing_cm * (len(rows) - 1)
+
+        if self.alignment == WallAlignment.TOP:
+            block_top = self.line_height_cm
+        elif self.alignment == WallAlignment.BOTTOM:
+            block_top = self.line_height_cm + block_height
+        else:
+            block_top = self.line_height_cm + block_height / 2
+        block_top = min(block_top, self.height_cm - self.spacing_cm)
+        block_top = max(block_top, min(block_height + self.spacing_cm, self.height_cm - self.spacing_cm))
+
+        unplaced = []
+        band_top = block_top
+        for row, row_height in zip(rows, row_heights):
+            band_bottom = band_top - row_height
+            x = (self.width_cm - (sum(sizes[index][0] for index in row) + self.spacing_cm * (len(row) - 1))) / 2
+
+            for index in row:
+                width, height = sizes[index]
+                if self.alignment == WallAlignment.TOP:
+                    y = band_top - height
+                elif self.alignment == WallAlignment.BOTTOM:
+                    y = band_bottom
+                else:
+                    y = band_bottom + (row_height - height) / 2
+
+                if self.place(builders[index], Coordinate(x=x, y=y)) is None:
+                    unplaced.append(builders[index].painting)
+                x += width + self.spacing_cm
+
+            band_top = band_bottom - self.spacing_cm
+
+        arrangement = self.arrangement
+        arrangement.unplaced = unplaced
+        return arrangement
+
+    def _wall_view(self) -> SchematicView:
+        """ get the view of the whole wall
+        :return: the schematic view
+        """
+        return SchematicView(
+            x_min_in=0,
+            y_min_in=0,
+            x_max_in=cm_to_in(self.width_cm),
+            y_max_in=cm_to_in(self.height_cm)
+        )
+
+    def _draw_wall(self, dwg, view: SchematicView, text_unit_mode: TextUnitMode, font_size: str):
+        """ draw the wall outline and every placed frame
+        :param dwg: the drawing, or a writer with the drawing factories, to draw on
+        :param view: the view of the wall
+        :param text_unit_mode: the unit mode to use for text
+        :param font_size: the font size
+        """
+
+        # draw the wall outline
+        dwg.add(dwg.polygon(
+            [(0, 0), (view.x_max_in, 0), (view.x_max_in, view.y_max_in), (0, view.y_max_in)],
+            fill='none',
+            stroke='gray',
+            stroke_width=.05
+        ))
+
+        for placement in self._placements.values():
+            builder = FrameBuilder(painting=placement.painting, frame=placement.frame)
+            builder.draw_frame(
+                dwg=dwg,
+                plan=FramePlan(placement.painting, placement.frame, layout=placement.layout),
+                text_unit_mode=text_unit_mode,
+                font_size=font_size
+            )
+            exterior = placement.layout.frame_exterior_boundary
+            FrameBuilder.draw_text(
+                dwg=dwg,
+                x=cm_to_in((exterior.x_min + exterior.x_max) / 2),
+                y=cm_to_in(exterior.y_min) - 2,
+                text=placement.painting.name,
+                font_size=font_size,
+                color='orange',
+                text_anchor='middle',
+            )
+
+    def draw_svg(
+            self,
+            write_to: str,
+            paper_size: PaperDimensions = PaperDimensions(40, 30),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM,
+            font_size: str = "0.5%"
+    ) -> svgwrite.Drawing:
+        """ draw the wall and every placed frame through the schematic frame drawing
+        :param write_to: the svg file path to write
+        :param paper_size: the size of the paper to draw on
+        :param text_unit_mode: the unit mode to use for text
+        :param font_size: the font size
+        :return: the drawing
+        """
+
+        view = self._wall_view()
+
+        dwg = svgwrite.Drawing(
+            profile='tiny',
+            size=(f"{paper_size.width}in", f"{paper_size.height}in")
+        )
+        dwg.attribs['viewBox'] = view.view_box
+        # our coordinate space is upside down vs svg standard, so do a y-axis flip and transform
+        dwg.attribs['transform'] = view.flip_transform
+
+        self._draw_wall(dwg, view, text_unit_mode, font_size)
+
+        dwg.saveas(write_to)
+        return dwg
+
+    def stream_svg(
+            self,
+            write_to: Union[str, TextIO],
+            paper_size: PaperDimensions = PaperDimensions(40, 30),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM,
+            font_size: str = "0.5%"
+    ):
+        """ write the wall and every placed frame element by element, without building the drawing
+        :param write_to: the svg file path, or a writable text file object
+        :param paper_size: the size of the paper to draw on
+        :param text_unit_mode: the unit mode to use for text
+        :param font_size: the font size
+        """
+        view = self._wall_view()
+        with StreamingSvgWriter(write_to=write_to, paper_size=paper_size, view=view) as writer:
+            self._draw_wall(writer, view, text_unit_mode, font_size)
@@ -0,0 +1,148 @@
+"""
+a frame layout that builds each boundary the first time it is read
+"""
+import dataclasses
+from functools import cached_property
+from typing import (
+    List,
+    Tuple
+)
+
+from painting.dataclasses.coordinate import Coordinate
+from painting.dataclasses.coordinate_list import CoordinateList
+from painting.dataclasses.frame_layout import FrameLayout
+from painting.dataclasses.frame_size import FrameSize
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.profiling import stage
+
+
+class LazyFrameLayout(object):
+    def __init__(self, painting: PaintingInformation, frame: FrameSize, at: Coordinate = Coordinate(x=0, y=0)):
+        """
+        the layout only keeps a copy of its inputs, so later edits to the painting or frame never change a
+        boundary. each boundary is built and shifted into quadrant 1 when it is first read and then cached.
+        the shift is found from the frame edges directly, so reading one boundary never builds the others.
+        the boundaries read the same as the fields of a FrameLayout, building one is timed as a
+        calculate_frame_layout stage
+
+        :param painting: the painting information
+        :param frame: the frame size
+        :param at: the location of the painting
+        """
+        self.painting = dataclasses.replace(painting)
+        self.frame = dataclasses.replace(frame)
+        self.at = dataclasses.replace(at)
+
+    def frame_layout(self) -> FrameLayout:
+        """ build every boundary
+        :return: the frame layout
+        """
+        return FrameLayout(
+            painting_max_boundary=self.painting_max_boundary,
+            painting_min_boundary=self.painting_min_boundary,
+            painting_overlap_boundary=self.painting_overlap_boundary,
+            frame_exterior_boundary=self.frame_exterior_boundary
+        )
+
+    @cached_property
+    def _interior_edge(self) -> Tuple[float, float, float, float]:
+        """ get the edges of the frame interior that covers the painting, before the shift
+        :return: the left x, bottom y, right x and top y
+        """
+        painting = self.painting
+        left_x = self.at.x + painting.left_offset_cm
+        bottom_y = self.at.y + painting.bottom_offset_cm
+        return (
+            left_x,
+            bottom_y,
+            left_x + (painting.width_max_cm - painting.right_offset_cm - painting.left_offset_cm),
+            bottom_y + (painting.height_max_cm - painting.top_offset_cm - painting.bottom_offset_cm)
+        )
+
+    @cached_property
+    def _min_offset(self) -> Tuple[float, float]:
+        """ get the shift that moves all vertexes into quadrant 1
+        :return: the x and y offset to add to every vertex
+        """
+
+        # the exterior edge is the interior edge grown by the frame width, its min x and y are made the same
+        # way its vertexes are
+        left_x, bottom_y, right_x, top_y = self._interior_edge
+        frame_width_cm = self.frame.width_cm
+        return (
+            self.at.x - min(left_x + -frame_width_cm, right_x + frame_width_cm),
+            self.at.y - min(bottom_y + -frame_width_cm, top_y + frame_width_cm)
+        )
+
+    def _shifted_rectangle(self, left_x: float, bottom_y: float, right_x: float, top_y: float) -> CoordinateList:
+        """ build a closed rectangle vertex list shifted into quadrant 1
+        :param left_x: the left x before the shift
+        :param bottom_y: the bottom y before the shift
+        :param right_x: the right x before the shift
+        :param top_y: the top y before the shift
+        :return: the vertex list, counter clockwise from the bottom left and back
+        """
+        x_offset, y_offset = self._min_offset
+        left_x += x_offset
+        right_x += x_offset
+        bottom_y += y_offset
+        top_y += y_offset
+        vertexes: List[Coordinate] = [
+            Coordinate(x=left_x, y=bottom_y),
+            Coordinate(x=right_x, y=bottom_y),
+            Coordinate(x=right_x, y=top_y),
+            Coordinate(x=left_x, y=top_y),
+            Coordinate(x=left_x, y=bottom_y)
+        ]
+        return CoordinateList(vertexes)
+
+    @cached_property
+    def painting_max_boundary(self) -> CoordinateList:
+        """ get the maximum boundary of the painting
+        :return: the vertex list of the maximum painting boundary
+        """
+        with stage("calculate_frame_layout"):
+            return self._shifted_rectangle(
+                self.at.x,
+                self.at.y,
+                self.at.x + self.painting.width_max_cm,
+                self.at.y + self.painting.height_max_cm
+            )
+
+    @cached_property
+    def painting_min_boundary(self) -> CoordinateList:
+        """ get the minimum boundary of the painting, centred in the maximum boundary
+        :return: the vertex list of the minimum painting boundary
+        """
+        with stage("calculate_frame_layout"):
+            left_x = self.at.x + (self.painting.width_max_cm - self.painting.width_min_cm) / 2
+            bottom_y = self.at.y + (self.painting.height_max_cm - self.painting.height_min_cm) / 2
+            return self._shifted_rectangle(
+                left_x,
+                bottom_y,
+                left_x + self.painting.width_min_cm,
+                bottom_y + self.painting.height_min_cm
+            )
+
+    @cached_property
+    def painting_overlap_boundary(self) -> CoordinateList:
+        """ get the interior edge of the frame overlapping the painting
+        :return: the vertex list of the overlap boundary
+        """
+        with stage("calculate_frame_layout"):
+            return self._shifted_rectangle(*self._interior_edge)
+
+    @cached_property
+    def frame_exterior_boundary(self) -> CoordinateList:
+        """ get the exterior edge of the frame, the interior edge grown by the frame width
+        :return: the vertex list of the exterior edge
+        """
+        with stage("calculate_frame_layout"):
+            left_x, bottom_y, right_x, top_y = self._interior_edge
+            frame_width_cm = self.frame.width_cm
+            return self._shifted_rectangle(
+                left_x + -frame_width_cm,
+                bottom_y + -frame_width_cm,
+                right_x + frame_width_cm,
+                top_y + frame_width_cm
+            )
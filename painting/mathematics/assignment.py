@@ -0,0 +1,157 @@
+"""
+assignment problem functions
+"""
+import time
+from typing import (
+    Dict,
+    List
+)
+
+
+def hungarian(cost: List[List[float]]) -> List[int]:
+    """ find the minimum cost assignment of rows to columns with the hungarian algorithm
+
+    runs in O(n^2 m) for n rows and m columns, so it suits problems up to a few hundred on each side
+
+    :param cost: the cost matrix, with no more rows than columns
+    :return: the assigned column per row
+    """
+
+    rows = len(cost)
+    columns = len(cost[0]) if rows else 0
+    if rows > columns:
+        raise ValueError(f"the cost matrix has more rows ({rows}) than columns ({columns})")
+
+    infinity = float("inf")
+    # potentials and matching are 1-indexed, column 0 is a virtual column used to start each search
+    row_potential = [0.0] * (rows + 1)
+    column_potential = [0.0] * (columns + 1)
+    column_row = [0] * (columns + 1)
+    way = [0] * (columns + 1)
+
+    for row in range(1, rows + 1):
+        column_row[0] = row
+        column = 0
+        min_slack = [infinity] * (columns + 1)
+        used = [False] * (columns + 1)
+
+        while True:
+            used[column] = True
+            current_row = column_row[column]
+            delta = infinity
+            next_column = 0
+            row_cost = cost[current_row - 1]
+
+            for candidate in range(1, columns + 1):
+                if used[candidate]:
+                    continue
+                slack = row_cost[candidate - 1] - row_potential[current_row] - column_potential[candidate]
+                if slack < min_slack[candidate]:
+                    min_slack[candidate] = slack
+                    way[candidate] = column
+                if min_slack[candidate] < delta:
+                    delta = min_slack[candidate]
+                    next_column = candidate
+
+            for candidate in range(columns + 1):
+                if used[candidate]:
+                    row_potential[column_row[candidate]] += delta
+                    column_potential[candidate] -= delta
+                else:
+                    min_slack[candidate] -= delta
+
+            column = next_column
+            if column_row[column] == 0:
+                break
+
+        # flip the augmenting path
+        while column:
+            previous = way[column]
+            column_row[column] = column_row[previous]
+            column = previous
+
+    assigned = [0] * rows
+    for column in range(1, columns + 1):
+        if column_row[column]:
+            assigned[column_row[column] - 1] = column - 1
+    return assigned
+
+
+def greedy_with_repair(
+        edges: Dict[int, Dict[int, float]],
+        time_limit_s: float
+) -> Dict[int, int]:
+    """ find a low cost partial assignment over sparse negative cost edges
+
+    edges are taken cheapest first while both ends are free, then single moves and two step swaps that
+    lower the total cost are applied until none is left or the time runs out. a row may stay unassigned
+    at zero cost, so only negative cost edges are worth taking
+
+    :param edges: the cost of each allowed column per row
+    :param time_limit_s: the time budget for the repair passes in seconds
+    :return: the assigned column per assigned row
+    """
+
+    deadline = time.perf_counter() + time_limit_s
+
+    ordered = sorted(
+        ((edge_cost, row, column) for row, row_edges in edges.items() for column, edge_cost in row_edges.items()),
+    )
+
+    row_column: Dict[int, int] = {}
+    column_row: Dict[int, int] = {}
+    for edge_cost, row, column in ordered:
+        if edge_cost >= 0:
+            break
+        if row not in row_column and column not in column_row:
+            row_column[row] = column
+            column_row[column] = row
+
+    def current(row: int) -> float:
+        return edges[row][row_column[row]] if row in row_column else 0.0
+
+    def move(row: int, column: int):
+        if row in row_column:
+            del column_row[row_column[row]]
+        row_column[row] = column
+        column_row[column] = row
+
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for row, row_edges in edges.items():
+            for column, edge_cost in row_edges.items():
+                gain = current(row) - edge_cost
+                if gain <= 0:
+                    continue
+
+                holder = column_row.get(column)
+                if holder is None:
+                    move(row, column)
+                    improved = True
+                    break
+                if holder == row:
+                    continue
+
+                # the holder can give the column up, either dropping out or moving to a free column,
+                # take the column if that lowers the total cost
+                best_delta = -gain - current(holder)
+                best_column = None
+                for other_column, other_cost in edges[holder].items():
+                    if other_column in column_row:
+                        continue
+                    delta = -gain - current(holder) + other_cost
+                    if delta < best_delta:
+                        best_delta = delta
+                        best_column = other_column
+
+                if best_delta < 0:
+                    del row_column[holder]
+                    del column_row[column]
+                    move(row, column)
+                    if best_column is not None:
+                        move(holder, best_column)
+                    improved = True
+                    break
+
+    return row_column
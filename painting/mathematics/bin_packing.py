@@ -0,0 +1,166 @@
+"""
+one dimensional bin packing functions
+"""
+import math
+import time
+from typing import List
+
+# the most sizes the exact repacking will branch over, beyond this the search depth is impractical
+EXACT_SIZE_LIMIT = 256
+
+
+def first_fit_decreasing(sizes: List[int], capacity: int) -> List[List[int]]:
+    """ pack sizes into bins with the first fit decreasing heuristic
+
+    the leftmost bin with enough room is found through a max tree over the remaining bin capacities,
+    so packing n sizes takes O(n log n) rather than scanning every open bin per size
+
+    :param sizes: the sizes to pack, each no larger than the capacity
+    :param capacity: the capacity of a bin
+    :return: a list of bins, each a list of indexes into sizes
+    """
+
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True)
+
+    # at most one bin per size, so the tree can be sized up front
+    leaves = 1
+    while leaves < max(len(sizes), 1):
+        leaves *= 2
+    tree = [capacity] * (2 * leaves)
+    bins: List[List[int]] = []
+
+    for index in order:
+        size = sizes[index]
+        if size > capacity:
+            raise ValueError(f"size {size} does not fit in a bin of capacity {capacity}")
+
+        # walk down to the leftmost leaf with enough room
+        node = 1
+        while node < leaves:
+            node = node * 2 if tree[node * 2] >= size else node * 2 + 1
+        bin_index = node - leaves
+
+        if bin_index == len(bins):
+            bins.append([])
+        bins[bin_index].append(index)
+
+        # update the remaining capacity back up the tree
+        tree[node] -= size
+        node //= 2
+        while node:
+            tree[node] = max(tree[node * 2], tree[node * 2 + 1])
+            node //= 2
+
+    return bins
+
+
+def bin_lower_bound(sizes: List[int], capacity: int) -> int:
+    """ calculate the continuous lower bound on the number of bins
+    :param sizes: the sizes to pack
+    :param capacity: the capacity of a bin
+    :return: the lower bound on the number of bins
+    """
+    return math.ceil(sum(sizes) / capacity) if sizes else 0
+
+
+def _pack_exact(
+        sizes: List[int],
+        capacity: int,
+        bin_count: int,
+        deadline: float
+) -> List[List[int]]:
+    """ try to pack sizes into a fixed number of bins with a depth first branch and bound
+
+    :param sizes: the sizes to pack
+    :param capacity: the capacity of a bin
+    :param bin_count: the number of bins to pack into
+    :param deadline: the time.perf_counter value to give up at
+    :return: a list of bins, each a list of indexes into sizes, or an empty list if no packing was found
+    """
+
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True)
+    remaining = [capacity] * bin_count
+    assignment = [-1] * len(order)
+
+    # suffix sums of the sizes still to place, used to prune on total free space
+    still_to_place = [0] * (len(order) + 1)
+    for position in range(len(order) - 1, -1, -1):
+        still_to_place[position] = still_to_place[position + 1] + sizes[order[position]]
+
+    nodes = 0
+
+    def place(position: int) -> bool:
+        nonlocal nodes
+        if position == len(order):
+            return True
+        nodes += 1
+        if nodes % 1024 == 0 and time.perf_counter() > deadline:
+            raise TimeoutError
+        if still_to_place[position] > sum(remaining):
+            return False
+
+        size = sizes[order[position]]
+        tried = set()
+        for bin_index in range(bin_count):
+            room = remaining[bin_index]
+            # bins with the same room are interchangeable, only branch on one of them
+            if room < size or room in tried:
+                continue
+            tried.add(room)
+            remaining[bin_index] -= size
+            assignment[position] = bin_index
+            if place(position + 1):
+                return True
+            remaining[bin_index] += size
+        return False
+
+    try:
+        if not place(0):
+            return []
+    except TimeoutError:
+        return []
+
+    bins: List[List[int]] = [[] for _ in range(bin_count)]
+    for position, bin_index in enumerate(assignment):
+        bins[bin_index].append(order[position])
+    return bins
+
+
+def refine_packing(
+        bins: List[List[int]],
+        sizes: List[int],
+        capacity: int,
+        time_limit_s: float
+) -> List[List[int]]:
+    """ refine a packing by repacking its emptiest bins into one bin fewer
+
+    the k emptiest bins are repacked exactly into k - 1 bins with a time bounded branch and bound,
+    growing k until the lower bound is met, the repacked sizes exceed EXACT_SIZE_LIMIT or the time runs out
+
+    :param bins: the packing to refine, each bin a list of indexes into sizes
+    :param sizes: the sizes being packed
+    :param capacity: the capacity of a bin
+    :param time_limit_s: the time budget in seconds
+    :return: the refined packing
+    """
+
+    deadline = time.perf_counter() + time_limit_s
+    lower_bound = bin_lower_bound(sizes, capacity)
+    bins = [list(b) for b in bins]
+    neighbourhood = 2
+
+    while len(bins) > lower_bound and neighbourhood <= len(bins) and time.perf_counter() < deadline:
+        bins.sort(key=lambda b: sum(sizes[i] for i in b), reverse=True)
+        kept, emptiest = bins[:-neighbourhood], bins[-neighbourhood:]
+        items = [i for b in emptiest for i in b]
+        if len(items) > EXACT_SIZE_LIMIT:
+            break
+
+        repacked = _pack_exact([sizes[i] for i in items], capacity, neighbourhood - 1, deadline)
+        if repacked:
+            bins = kept + [[items[i] for i in b] for b in repacked]
+            neighbourhood = 2
+        else:
+            neighbourhood += 1
+
+    return [b for b in bins if b]
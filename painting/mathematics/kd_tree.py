@@ -0,0 +1,86 @@
+"""
+a k-d tree for orthogonal range queries over points
+"""
+from typing import (
+    List,
+    Optional,
+    Sequence,
+    Tuple
+)
+
+
+class KdTree(object):
+    def __init__(self, points: Sequence[Tuple[float, ...]]):
+        """
+        :param points: the points to index, all with the same number of dimensions
+        """
+        self.points = [tuple(point) for point in points]
+        self.dimensions = len(self.points[0]) if self.points else 0
+
+        # the tree is stored flat, node i holds a point index, its split axis and its child node indexes
+        self._point_index: List[int] = []
+        self._axis: List[int] = []
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._root = self._build(list(range(len(self.points))), 0)
+
+    def _build(self, indexes: List[int], depth: int) -> int:
+        """ build the subtree over some points
+        :param indexes: the indexes of the points in the subtree
+        :param depth: the depth of the subtree root
+        :return: the node index of the subtree root, -1 for an empty subtree
+        """
+        if not indexes:
+            return -1
+
+        axis = depth % self.dimensions
+        indexes.sort(key=lambda i: self.points[i][axis])
+        median = len(indexes) // 2
+
+        node = len(self._point_index)
+        self._point_index.append(indexes[median])
+        self._axis.append(axis)
+        self._left.append(-1)
+        self._right.append(-1)
+
+        self._left[node] = self._build(indexes[:median], depth + 1)
+        self._right[node] = self._build(indexes[median + 1:], depth + 1)
+        return node
+
+    def range_query(
+            self,
+            lows: Sequence[Optional[float]],
+            highs: Sequence[Optional[float]]
+    ) -> List[int]:
+        """ find the points inside an axis aligned box, the bounds are inclusive
+        :param lows: the lower bound per dimension, None for unbounded
+        :param highs: the upper bound per dimension, None for unbounded
+        :return: the indexes of the points inside the box
+        """
+
+        found = []
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+
+            point = self.points[self._point_index[node]]
+            axis = self._axis[node]
+            low = lows[axis]
+            high = highs[axis]
+
+            if all(
+                    (lows[d] is None or point[d] >= lows[d]) and (highs[d] is None or point[d] <= highs[d])
+                    for d in range(self.dimensions)
+            ):
+                found.append(self._point_index[node])
+
+            # points left of the split are no larger on the split axis, right ones are no smaller
+            if low is None or point[axis] >= low:
+                stack.append(self._left[node])
+            if high is None or point[axis] <= high:
+                stack.append(self._right[node])
+
+        return found
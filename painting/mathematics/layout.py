@@ -0,0 +1,71 @@
+"""
+closed form expressions of the frame layout dimensions
+
+the expressions only use addition, subtraction, scaling and abs, and every input appears once per
+expression, so they can be evaluated with plain floats or with any type supporting that arithmetic
+"""
+from typing import (
+    List,
+    Tuple
+)
+
+
+def part_dimensions(
+        width_min,
+        width_max,
+        height_min,
+        height_max,
+        left_offset,
+        top_offset,
+        right_offset,
+        bottom_offset,
+        frame_width
+) -> List[Tuple]:
+    """ calculate the frame part dimensions of a painting layout
+
+    matches the values produced by FrameBuilder.calculate_build_dimensions, without building the layout
+
+    :param width_min: the minimum width of the painting in cm
+    :param width_max: the maximum width of the painting in cm
+    :param height_min: the minimum height of the painting in cm
+    :param height_max: the maximum height of the painting in cm
+    :param left_offset: the left offset of the painting in cm
+    :param top_offset: the top offset of the painting in cm
+    :param right_offset: the right offset of the painting in cm
+    :param bottom_offset: the bottom offset of the painting in cm
+    :param frame_width: the width of the frame wood in cm
+    :return: an (inner_length, outer_length, inlay_width, coverage_width) tuple per FrameIndex
+    """
+
+    # the horizontal parts span the overlap width, the vertical parts span the overlap height
+    horizontal_inner = abs(width_max - left_offset - right_offset)
+    horizontal_outer = abs(width_max - left_offset - right_offset + frame_width * 2)
+    vertical_inner = abs(height_max - top_offset - bottom_offset)
+    vertical_outer = abs(height_max - top_offset - bottom_offset + frame_width * 2)
+
+    return [
+        (
+            horizontal_inner,
+            horizontal_outer,
+            abs(bottom_offset),
+            abs(bottom_offset - (height_max - height_min) / 2)
+        ),
+        (
+            vertical_inner,
+            vertical_outer,
+            abs(right_offset),
+            abs(right_offset - (width_max - width_min) / 2)
+        ),
+        (
+            horizontal_inner,
+            horizontal_outer,
+            abs(top_offset),
+            abs(top_offset - (height_max - height_min) / 2)
+        ),
+        (
+            vertical_inner,
+            vertical_outer,
+            abs(left_offset),
+            abs(left_offset - (width_max - width_min) / 2)
+        ),
+    ]
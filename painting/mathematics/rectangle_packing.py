@@ -0,0 +1,122 @@
+"""
+rectangle packing functions
+"""
+from typing import (
+    List,
+    Tuple
+)
+
+# a skyline segment as (x, top, width), top is the filled depth measured down from the top of the sheet
+Segment = Tuple[float, float, float]
+
+# lengths closer than this are treated as equal, so rounding does not leave slivers in the skyline
+_EPSILON = 1e-9
+
+
+def _find_position(skyline: List[Segment], width: float, height: float, sheet_width: float, sheet_height: float):
+    """ find the lowest reaching position for a rectangle on a skyline, leftmost on ties
+    :param skyline: the skyline segments, left to right
+    :param width: the width of the rectangle
+    :param height: the height of the rectangle
+    :param sheet_width: the width of the sheet
+    :param sheet_height: the height of the sheet
+    :return: (x, top) of the position, or None if the rectangle does not fit
+    """
+
+    best = None
+    for start, (x, _, _) in enumerate(skyline):
+        if x + width > sheet_width + _EPSILON:
+            break
+
+        # the rectangle rests on the deepest segment it spans
+        top = 0.0
+        for segment_x, segment_top, _ in skyline[start:]:
+            if segment_x >= x + width - _EPSILON:
+                break
+            top = max(top, segment_top)
+
+        if top + height <= sheet_height + _EPSILON and (best is None or top < best[1] - _EPSILON):
+            best = (x, top)
+    return best
+
+
+def _add_to_skyline(skyline: List[Segment], x: float, top: float, width: float) -> List[Segment]:
+    """ raise the skyline under a placed rectangle
+    :param skyline: the skyline segments, left to right
+    :param x: the left of the rectangle
+    :param top: the bottom of the rectangle as a depth from the top of the sheet
+    :param width: the width of the rectangle
+    :return: the new skyline segments
+    """
+
+    right = x + width
+    updated: List[Segment] = []
+    placed = False
+    for segment_x, segment_top, segment_width in skyline:
+        segment_right = segment_x + segment_width
+        if segment_right <= x + _EPSILON or segment_x >= right - _EPSILON:
+            updated.append((segment_x, segment_top, segment_width))
+            continue
+        # keep the parts of the segment either side of the rectangle
+        if segment_x < x - _EPSILON:
+            updated.append((segment_x, segment_top, x - segment_x))
+        if not placed:
+            updated.append((x, top, width))
+            placed = True
+        if segment_right > right + _EPSILON:
+            updated.append((right, segment_top, segment_right - right))
+
+    # merge neighbours of the same depth
+    merged: List[Segment] = []
+    for segment in updated:
+        if merged and abs(merged[-1][1] - segment[1]) <= _EPSILON:
+            merged[-1] = (merged[-1][0], merged[-1][1], merged[-1][2] + segment[2])
+        else:
+            merged.append(segment)
+    return merged
+
+
+def skyline_pack(
+        sizes: List[Tuple[float, float]],
+        sheet_width: float,
+        sheet_height: float
+) -> List[List[Tuple[int, float, float]]]:
+    """ pack rectangles onto as few sheets as possible with the skyline bottom left heuristic
+
+    the rectangles are placed tallest first, each at the position on the first sheet that keeps its
+    bottom edge highest, a new sheet is started when none of the open sheets has room. rectangles are
+    not rotated
+
+    :param sizes: the (width, height) of each rectangle
+    :param sheet_width: the width of a sheet
+    :param sheet_height: the height of a sheet
+    :return: per sheet, the (rectangle index, x, y) of each rectangle placed on it, y measured down from the top
+    """
+
+    for index, (width, height) in enumerate(sizes):
+        if width > sheet_width + _EPSILON or height > sheet_height + _EPSILON:
+            raise ValueError(
+                f"rectangle {index} of {width} x {height} is larger than the {sheet_width} x {sheet_height} sheet"
+            )
+
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+
+    skylines: List[List[Segment]] = []
+    sheets: List[List[Tuple[int, float, float]]] = []
+    for index in order:
+        width, height = sizes[index]
+        for sheet, skyline in enumerate(skylines):
+            position = _find_position(skyline, width, height, sheet_width, sheet_height)
+            if position is not None:
+                break
+        else:
+            skylines.append([(0.0, 0.0, sheet_width)])
+            sheets.append([])
+            sheet = len(skylines) - 1
+            position = (0.0, 0.0)
+
+        x, top = position
+        skylines[sheet] = _add_to_skyline(skylines[sheet], x, top + height, width)
+        sheets[sheet].append((index, x, top))
+
+    return sheets
@@ -0,0 +1,75 @@
+"""
+a uniform grid spatial hash for rectangle overlap queries
+"""
+import math
+from typing import (
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Set,
+    Tuple
+)
+
+# a rectangle as (x_min, y_min, x_max, y_max)
+Rectangle = Tuple[float, float, float, float]
+
+
+class SpatialHash(object):
+    def __init__(self, cell_size: float):
+        """
+        :param cell_size: the width and height of a grid cell, about the size of a typical rectangle works well
+        """
+        self.cell_size = cell_size
+        self.rectangles: Dict[Hashable, Rectangle] = {}
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+
+    def _cells_of(self, rectangle: Rectangle) -> Iterator[Tuple[int, int]]:
+        """ get the grid cells a rectangle touches
+        :param rectangle: the rectangle
+        :return: the cell keys
+        """
+        x_min, y_min, x_max, y_max = rectangle
+        for column in range(math.floor(x_min / self.cell_size), math.floor(x_max / self.cell_size) + 1):
+            for row in range(math.floor(y_min / self.cell_size), math.floor(y_max / self.cell_size) + 1):
+                yield column, row
+
+    def insert(self, key: Hashable, rectangle: Rectangle):
+        """ add a rectangle to the hash, replacing any rectangle with the same key
+        :param key: the key of the rectangle
+        :param rectangle: the rectangle
+        """
+        if key in self.rectangles:
+            self.remove(key)
+        self.rectangles[key] = rectangle
+        for cell in self._cells_of(rectangle):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key: Hashable):
+        """ remove a rectangle from the hash
+        :param key: the key of the rectangle
+        """
+        rectangle = self.rectangles.pop(key)
+        for cell in self._cells_of(rectangle):
+            keys = self._cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
+
+    def overlapping(self, rectangle: Rectangle) -> List[Hashable]:
+        """ find the rectangles overlapping a rectangle, rectangles that only touch do not overlap
+        :param rectangle: the rectangle to check
+        :return: the keys of the overlapping rectangles
+        """
+        x_min, y_min, x_max, y_max = rectangle
+        found = []
+        seen = set()
+        for cell in self._cells_of(rectangle):
+            for key in self._cells.get(cell, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                other = self.rectangles[key]
+                if x_min < other[2] and other[0] < x_max and y_min < other[3] and other[1] < y_max:
+                    found.append(key)
+        return found
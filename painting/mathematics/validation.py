@@ -0,0 +1,104 @@
+"""
+vectorized checks of painting specs, over columns of many paintings at once
+
+every rule is evaluated for all rows in one numpy expression, so a batch can be screened before any layout
+or rendering is spent on it. a mask is True where the row passes the rule
+"""
+from typing import (
+    Dict,
+    Iterable,
+    Mapping,
+    Sequence,
+    Union
+)
+
+import numpy
+
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.dataclasses.painting_validation import PaintingValidation
+from painting.mathematics.units import in_to_cm
+
+# the painting fields a validation reads, the columns of a batch
+PAINTING_COLUMNS = (
+    "width_min_cm",
+    "width_max_cm",
+    "height_min_cm",
+    "height_max_cm",
+    "left_offset_cm",
+    "top_offset_cm",
+    "right_offset_cm",
+    "bottom_offset_cm",
+)
+
+# the reason a row fails each rule, in the order the rules are checked
+VALIDATION_RULES = {
+    "width_min_not_over_max": "the minimum width is greater than the maximum width",
+    "height_min_not_over_max": "the minimum height is greater than the maximum height",
+    "horizontal_offsets_under_width": "the left and right offsets cover the whole maximum width",
+    "vertical_offsets_under_height": "the top and bottom offsets cover the whole maximum height",
+    "bottom_coverage_positive": "the bottom offset does not reach past the minimum painting edge",
+    "right_coverage_positive": "the right offset does not reach past the minimum painting edge",
+    "top_coverage_positive": "the top offset does not reach past the minimum painting edge",
+    "left_coverage_positive": "the left offset does not reach past the minimum painting edge",
+    "bottom_inlay_within_frame": "the bottom inlay is wider than the frame",
+    "right_inlay_within_frame": "the right inlay is wider than the frame",
+    "top_inlay_within_frame": "the top inlay is wider than the frame",
+    "left_inlay_within_frame": "the left inlay is wider than the frame",
+}
+
+
+def painting_columns(paintings: Iterable[PaintingInformation]) -> Dict[str, numpy.ndarray]:
+    """ gather paintings into columns
+    :param paintings: the paintings
+    :return: a float array per painting field, one row per painting
+    """
+    rows = [[getattr(painting, column) for column in PAINTING_COLUMNS] for painting in paintings]
+    table = numpy.array(rows, dtype=float).reshape(len(rows), len(PAINTING_COLUMNS))
+    return {column: table[:, index] for index, column in enumerate(PAINTING_COLUMNS)}
+
+
+def painting_masks(
+        columns: Mapping[str, Sequence[float]],
+        frame_width_in: Union[float, Sequence[float]]
+) -> Dict[str, numpy.ndarray]:
+    """ check every validation rule for every row
+    :param columns: a column per painting field, any mapping of arrays such as a pandas DataFrame works
+    :param frame_width_in: the frame width in inches, one for all rows or a column
+    :return: a boolean mask per rule in VALIDATION_RULES, True where the row passes
+    """
+
+    width_min, width_max, height_min, height_max, left, top, right, bottom = (
+        numpy.asarray(columns[column], dtype=float) for column in PAINTING_COLUMNS
+    )
+    frame_width_cm = in_to_cm(numpy.asarray(frame_width_in, dtype=float))
+
+    # the offsets must reach past half the slack between the min and max size, as coverage_width measures
+    half_width_slack = (width_max - width_min) / 2
+    half_height_slack = (height_max - height_min) / 2
+
+    return {
+        "width_min_not_over_max": width_min <= width_max,
+        "height_min_not_over_max": height_min <= height_max,
+        "horizontal_offsets_under_width": left + right < width_max,
+        "vertical_offsets_under_height": top + bottom < height_max,
+        "bottom_coverage_positive": bottom - half_height_slack > 0,
+        "right_coverage_positive": right - half_width_slack > 0,
+        "top_coverage_positive": top - half_height_slack > 0,
+        "left_coverage_positive": left - half_width_slack > 0,
+        "bottom_inlay_within_frame": numpy.abs(bottom) <= frame_width_cm,
+        "right_inlay_within_frame": numpy.abs(right) <= frame_width_cm,
+        "top_inlay_within_frame": numpy.abs(top) <= frame_width_cm,
+        "left_inlay_within_frame": numpy.abs(left) <= frame_width_cm,
+    }
+
+
+def validate_paintings(
+        columns: Mapping[str, Sequence[float]],
+        frame_width_in: Union[float, Sequence[float]]
+) -> PaintingValidation:
+    """ validate a batch of painting specs before any layout or rendering
+    :param columns: a column per painting field, any mapping of arrays such as a pandas DataFrame works
+    :param frame_width_in: the frame width in inches, one for all rows or a column
+    :return: the validation, with a mask and a reason per rule
+    """
+    return PaintingValidation(masks=painting_masks(columns, frame_width_in), reasons=dict(VALIDATION_RULES))
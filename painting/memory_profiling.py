@@ -0,0 +1,174 @@
+"""
+a stage profiler that also reports the memory and the objects each stage takes
+"""
+import collections
+import dataclasses
+import functools
+import tracemalloc
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence
+)
+
+from painting.dataclasses.coordinate import Coordinate
+from painting.dataclasses.coordinate_list import CoordinateList
+from painting.dataclasses.stage_memory import StageMemory
+from painting.dataclasses.unit_cm_value import UnitCm
+from painting.profiling import StageProfiler
+
+# the classes counted by default, the ones a layout makes in bulk
+COUNTED_CLASSES = (Coordinate, CoordinateList, UnitCm)
+
+# the number of each counted class made while counting is on, by class name
+_created: collections.Counter = collections.Counter()
+
+# the original __init__ of each class being counted
+_counted_inits: Dict[type, Callable] = {}
+
+
+def _count_instances(cls: type):
+    """ count every instance of a class made from now on, until _stop_counting
+    :param cls: the class to count
+    """
+
+    original = cls.__init__
+
+    @functools.wraps(original)
+    def __init__(self, *args, **kwargs):
+        _created[cls.__name__] += 1
+        original(self, *args, **kwargs)
+
+    _counted_inits[cls] = original
+    cls.__init__ = __init__
+
+
+def _stop_counting(cls: type):
+    """ put back the original __init__ of a counted class
+    :param cls: the class to stop counting
+    """
+    cls.__init__ = _counted_inits.pop(cls)
+
+
+@dataclasses.dataclass
+class _OpenStage:
+    name: str
+    start_bytes: int
+    peak_bytes: int
+    created: collections.Counter
+
+
+class MemoryProfiler(StageProfiler):
+    def __init__(
+            self,
+            callback: Optional[Callable[[str, float, int], None]] = None,
+            counted: Sequence[type] = COUNTED_CLASSES
+    ):
+        """
+        use the profiler as a context manager, it traces allocations with tracemalloc and counts the
+        instances of the counted classes only while it is active, so the dataclasses cost nothing extra
+        otherwise. stages nest, so a stage's memory and objects include the stages it calls. stage timings
+        are collected as well, though tracing slows everything down
+
+        :param callback: called with the stage name, duration in seconds and element count as each stage ends
+        :param counted: the classes to count instances of
+        """
+        super().__init__(callback=callback)
+        self.counted = tuple(counted)
+        self.memory: Dict[str, StageMemory] = {}
+        self.peak_bytes = 0
+        self._open: List[_OpenStage] = []
+        self._patched: List[type] = []
+        self._started_tracing = False
+
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        for cls in self.counted:
+            if cls not in _counted_inits:
+                _count_instances(cls)
+                self._patched.append(cls)
+        return super().__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        for cls in self._patched:
+            _stop_counting(cls)
+        self._patched = []
+        self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._open = []
+
+    def start(self, name: str):
+        """ note the traced memory and counts as a stage starts
+        :param name: the name of the stage
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        # the peak is reset for every stage, keep what the enclosing stage reached so far
+        if self._open:
+            self._open[-1].peak_bytes = max(self._open[-1].peak_bytes, peak)
+        self.peak_bytes = max(self.peak_bytes, peak)
+        tracemalloc.reset_peak()
+        self._open.append(_OpenStage(name=name, start_bytes=current, peak_bytes=current, created=_created.copy()))
+
+    def record(self, name: str, seconds: float, elements: int = 0):
+        """ add a run of a stage, with the memory and objects it took if it was started
+        :param name: the name of the stage
+        :param seconds: the duration of the run in seconds
+        :param elements: the number of elements the run produced
+        """
+        super().record(name, seconds, elements)
+        if not self._open or self._open[-1].name != name:
+            return
+
+        opened = self._open.pop()
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(opened.peak_bytes, peak)
+        if self._open:
+            self._open[-1].peak_bytes = max(self._open[-1].peak_bytes, peak)
+
+        memory = self.memory.get(name)
+        if memory is None:
+            memory = self.memory[name] = StageMemory(name=name)
+        memory.calls += 1
+        memory.peak_bytes = max(memory.peak_bytes, peak - opened.start_bytes)
+        memory.retained_bytes += current - opened.start_bytes
+        for class_name, count in (_created - opened.created).items():
+            memory.objects[class_name] = memory.objects.get(class_name, 0) + count
+
+    def report(self) -> Dict:
+        """ get the memory of the stages in a json friendly form
+        :return: the overall peak and each stage's memory, with the objects made per call
+        """
+        return {
+            "peak_bytes": self.peak_bytes,
+            "stages": {
+                name: dict(dataclasses.asdict(memory), objects_per_call=memory.objects_per_call)
+                for name, memory in self.memory.items()
+            },
+        }
+
+    def memory_summary(self) -> str:
+        """ get a table of the stage memory, highest peak first
+        :return: the report text
+        """
+        names = [cls.__name__ for cls in self.counted]
+        lines = [
+            f"{'stage':<28} {'calls':>7} {'peak KiB':>10} {'kept KiB':>10} "
+            + " ".join(f"{name + '/call':>18}" for name in names)
+        ]
+        for memory in sorted(self.memory.values(), key=lambda stage_memory: stage_memory.peak_bytes, reverse=True):
+            per_call = memory.objects_per_call
+            lines.append(
+                f"{memory.name:<28} {memory.calls:>7} {memory.peak_bytes / 1024:>10.1f} "
+                f"{memory.retained_bytes / 1024:>10.1f} "
+                + " ".join(f"{per_call.get(name, 0):>18.1f}" for name in names)
+            )
+        lines.append(f"overall peak {self.peak_bytes / 1024:.1f} KiB")
+        return "\n".join(lines)
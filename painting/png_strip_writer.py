@@ -0,0 +1,96 @@
+"""
+a class to write a png image a strip of rows at a time
+"""
+import struct
+import zlib
+from typing import (
+    BinaryIO,
+    Union
+)
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 8 bit truecolor without alpha
+_BIT_DEPTH = 8
+_COLOR_TYPE_RGB = 2
+
+
+class PngStripWriter(object):
+    def __init__(self, write_to: Union[str, BinaryIO], width: int, height: int, compress_level: int = 6):
+        """
+        rows are filtered, compressed and written out as each strip arrives, so only one strip and the
+        compressor state are ever held
+
+        :param write_to: the png file path or a writable binary file object
+        :param width: the image width in pixels
+        :param height: the image height in pixels
+        :param compress_level: the zlib compression level
+        """
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+
+        if isinstance(write_to, str):
+            self._file = open(write_to, 'wb')
+            self._owns_file = True
+        else:
+            self._file = write_to
+            self._owns_file = False
+
+        self._compressor = zlib.compressobj(compress_level)
+        self.closed = False
+
+        self._file.write(_PNG_SIGNATURE)
+        self._write_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, _BIT_DEPTH, _COLOR_TYPE_RGB, 0, 0, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._owns_file:
+            self._file.close()
+
+    def _write_chunk(self, chunk_type: bytes, data: bytes):
+        """ write a png chunk
+        :param chunk_type: the four byte chunk type
+        :param data: the chunk data
+        """
+        self._file.write(struct.pack('>I', len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(chunk_type))))
+
+    def write_rows(self, rgb: bytes):
+        """ write the next rows of the image
+        :param rgb: the rows as packed 8 bit rgb triplets, top row first
+        """
+        row_bytes = self.width * 3
+        if len(rgb) % row_bytes:
+            raise ValueError(f"{len(rgb)} bytes is not a whole number of {row_bytes} byte rows")
+        rows = len(rgb) // row_bytes
+        if self.rows_written + rows > self.height:
+            raise ValueError(f"writing {rows} rows would pass the image height of {self.height}")
+
+        # every row is led by its filter type, 0 for none
+        filtered = b''.join(
+            b'\x00' + rgb[start:start + row_bytes] for start in range(0, len(rgb), row_bytes)
+        )
+        compressed = self._compressor.compress(filtered)
+        if compressed:
+            self._write_chunk(b'IDAT', compressed)
+        self.rows_written += rows
+
+    def close(self):
+        """ finish the image, and close the file if the writer opened it
+        """
+        if self.closed:
+            return
+        if self.rows_written != self.height:
+            raise ValueError(f"{self.rows_written} rows were written of the image height of {self.height}")
+        self._write_chunk(b'IDAT', self._compressor.flush())
+        self._write_chunk(b'IEND', b'')
+        if self._owns_file:
+            self._file.close()
+        self.closed = True
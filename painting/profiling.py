@@ -0,0 +1,135 @@
+"""
+stage timers for profiling where the time of a render goes
+"""
+import functools
+import time
+from typing import (
+    Callable,
+    Dict,
+    Optional
+)
+
+from painting.dataclasses.stage_timing import StageTiming
+
+# the profiler collecting stage timings, process wide. None when profiling is off
+_active: Optional["StageProfiler"] = None
+
+
+class StageProfiler(object):
+    def __init__(self, callback: Optional[Callable[[str, float, int], None]] = None):
+        """
+        use the profiler as a context manager, every profiled stage run inside it is collected. stages nest,
+        so a stage's time includes the stages it calls
+
+        :param callback: called with the stage name, duration in seconds and element count as each stage ends
+        """
+        self.callback = callback
+        self.stages: Dict[str, StageTiming] = {}
+        self._previous: Optional[StageProfiler] = None
+
+    def __enter__(self):
+        global _active
+        self._previous = _active
+        _active = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _active
+        _active = self._previous
+        self._previous = None
+
+    def start(self, name: str):
+        """ note a stage is starting, the timings only need its end
+        :param name: the name of the stage
+        """
+
+    def record(self, name: str, seconds: float, elements: int = 0):
+        """ add a run of a stage
+        :param name: the name of the stage
+        :param seconds: the duration of the run in seconds
+        :param elements: the number of elements the run produced
+        """
+        timing = self.stages.get(name)
+        if timing is None:
+            timing = self.stages[name] = StageTiming(name=name)
+        timing.calls += 1
+        timing.total_s += seconds
+        timing.max_s = max(timing.max_s, seconds)
+        timing.elements += elements
+        if self.callback is not None:
+            self.callback(name, seconds, elements)
+
+    def summary(self) -> str:
+        """ get a table of the stages, slowest total first
+        :return: the report text
+        """
+        lines = [f"{'stage':<28} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9} {'elements':>9}"]
+        for timing in sorted(self.stages.values(), key=lambda stage_timing: stage_timing.total_s, reverse=True):
+            lines.append(
+                f"{timing.name:<28} {timing.calls:>7} {timing.total_s * 1000:>10.2f} {timing.mean_ms:>9.3f} "
+                f"{timing.max_s * 1000:>9.3f} {timing.elements:>9}"
+            )
+        return "\n".join(lines)
+
+
+class _Stage(object):
+    def __init__(self, profiler: StageProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.elements = 0
+        self._start = 0.0
+
+    def __enter__(self):
+        self.profiler.start(self.name)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, time.perf_counter() - self._start, self.elements)
+
+    def add_elements(self, count: int):
+        """ count elements produced by the stage
+        :param count: the number of elements
+        """
+        self.elements += count
+
+
+class _NullStage(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def add_elements(self, count: int):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str):
+    """ time a block as a named stage when a profiler is active
+    :param name: the name of the stage
+    :return: a context manager, with add_elements to count what the stage produced
+    """
+    return _NULL_STAGE if _active is None else _Stage(_active, name)
+
+
+def profiled(name: str):
+    """ time every call of a function as a named stage when a profiler is active
+    :param name: the name of the stage
+    :return: the decorator
+    """
+
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return function(*args, **kwargs)
+            with _Stage(_active, name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,66 @@
+"""
+a class to write the schematics of a catalog of paintings into one multi page pdf
+"""
+from typing import (
+    BinaryIO,
+    Iterable,
+    Union
+)
+
+import cairocffi
+
+from painting.cairo_canvas import CairoCanvas
+from painting.dataclasses.paper_dimensions import PaperDimensions
+from painting.enums.text_unit_mode import TextUnitMode
+from painting.frame_builder import FrameBuilder
+
+# pdf device units are points
+_POINTS_PER_INCH = 72
+
+
+class SchematicCatalog(object):
+    def __init__(
+            self,
+            paper_size: PaperDimensions = PaperDimensions(8, 10),
+            text_unit_mode: TextUnitMode = TextUnitMode.CM
+    ):
+        """
+        :param paper_size: the size of a page in inches
+        :param text_unit_mode: the unit mode to use for text
+        """
+        self.paper_size = paper_size
+        self.text_unit_mode = text_unit_mode
+
+    def write_pdf(self, builders: Iterable[FrameBuilder], write_to: Union[str, BinaryIO]) -> int:
+        """ write a vector pdf with one schematic page per painting
+
+        pages are drawn and written one at a time, each page's drawing is released once the page is
+        out, so memory stays flat however many paintings there are. pass a generator of builders to
+        also avoid holding the catalog itself
+
+        :param builders: the frame builders of the paintings, in page order
+        :param write_to: the pdf file path or a writable binary file object
+        :return: the number of pages written
+        """
+
+        width = self.paper_size.width * _POINTS_PER_INCH
+        height = self.paper_size.height * _POINTS_PER_INCH
+        document = cairocffi.PDFSurface(write_to, width, height)
+
+        page_count = 0
+        try:
+            for builder in builders:
+                # a fresh context per page, so the clip and transforms of one page never reach the next
+                plan = builder.plan()
+                builder.draw_schematic_content(
+                    dwg=CairoCanvas(context=cairocffi.Context(document), width=width, height=height, view=plan.view),
+                    plan=plan,
+                    text_unit_mode=self.text_unit_mode,
+                    font_size="2%"
+                )
+                document.show_page()
+                page_count += 1
+        finally:
+            document.finish()
+
+        return page_count
@@ -0,0 +1,195 @@
+"""
+a class to pack many frame schematics onto large sheets of paper
+"""
+import io
+from typing import (
+    List,
+    Tuple
+)
+
+import cairosvg
+import svgwrite
+
+from painting.dataclasses.paper_dimensions import PaperDimensions
+from painting.dataclasses.schematic_view import SchematicView
+from painting.enums.text_unit_mode import TextUnitMode
+from painting.frame_builder import FrameBuilder
+from painting.frame_plan import FramePlan
+from painting.mathematics.rectangle_packing import skyline_pack
+from painting.streaming_svg_writer import StreamingSvgWriter
+from painting.svg_group_canvas import SvgGroupCanvas
+
+
+class SchematicSheetBuilder(object):
+    def __init__(
+            self,
+            paper_size: PaperDimensions = PaperDimensions(24, 36),
+            scale: float = 0.5,
+            margin_in: float = 0.5,
+            gap_in: float = 0.25,
+            padding_in: float = 2.5
+    ):
+        """
+        :param paper_size: the size of a sheet in inches
+        :param scale: the drawing scale of the schematics on the sheet
+        :param margin_in: the blank border around a sheet in inches
+        :param gap_in: the least gap between schematics on a sheet in inches
+        :param padding_in: the room kept around a frame for its dimensions and name, in drawing inches
+        """
+        self.paper_size = paper_size
+        self.scale = scale
+        self.margin_in = margin_in
+        self.gap_in = gap_in
+        self.padding_in = padding_in
+
+    def cell_size(self, builder: FrameBuilder) -> Tuple[float, float]:
+        """ get the room a schematic takes on a sheet
+        :param builder: the frame builder of the painting
+        :return: the (width, height) in sheet inches
+        """
+        return self._cell_size(builder.plan().view)
+
+    def _cell_size(self, view: SchematicView) -> Tuple[float, float]:
+        """ get the room a schematic view takes on a sheet
+        :param view: the view of the schematic
+        :return: the (width, height) in sheet inches
+        """
+        return (
+            (view.x_max_in - view.x_min_in + self.padding_in * 2) * self.scale,
+            (view.y_max_in - view.y_min_in + self.padding_in * 2) * self.scale
+        )
+
+    def pack(self, builders: List[FrameBuilder]) -> List[List[Tuple[int, float, float]]]:
+        """ pack the schematics onto as few sheets as possible
+        :param builders: the frame builders of the paintings
+        :return: per sheet, the (builder index, x, y) of each schematic, the top left in sheet inches
+        """
+        return self._pack([builder.plan() for builder in builders])
+
+    def _pack(self, plans: List[FramePlan]) -> List[List[Tuple[int, float, float]]]:
+        """ pack the schematics of frame plans onto as few sheets as possible
+        :param plans: the frame plans of the paintings, at the origin
+        :return: per sheet, the (plan index, x, y) of each schematic, the top left in sheet inches
+        """
+
+        # each cell carries one gap on its right and bottom, so the usable area grows by one gap
+        sheets = skyline_pack(
+            [(width + self.gap_in, height + self.gap_in) for width, height in (self._cell_size(plan.view) for plan in plans)],
+            self.paper_size.width - self.margin_in * 2 + self.gap_in,
+            self.paper_size.height - self.margin_in * 2 + self.gap_in
+        )
+        return [
+            [(index, x + self.margin_in, y + self.margin_in) for index, x, y in sheet]
+            for sheet in sheets
+        ]
+
+    def _cell_transform(self, plan: FramePlan, x: float, y: float) -> str:
+        """ get the transform that moves a padded schematic into its cell
+        :param plan: the frame plan of the painting, at the origin
+        :param x: the left of the cell in sheet inches
+        :param y: the top of the cell in sheet inches
+        :return: the transform attribute value
+        """
+        view = plan.view
+        # flip our y up coordinate space into svg y down, then scale and move into the cell
+        return f"translate({x}, {y}) scale({self.scale}) " \
+               f"translate({self.padding_in - view.x_min_in}, {view.y_max_in + self.padding_in}) " \
+               f"scale(1, -1)"
+
+    @staticmethod
+    def _draw_cell(canvas, builder: FrameBuilder, plan: FramePlan, text_unit_mode: TextUnitMode):
+        """ draw a schematic into its cell
+        :param canvas: the drawing factories and add of the cell group
+        :param builder: the frame builder of the painting
+        :param plan: the frame plan of the painting, at the origin
+        :param text_unit_mode: the unit mode to use for text
+        """
+        # percent font sizes would resolve against the sheet, so fix the size a single page would use
+        builder.draw_schematic_content(
+            dwg=canvas,
+            plan=plan,
+            text_unit_mode=text_unit_mode,
+            font_size=f"{plan.view.percent_length_in(2):.4f}"
+        )
+
+    def build_sheets(
+            self,
+            builders: List[FrameBuilder],
+            text_unit_mode: TextUnitMode = TextUnitMode.CM
+    ) -> List[svgwrite.Drawing]:
+        """ draw the schematics packed onto sheets
+        :param builders: the frame builders of the paintings
+        :param text_unit_mode: the unit mode to use for text
+        :return: one drawing per sheet
+        """
+
+        plans = [builder.plan() for builder in builders]
+        drawings = []
+        for sheet in self._pack(plans):
+            dwg = svgwrite.Drawing(
+                profile='tiny',
+                size=(f"{self.paper_size.width}in", f"{self.paper_size.height}in")
+            )
+            # one user unit is one inch of paper
+            dwg.attribs['viewBox'] = f"0 0 {self.paper_size.width} {self.paper_size.height}"
+
+            for index, x, y in sheet:
+                group = dwg.g(transform=self._cell_transform(plans[index], x, y))
+                dwg.add(group)
+                self._draw_cell(SvgGroupCanvas(dwg, group), builders[index], plans[index], text_unit_mode)
+
+            drawings.append(dwg)
+        return drawings
+
+    def draw_sheets(
+            self,
+            builders: List[FrameBuilder],
+            write_to: str = "sheet_{index}",
+            text_unit_mode: TextUnitMode = TextUnitMode.CM,
+            dpi: int = 300
+    ) -> List[svgwrite.Drawing]:
+        """ draw the schematics packed onto sheets, writing one svg and one png per sheet
+        :param builders: the frame builders of the paintings
+        :param write_to: the output path without extension, formatted with the sheet index
+        :param text_unit_mode: the unit mode to use for text
+        :param dpi: the resolution of the png files
+        :return: one drawing per sheet
+        """
+
+        drawings = self.build_sheets(builders, text_unit_mode=text_unit_mode)
+        for index, dwg in enumerate(drawings):
+            path = write_to.format(index=index)
+
+            # serialize once, the same text goes to the svg file and to the png renderer
+            svg_file = io.StringIO()
+            dwg.write(svg_file)
+            svg = svg_file.getvalue()
+
+            with open(f"{path}.svg", 'w', encoding='utf-8') as sheet_file:
+                sheet_file.write(svg)
+            cairosvg.svg2png(bytestring=svg.encode('utf-8'), write_to=f"{path}.png", dpi=dpi)
+
+        return drawings
+
+    def stream_sheets(
+            self,
+            builders: List[FrameBuilder],
+            write_to: str = "sheet_{index}.svg",
+            text_unit_mode: TextUnitMode = TextUnitMode.CM
+    ) -> int:
+        """ write the schematics packed onto sheets as svg files, element by element without building drawings
+        :param builders: the frame builders of the paintings
+        :param write_to: the svg file path, formatted with the sheet index
+        :param text_unit_mode: the unit mode to use for text
+        :return: the number of sheets written
+        """
+
+        plans = [builder.plan() for builder in builders]
+        sheets = self._pack(plans)
+        for sheet_index, sheet in enumerate(sheets):
+            with StreamingSvgWriter(write_to=write_to.format(index=sheet_index), paper_size=self.paper_size) as writer:
+                for index, x, y in sheet:
+                    writer.begin_group(transform=self._cell_transform(plans[index], x, y))
+                    self._draw_cell(writer, builders[index], plans[index], text_unit_mode)
+                    writer.end_group()
+        return len(sheets)
@@ -0,0 +1,93 @@
+"""
+a class to find the smallest ready-made standard frame for a painting
+"""
+import bisect
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
+
+import numpy
+
+from painting.dataclasses.painting_information import PaintingInformation
+from painting.dataclasses.standard_frame import StandardFrame
+from painting.dataclasses.stocked_frame import StockedFrame
+from painting.mathematics.validation import painting_columns
+
+# the common ready-made frame sizes in inches
+STANDARD_FRAME_SIZES = [
+    (4, 6),
+    (5, 7),
+    (8, 10),
+    (8.5, 11),
+    (9, 12),
+    (11, 14),
+    (11, 17),
+    (12, 16),
+    (12, 18),
+    (14, 18),
+    (16, 20),
+    (18, 24),
+    (20, 24),
+    (20, 30),
+    (24, 30),
+    (24, 36),
+    (30, 40),
+]
+
+
+class StandardFrameCatalog(object):
+    def __init__(
+            self,
+            sizes: List[Tuple[float, float]] = STANDARD_FRAME_SIZES,
+            lip_in: float = 0.25,
+            face_width_in: float = 1.0
+    ):
+        """
+        :param sizes: the nominal (width, height) sizes of the catalog in inches
+        :param lip_in: the width of the lip of the ready-made frames in inches
+        :param face_width_in: the width of the visible molding face in inches
+        """
+
+        # every size can hang either way up, index both orientations sorted by recess area
+        entries = []
+        for width_in, height_in in sizes:
+            frame = StandardFrame(width_in=width_in, height_in=height_in, lip_in=lip_in, face_width_in=face_width_in)
+            orientations = [False] if width_in == height_in else [False, True]
+            for rotated in orientations:
+                stocked = frame.stocked_frame(rotated=rotated)
+                entries.append((stocked.rabbet_width_cm * stocked.rabbet_height_cm, frame, stocked))
+
+        entries.sort(key=lambda entry: entry[0])
+        self._areas = [entry[0] for entry in entries]
+        self._frames = [entry[1] for entry in entries]
+        self._stocked = [entry[2] for entry in entries]
+        self._columns = StockedFrame.frame_columns(self._stocked)
+
+    def smallest_fitting(self, painting: PaintingInformation) -> Optional[Tuple[StandardFrame, StockedFrame]]:
+        """ find the smallest standard frame a painting can be mounted in
+        :param painting: the painting to frame
+        :return: the standard frame and its dimensions in the orientation used, or None if none fits
+        """
+
+        # a recess smaller in area than the largest painting can never hold it, skip straight past them
+        start = bisect.bisect_left(self._areas, painting.width_max_cm * painting.height_max_cm)
+        fits = StockedFrame.fit_matrix(
+            {column: values[start:] for column, values in self._columns.items()},
+            painting_columns([painting])
+        )[0]
+        if not fits.any():
+            return None
+        index = start + int(numpy.argmax(fits))
+        return self._frames[index], self._stocked[index]
+
+    def smallest_fitting_many(
+            self,
+            paintings: List[PaintingInformation]
+    ) -> List[Optional[Tuple[StandardFrame, StockedFrame]]]:
+        """ find the smallest standard frame for each painting of a batch
+        :param paintings: the paintings to frame
+        :return: the standard frame and its dimensions in the orientation used per painting, or None
+        """
+        return [self.smallest_fitting(painting) for painting in paintings]
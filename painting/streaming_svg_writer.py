@@ -0,0 +1,125 @@
+"""
+a class to write an svg drawing element by element as it is drawn
+"""
+from typing import (
+    TextIO,
+    Union
+)
+from xml.sax.saxutils import quoteattr
+
+import svgwrite
+
+from painting.dataclasses.paper_dimensions import PaperDimensions
+from painting.dataclasses.schematic_view import SchematicView
+
+
+class StreamingSvgWriter(object):
+    def __init__(
+            self,
+            write_to: Union[str, TextIO],
+            paper_size: PaperDimensions,
+            view: SchematicView = None,
+            profile: str = 'tiny'
+    ):
+        """
+        elements are made with the svgwrite factories and written out as soon as they are added, so
+        memory stays bounded however many elements are drawn. the writer has the drawing factories and
+        add, so it can be drawn on wherever a svgwrite drawing is
+
+        :param write_to: the svg file path, or a writable text file object such as a socket makefile
+        :param paper_size: the size of the paper in inches
+        :param view: the view of the drawing, our y up coordinate space is flipped the same as a schematic,
+            None for a plain inch view box over the paper
+        :param profile: the svg profile
+        """
+
+        # the factory drawing only makes and validates elements, nothing is ever added to it
+        self._factory = svgwrite.Drawing(
+            profile=profile,
+            size=(f"{paper_size.width}in", f"{paper_size.height}in")
+        )
+        if view is None:
+            self._factory.attribs['viewBox'] = f"0 0 {paper_size.width} {paper_size.height}"
+        else:
+            self._factory.attribs['viewBox'] = view.view_box
+            # our coordinate space is upside down vs svg standard, so do a y-axis flip and transform
+            self._factory.attribs['transform'] = view.flip_transform
+
+        if isinstance(write_to, str):
+            self._file = open(write_to, 'w', encoding='utf-8')
+            self._owns_file = True
+        else:
+            self._file = write_to
+            self._owns_file = False
+
+        self._open_groups = 0
+        self.closed = False
+
+        # write the document head exactly as svgwrite would, the empty drawing ends with its closing tag
+        head = self._factory.tostring()
+        self._file.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+        self._file.write(head[:head.rindex('</svg>')])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def line(self, *args, **kwargs):
+        """ make a line element
+        :return: the line element
+        """
+        return self._factory.line(*args, **kwargs)
+
+    def polygon(self, *args, **kwargs):
+        """ make a polygon element
+        :return: the polygon element
+        """
+        return self._factory.polygon(*args, **kwargs)
+
+    def text(self, *args, **kwargs):
+        """ make a text element
+        :return: the text element
+        """
+        return self._factory.text(*args, **kwargs)
+
+    def add(self, element):
+        """ write an element out
+        :param element: the element to write
+        :return: the element
+        """
+        self._file.write(element.tostring())
+        return element
+
+    def begin_group(self, **attributes):
+        """ open a group, the elements added until the matching end_group are written into it
+        :param attributes: the group attributes, such as transform
+        """
+        # validate the attributes the way svgwrite would
+        group = self._factory.g(**attributes)
+        opening = ''.join(f' {name}={quoteattr(str(value))}' for name, value in group.attribs.items())
+        self._file.write(f'<g{opening}>')
+        self._open_groups += 1
+
+    def end_group(self):
+        """ close the innermost open group
+        """
+        if not self._open_groups:
+            raise ValueError("there is no open group to end")
+        self._file.write('</g>')
+        self._open_groups -= 1
+
+    def close(self):
+        """ close any open groups and the document, and the file if the writer opened it
+        """
+        if self.closed:
+            return
+        while self._open_groups:
+            self.end_group()
+        self._file.write('</svg>')
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+        self.closed = True
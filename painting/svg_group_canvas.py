@@ -0,0 +1,40 @@
+"""
+a class to draw into an svg group with the drawing element factories
+"""
+import svgwrite
+from svgwrite.container import Group
+
+
+class SvgGroupCanvas(object):
+    def __init__(self, dwg: svgwrite.Drawing, group: Group):
+        """
+        :param dwg: the drawing that makes the elements
+        :param group: the group the elements are added to
+        """
+        self.dwg = dwg
+        self.group = group
+
+    def line(self, *args, **kwargs):
+        """ make a line element
+        :return: the line element
+        """
+        return self.dwg.line(*args, **kwargs)
+
+    def polygon(self, *args, **kwargs):
+        """ make a polygon element
+        :return: the polygon element
+        """
+        return self.dwg.polygon(*args, **kwargs)
+
+    def text(self, *args, **kwargs):
+        """ make a text element
+        :return: the text element
+        """
+        return self.dwg.text(*args, **kwargs)
+
+    def add(self, element):
+        """ add an element to the group
+        :param element: the element to add
+        :return: the element
+        """
+        return self.group.add(element)
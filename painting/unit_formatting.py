@@ -0,0 +1,58 @@
+"""
+a registry of the formatters that turn lengths into annotation text for each text unit mode
+"""
+import functools
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List
+)
+
+from painting.dataclasses.unit_cm_value import UnitCm
+from painting.enums.text_unit_mode import TextUnitMode
+from painting.mathematics.units import (
+    cm_to_in,
+    in_to_tape_measure
+)
+
+# a formatter takes a length in cm and returns its text
+UnitFormatter = Callable[[float], str]
+
+# the distinct lengths each formatter remembers, a catalog repeats the same few lengths over and over
+FORMAT_CACHE_SIZE = 4096
+
+_formatters: Dict[TextUnitMode, UnitFormatter] = {}
+
+
+def register_unit_formatter(text_unit_mode: TextUnitMode, formatter: UnitFormatter):
+    """ add or replace the formatter of a text unit mode, its results are cached by length
+    :param text_unit_mode: the text unit mode
+    :param formatter: takes a length in cm and returns its text
+    """
+    _formatters[text_unit_mode] = functools.lru_cache(maxsize=FORMAT_CACHE_SIZE)(formatter)
+
+
+def unit_formatter(text_unit_mode: TextUnitMode) -> UnitFormatter:
+    """ resolve the formatter of a text unit mode, once per drawing rather than once per value
+    :param text_unit_mode: the text unit mode
+    :return: the formatter, the cm formatter for a mode without one
+    """
+    return _formatters.get(text_unit_mode, _formatters[TextUnitMode.CM])
+
+
+def format_lengths(text_unit_mode: TextUnitMode, lengths: Iterable[UnitCm]) -> List[str]:
+    """ format many lengths in one call
+    :param text_unit_mode: the text unit mode
+    :param lengths: the lengths to format
+    :return: the text of each length, in order
+    """
+    formatter = unit_formatter(text_unit_mode)
+    return [formatter(length.value_cm) for length in lengths]
+
+
+register_unit_formatter(TextUnitMode.CM, lambda value_cm: str(round(value_cm, 2)))
+register_unit_formatter(TextUnitMode.INCH, lambda value_cm: str(round(cm_to_in(value_cm), 4)))
+register_unit_formatter(TextUnitMode.TAPE, lambda value_cm: in_to_tape_measure(cm_to_in(value_cm)))
+register_unit_formatter(TextUnitMode.MM, lambda value_cm: str(round(value_cm * 10, 1)))
+register_unit_formatter(TextUnitMode.FEET, lambda value_cm: str(round(cm_to_in(value_cm) / 12, 3)))